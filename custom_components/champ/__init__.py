@@ -6,18 +6,23 @@ import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
     CONF_LEVEL_CONFIG,
     CONF_MEMBERS,
+    CONF_RECONCILE_INTERVAL,
     CONF_TASKS,
     DEFAULT_POINTS_PER_LEVEL,
+    DEFAULT_RECONCILE_INTERVAL,
     DOMAIN,
 )
 from .coordinator import ChampDataCoordinator
+from .ledger import ChampLedger
+from .services import async_setup_services
+from .storage import ChampStorage
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +36,10 @@ CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     """Set up the CHAMP component."""
     hass.data.setdefault(DOMAIN, {})
+
+    # Register services
+    await async_setup_services(hass)
+
     return True
 
 
@@ -45,16 +54,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create coordinator
     coordinator = ChampDataCoordinator(hass, entry)
+    await coordinator.async_load()
     await coordinator.async_config_entry_first_refresh()
 
     # Store coordinator
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    # Write buffered ledger events before Home Assistant stops
+    entry.async_on_unload(
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, coordinator.async_handle_final_write
+        )
+    )
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services
-    await async_setup_services(hass)
+    # Apply member, task and option changes in place
+    entry.async_on_unload(entry.add_update_listener(async_update_entry))
 
     _LOGGER.info(
         "CHAMP setup complete with %d members and %d tasks",
@@ -72,21 +89,30 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    # Remove coordinator
+    # Remove coordinator and write pending changes
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: ChampDataCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return unload_ok
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data when a config entry is deleted."""
+    await ChampStorage(hass, entry.entry_id).async_remove()
+    await ChampLedger(hass, entry.entry_id).async_remove()
+
 
+async def async_update_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply a changed config entry without reloading it."""
+    coordinator: ChampDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # The polling interval is only set up when the coordinator is created
+    reconcile_interval = entry.options.get(
+        CONF_RECONCILE_INTERVAL, DEFAULT_RECONCILE_INTERVAL
+    )
+    if reconcile_interval != coordinator.reconcile_interval:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
 
-async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up CHAMP services."""
-    # Services will be implemented in Phase 3
-    # Placeholder for now
-    pass
+    coordinator.async_reconcile()
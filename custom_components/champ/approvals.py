@@ -0,0 +1,113 @@
+"""Approval queue for CHAMP integration."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any
+
+# Kinds of pending items
+APPROVAL_TASK = "task"
+APPROVAL_REWARD = "reward"
+
+
+class ApprovalQueue:
+    """Bounded queue of completions and redemptions awaiting approval.
+
+    Items are kept in arrival order, so the oldest items come first, and are
+    additionally indexed by member. Adding, looking up and removing an item
+    are O(1); selecting the items of a member only touches that member's
+    items.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the queue."""
+        self.maxsize = maxsize
+        self._items: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._by_member: dict[str, dict[str, None]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of pending items."""
+        return len(self._items)
+
+    def __contains__(self, item_id: object) -> bool:
+        """Return whether an item is pending."""
+        return item_id in self._items
+
+    @property
+    def full(self) -> bool:
+        """Return whether the queue cannot take more items."""
+        return len(self._items) >= self.maxsize
+
+    def add(self, item: dict[str, Any]) -> bool:
+        """Add an item, returning False if the queue is full."""
+        if self.full:
+            return False
+        self._items[item["id"]] = item
+        self._by_member.setdefault(item["member"], {})[item["id"]] = None
+        return True
+
+    def get(self, item_id: str) -> dict[str, Any] | None:
+        """Return a pending item."""
+        return self._items.get(item_id)
+
+    def pop(self, item_id: str) -> dict[str, Any] | None:
+        """Remove and return a pending item."""
+        item = self._items.pop(item_id, None)
+        if item is None:
+            return None
+        member_items = self._by_member[item["member"]]
+        del member_items[item_id]
+        if not member_items:
+            del self._by_member[item["member"]]
+        return item
+
+    def select(
+        self,
+        item_ids: Iterable[str] | None = None,
+        member_id: str | None = None,
+    ) -> list[str]:
+        """Return the IDs of pending items matching all given filters.
+
+        Without filters every pending item is selected, oldest first.
+        """
+        if member_id is not None:
+            candidates: Iterable[str] = self._by_member.get(member_id, {})
+        else:
+            candidates = self._items
+        if item_ids is None:
+            return list(candidates)
+        wanted = set(item_ids)
+        return [item_id for item_id in candidates if item_id in wanted]
+
+    def items(self, member_id: str | None = None) -> list[dict[str, Any]]:
+        """Return the pending items, optionally of a single member."""
+        return [self._items[item_id] for item_id in self.select(member_id=member_id)]
+
+    def count(self, member_id: str) -> int:
+        """Return the number of pending items of a member."""
+        return len(self._by_member.get(member_id, {}))
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of pending items per member."""
+        return {
+            member_id: len(member_items)
+            for member_id, member_items in self._by_member.items()
+        }
+
+    def oldest(self, count: int) -> list[dict[str, Any]]:
+        """Return up to count of the oldest pending items."""
+        return list(islice(self._items.values(), count))
+
+    def load(self, items: Iterable[dict[str, Any]]) -> None:
+        """Replace the queue with stored items, oldest first."""
+        self._items.clear()
+        self._by_member.clear()
+        for item in items:
+            self._items[item["id"]] = item
+            self._by_member.setdefault(item["member"], {})[item["id"]] = None
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the pending items for storage, oldest first."""
+        return list(self._items.values())
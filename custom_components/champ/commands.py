@@ -0,0 +1,115 @@
+"""Single-writer command queue for CHAMP integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .instrumentation import PERF_COMMANDS, Instrumentation
+from .profiler import profiled
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Changes:
+    """What a batch of commands changed, to be committed once."""
+
+    __slots__ = ("members", "approvals", "completions")
+
+    def __init__(self) -> None:
+        """Initialize an empty change set."""
+        self.members: set[str] = set()
+        self.approvals = False
+        # (member_id, task_id, points) of booked completions
+        self.completions: list[tuple[str, str, int]] = []
+
+    def __bool__(self) -> bool:
+        """Return whether anything needs to be saved."""
+        return bool(self.members) or self.approvals
+
+
+# A command validates and applies one mutation, records its effects in the
+# change set passed as its first argument and returns the result for its caller
+Command = Callable[..., Any]
+
+
+class CommandQueue:
+    """Apply all mutations of an entry through a single consumer.
+
+    Commands are synchronous, so each one sees the effects of the commands
+    before it and nothing can interleave between its checks and its
+    changes. Whatever is queued by the time the consumer runs is applied
+    back to back and committed once, so a burst of service calls and switch
+    taps costs one storage save, one state write per affected entity and
+    one notification per member. A failing command only fails its own
+    caller. Commands are applied even if their caller stops waiting.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        commit_func: Callable[[Changes], None],
+        perf: Instrumentation | None = None,
+    ) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._commit_func = commit_func
+        self._pending: list[tuple[Command, tuple[Any, ...], asyncio.Future[Any]]] = []
+        self._perf = perf or Instrumentation()
+
+    def __len__(self) -> int:
+        """Return the number of queued commands."""
+        return len(self._pending)
+
+    @property
+    def batches(self) -> int:
+        """Return the number of committed batches."""
+        return self._perf.counter(PERF_COMMANDS).count
+
+    async def async_submit(self, command: Command, *args: Any) -> Any:
+        """Queue command(changes, *args) and return its result once committed."""
+        future: asyncio.Future[Any] = self._hass.loop.create_future()
+        self._pending.append((command, args, future))
+        if len(self._pending) == 1:
+            self._hass.loop.call_soon(self.async_drain)
+        return await future
+
+    @callback
+    @profiled(PERF_COMMANDS)
+    def async_drain(self) -> None:
+        """Apply and commit all queued commands."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        started = time.perf_counter()
+        changes = Changes()
+        outcomes: list[tuple[asyncio.Future[Any], Any, BaseException | None]] = []
+        for command, args, future in pending:
+            try:
+                outcomes.append((future, command(changes, *args), None))
+            except Exception as err:
+                outcomes.append((future, None, err))
+
+        try:
+            if changes:
+                self._commit_func(changes)
+        except Exception as err:
+            _LOGGER.exception("Error committing %d commands", len(pending))
+            outcomes = [(future, None, err) for future, _, _ in outcomes]
+
+        for future, result, error in outcomes:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        self._perf.record(PERF_COMMANDS, started)
+        _LOGGER.debug("Committed batch of %d commands", len(pending))
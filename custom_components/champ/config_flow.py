@@ -14,29 +14,331 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
 from .const import (
+    CONF_COMPLETION_DEBOUNCE,
     CONF_LEVEL_CONFIG,
+    CONF_LEVEL_CURVE,
+    CONF_LEVEL_GROWTH,
+    CONF_LEVEL_THRESHOLDS,
+    CONF_MAX_LEVEL,
     CONF_MEMBER_BIRTHDATE,
     CONF_MEMBER_ICON,
     CONF_MEMBER_ID,
     CONF_MEMBER_NAME,
     CONF_MEMBERS,
+    CONF_NOTIFICATION_WINDOW,
     CONF_POINTS_PER_LEVEL,
+    CONF_RECONCILE_INTERVAL,
+    CONF_REWARD_APPROVAL_REQUIRED,
+    CONF_REWARD_COST,
+    CONF_REWARD_DESCRIPTION,
+    CONF_REWARD_ID,
+    CONF_REWARD_NAME,
+    CONF_REWARDS,
+    CONF_TASK_APPROVAL_REQUIRED,
     CONF_TASK_ASSIGNED_TO,
     CONF_TASK_CATEGORY,
     CONF_TASK_ICON,
     CONF_TASK_ID,
     CONF_TASK_NAME,
     CONF_TASK_POINTS,
+    CONF_TASK_RECURRENCE,
     CONF_TASKS,
+    DEFAULT_COMPLETION_DEBOUNCE,
+    DEFAULT_LEVEL_GROWTH,
     DEFAULT_MEMBER_ICON,
+    DEFAULT_NOTIFICATION_WINDOW,
     DEFAULT_POINTS_PER_LEVEL,
+    DEFAULT_RECONCILE_INTERVAL,
     DEFAULT_TASK_ICON,
     DOMAIN,
+    LEVEL_CURVE_LINEAR,
+    LEVEL_CURVE_THRESHOLDS,
+    LEVEL_CURVES,
+    RECURRENCE_NONE,
+    RECURRENCES,
+    TASK_CATEGORIES,
 )
+from .profiler import SECTION_CONFIG_FLOW, profiled
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _member_schema(member: dict[str, Any] | None = None) -> vol.Schema:
+    """Return the schema for the member form."""
+    member = member or {}
+    birthdate = member.get(CONF_MEMBER_BIRTHDATE)
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_MEMBER_NAME, default=member.get(CONF_MEMBER_NAME, vol.UNDEFINED)
+            ): str,
+            vol.Optional(
+                CONF_MEMBER_BIRTHDATE,
+                description={"suggested_value": birthdate} if birthdate else None,
+            ): selector.DateSelector(selector.DateSelectorConfig()),
+            vol.Optional(
+                CONF_MEMBER_ICON,
+                default=member.get(CONF_MEMBER_ICON, DEFAULT_MEMBER_ICON),
+            ): selector.IconSelector(
+                selector.IconSelectorConfig(placeholder="mdi:account")
+            ),
+        }
+    )
+
+
+def _validate_member(user_input: dict[str, Any]) -> dict[str, str]:
+    """Validate member form input."""
+    errors: dict[str, str] = {}
+
+    # Validate member name
+    if not user_input.get(CONF_MEMBER_NAME):
+        errors["base"] = "name_required"
+
+    # Validate birthdate if provided
+    if CONF_MEMBER_BIRTHDATE in user_input and user_input[CONF_MEMBER_BIRTHDATE]:
+        birthdate_str = user_input[CONF_MEMBER_BIRTHDATE]
+        try:
+            birthdate = datetime.fromisoformat(birthdate_str).date()
+            today = date.today()
+            min_date = date(today.year - 120, today.month, today.day)
+
+            if birthdate > today:
+                errors[CONF_MEMBER_BIRTHDATE] = "future_date"
+            elif birthdate < min_date:
+                errors[CONF_MEMBER_BIRTHDATE] = "too_old"
+
+        except ValueError:
+            errors[CONF_MEMBER_BIRTHDATE] = "invalid_date"
+
+    return errors
+
+
+def _build_member(user_input: dict[str, Any], member_id: str) -> dict[str, Any]:
+    """Build a member configuration from form input."""
+    return {
+        CONF_MEMBER_ID: member_id,
+        CONF_MEMBER_NAME: user_input[CONF_MEMBER_NAME],
+        CONF_MEMBER_BIRTHDATE: user_input.get(CONF_MEMBER_BIRTHDATE),
+        CONF_MEMBER_ICON: user_input.get(CONF_MEMBER_ICON, DEFAULT_MEMBER_ICON),
+    }
+
+
+def _task_schema(
+    task: dict[str, Any] | None = None,
+    members: list[dict[str, Any]] | None = None,
+) -> vol.Schema:
+    """Return the schema for the task form.
+
+    The assignment field is only shown when members are passed.
+    """
+    task = task or {}
+    schema: dict[Any, Any] = {
+        vol.Required(
+            CONF_TASK_NAME, default=task.get(CONF_TASK_NAME, vol.UNDEFINED)
+        ): str,
+        vol.Required(CONF_TASK_POINTS, default=task.get(CONF_TASK_POINTS, 5)): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+        vol.Optional(
+            CONF_TASK_ICON, default=task.get(CONF_TASK_ICON, DEFAULT_TASK_ICON)
+        ): selector.IconSelector(selector.IconSelectorConfig()),
+        vol.Optional(
+            CONF_TASK_CATEGORY, default=task.get(CONF_TASK_CATEGORY, "other")
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    selector.SelectOptionDict(value=category, label=category)
+                    for category in TASK_CATEGORIES
+                ],
+                mode=selector.SelectSelectorMode.DROPDOWN,
+                translation_key="task_category",  # ← Key for translations
+            )
+        ),
+        vol.Optional(
+            CONF_TASK_RECURRENCE,
+            default=task.get(CONF_TASK_RECURRENCE, RECURRENCE_NONE),
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=RECURRENCES,
+                mode=selector.SelectSelectorMode.DROPDOWN,
+                translation_key="task_recurrence",
+            )
+        ),
+        vol.Optional(
+            CONF_TASK_APPROVAL_REQUIRED,
+            default=task.get(CONF_TASK_APPROVAL_REQUIRED, False),
+        ): bool,
+    }
+
+    if members is not None:
+        schema[
+            vol.Required(
+                CONF_TASK_ASSIGNED_TO, default=task.get(CONF_TASK_ASSIGNED_TO, ["all"])
+            )
+        ] = selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[selector.SelectOptionDict(value="all", label="All members")]
+                + [
+                    selector.SelectOptionDict(
+                        value=member[CONF_MEMBER_ID], label=member[CONF_MEMBER_NAME]
+                    )
+                    for member in members
+                ],
+                multiple=True,
+                mode=selector.SelectSelectorMode.LIST,
+            )
+        )
+
+    return vol.Schema(schema)
+
+
+def _validate_task(user_input: dict[str, Any]) -> dict[str, str]:
+    """Validate task form input."""
+    errors: dict[str, str] = {}
+
+    if not user_input.get(CONF_TASK_NAME):
+        errors["base"] = "name_required"
+    elif user_input.get(CONF_TASK_POINTS, 0) <= 0:
+        errors["base"] = "invalid_points"
+    elif CONF_TASK_ASSIGNED_TO in user_input and not user_input[CONF_TASK_ASSIGNED_TO]:
+        errors[CONF_TASK_ASSIGNED_TO] = "assignment_required"
+
+    return errors
+
+
+def _build_task(user_input: dict[str, Any], task_id: str) -> dict[str, Any]:
+    """Build a task configuration from form input."""
+    assigned_to = user_input.get(CONF_TASK_ASSIGNED_TO, ["all"])
+    return {
+        CONF_TASK_ID: task_id,
+        CONF_TASK_NAME: user_input[CONF_TASK_NAME],
+        CONF_TASK_ICON: user_input.get(CONF_TASK_ICON, DEFAULT_TASK_ICON),
+        CONF_TASK_POINTS: user_input[CONF_TASK_POINTS],
+        CONF_TASK_CATEGORY: user_input.get(CONF_TASK_CATEGORY, "other"),
+        CONF_TASK_RECURRENCE: user_input.get(CONF_TASK_RECURRENCE, RECURRENCE_NONE),
+        CONF_TASK_APPROVAL_REQUIRED: user_input.get(CONF_TASK_APPROVAL_REQUIRED, False),
+        CONF_TASK_ASSIGNED_TO: ["all"] if "all" in assigned_to else assigned_to,
+    }
+
+
+def _new_item_id(name: str, items: list[dict[str, Any]]) -> str:
+    """Return a task or reward ID derived from the name that is not used yet."""
+    base_id = name.lower().replace(" ", "_")
+    item_ids = {item[CONF_TASK_ID] for item in items}
+    item_id = base_id
+    suffix = 2
+    while item_id in item_ids:
+        item_id = f"{base_id}_{suffix}"
+        suffix += 1
+    return item_id
+
+
+def _reward_schema(reward: dict[str, Any] | None = None) -> vol.Schema:
+    """Return the schema for the reward form."""
+    reward = reward or {}
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_REWARD_NAME, default=reward.get(CONF_REWARD_NAME, vol.UNDEFINED)
+            ): str,
+            vol.Optional(
+                CONF_REWARD_DESCRIPTION,
+                default=reward.get(CONF_REWARD_DESCRIPTION, ""),
+            ): str,
+            vol.Required(
+                CONF_REWARD_COST, default=reward.get(CONF_REWARD_COST, 50)
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100000)),
+            vol.Optional(
+                CONF_REWARD_APPROVAL_REQUIRED,
+                default=reward.get(CONF_REWARD_APPROVAL_REQUIRED, False),
+            ): bool,
+        }
+    )
+
+
+def _build_reward(user_input: dict[str, Any], reward_id: str) -> dict[str, Any]:
+    """Build a reward configuration from form input."""
+    return {
+        CONF_REWARD_ID: reward_id,
+        CONF_REWARD_NAME: user_input[CONF_REWARD_NAME],
+        CONF_REWARD_DESCRIPTION: user_input.get(CONF_REWARD_DESCRIPTION, ""),
+        CONF_REWARD_COST: user_input[CONF_REWARD_COST],
+        CONF_REWARD_APPROVAL_REQUIRED: user_input.get(
+            CONF_REWARD_APPROVAL_REQUIRED, False
+        ),
+    }
+
+
+def _level_config_schema(level_config: dict[str, Any]) -> vol.Schema:
+    """Return the schema for the level configuration form."""
+    thresholds = level_config.get(CONF_LEVEL_THRESHOLDS, [])
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_LEVEL_CURVE,
+                default=level_config.get(CONF_LEVEL_CURVE, LEVEL_CURVE_LINEAR),
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=LEVEL_CURVES,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                    translation_key="level_curve",
+                )
+            ),
+            vol.Optional(
+                CONF_POINTS_PER_LEVEL,
+                default=level_config.get(
+                    CONF_POINTS_PER_LEVEL, DEFAULT_POINTS_PER_LEVEL
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=500)),
+            vol.Optional(
+                CONF_LEVEL_GROWTH,
+                default=level_config.get(CONF_LEVEL_GROWTH, DEFAULT_LEVEL_GROWTH),
+            ): vol.All(vol.Coerce(float), vol.Range(min=1.05, max=3)),
+            vol.Optional(
+                CONF_MAX_LEVEL, default=level_config.get(CONF_MAX_LEVEL) or 0
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+            vol.Optional(
+                CONF_LEVEL_THRESHOLDS,
+                default=", ".join(str(points) for points in thresholds),
+            ): str,
+        }
+    )
+
+
+def _parse_level_config(
+    user_input: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Build the level configuration from form input."""
+    errors: dict[str, str] = {}
+    level_config: dict[str, Any] = {
+        CONF_LEVEL_CURVE: user_input.get(CONF_LEVEL_CURVE, LEVEL_CURVE_LINEAR),
+        CONF_POINTS_PER_LEVEL: user_input.get(
+            CONF_POINTS_PER_LEVEL, DEFAULT_POINTS_PER_LEVEL
+        ),
+        CONF_LEVEL_GROWTH: user_input.get(CONF_LEVEL_GROWTH, DEFAULT_LEVEL_GROWTH),
+        CONF_MAX_LEVEL: user_input.get(CONF_MAX_LEVEL) or None,
+    }
+
+    if level_config[CONF_LEVEL_CURVE] == LEVEL_CURVE_THRESHOLDS:
+        try:
+            thresholds = sorted(
+                int(points)
+                for points in user_input.get(CONF_LEVEL_THRESHOLDS, "").split(",")
+                if points.strip()
+            )
+        except ValueError:
+            thresholds = []
+        if (
+            not thresholds
+            or thresholds[0] <= 0
+            or len(set(thresholds)) != len(thresholds)
+        ):
+            errors[CONF_LEVEL_THRESHOLDS] = "invalid_thresholds"
+        level_config[CONF_LEVEL_THRESHOLDS] = thresholds
+
+    return level_config, errors
+
+
 class ChampConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     """Handle a config flow for CHAMP."""
 
@@ -50,6 +352,7 @@ class ChampConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
             CONF_POINTS_PER_LEVEL: DEFAULT_POINTS_PER_LEVEL
         }
 
+    @profiled(SECTION_CONFIG_FLOW)
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -64,6 +367,7 @@ class ChampConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
             description_placeholders={"docs_url": "https://github.com/vmerz/ha-champ"},
         )
 
+    @profiled(SECTION_CONFIG_FLOW)
     async def async_step_add_member(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -71,39 +375,11 @@ class ChampConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Validate member name
-            if not user_input.get(CONF_MEMBER_NAME):
-                errors["base"] = "name_required"
-
-            # Validate birthdate if provided
-            if (
-                CONF_MEMBER_BIRTHDATE in user_input
-                and user_input[CONF_MEMBER_BIRTHDATE]
-            ):
-                birthdate_str = user_input[CONF_MEMBER_BIRTHDATE]
-                try:
-                    birthdate = datetime.fromisoformat(birthdate_str).date()
-                    today = date.today()
-                    min_date = date(today.year - 120, today.month, today.day)
-
-                    if birthdate > today:
-                        errors[CONF_MEMBER_BIRTHDATE] = "future_date"
-                    elif birthdate < min_date:
-                        errors[CONF_MEMBER_BIRTHDATE] = "too_old"
-
-                except ValueError:
-                    errors[CONF_MEMBER_BIRTHDATE] = "invalid_date"
+            errors = _validate_member(user_input)
 
             # Only create member if no errors
-            if not errors:  # ← Fixed!
-                member = {
-                    CONF_MEMBER_ID: str(uuid.uuid4())[:8],
-                    CONF_MEMBER_NAME: user_input[CONF_MEMBER_NAME],
-                    CONF_MEMBER_BIRTHDATE: user_input.get(CONF_MEMBER_BIRTHDATE),
-                    CONF_MEMBER_ICON: user_input.get(
-                        CONF_MEMBER_ICON, DEFAULT_MEMBER_ICON
-                    ),
-                }
+            if not errors:
+                member = _build_member(user_input, str(uuid.uuid4())[:8])
                 self._members.append(member)
 
                 _LOGGER.debug("Added member: %s", member[CONF_MEMBER_NAME])
@@ -112,22 +388,11 @@ class ChampConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
 
         return self.async_show_form(
             step_id="add_member",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_MEMBER_NAME): str,
-                    vol.Optional(CONF_MEMBER_BIRTHDATE): selector.DateSelector(
-                        selector.DateSelectorConfig()
-                    ),
-                    vol.Optional(
-                        CONF_MEMBER_ICON, default=DEFAULT_MEMBER_ICON
-                    ): selector.IconSelector(
-                        selector.IconSelectorConfig(placeholder="mdi:account")
-                    ),
-                }
-            ),
+            data_schema=_member_schema(),
             errors=errors,
         )
 
+    @profiled(SECTION_CONFIG_FLOW)
     async def async_step_add_another_member(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -150,6 +415,7 @@ class ChampConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
             },
         )
 
+    @profiled(SECTION_CONFIG_FLOW)
     async def async_step_add_task(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -157,21 +423,12 @@ class ChampConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Validate task
-            if not user_input.get(CONF_TASK_NAME):
-                errors["base"] = "name_required"
-            elif user_input.get(CONF_TASK_POINTS, 0) <= 0:
-                errors["base"] = "invalid_points"
-            else:
-                # Create task entry
-                task = {
-                    CONF_TASK_ID: user_input[CONF_TASK_NAME].lower().replace(" ", "_"),
-                    CONF_TASK_NAME: user_input[CONF_TASK_NAME],
-                    CONF_TASK_ICON: user_input.get(CONF_TASK_ICON, DEFAULT_TASK_ICON),
-                    CONF_TASK_POINTS: user_input[CONF_TASK_POINTS],
-                    CONF_TASK_CATEGORY: user_input.get(CONF_TASK_CATEGORY, "other"),
-                    CONF_TASK_ASSIGNED_TO: ["all"],  # Default to all members
-                }
+            errors = _validate_task(user_input)
+            if not errors:
+                # Create task entry, assigned to all members by default
+                task = _build_task(
+                    user_input, _new_item_id(user_input[CONF_TASK_NAME], self._tasks)
+                )
                 self._tasks.append(task)
 
                 _LOGGER.debug(
@@ -184,42 +441,11 @@ class ChampConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
 
         return self.async_show_form(
             step_id="add_task",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_TASK_NAME): str,
-                    vol.Required(CONF_TASK_POINTS, default=5): vol.All(
-                        vol.Coerce(int), vol.Range(min=1, max=100)
-                    ),
-                    vol.Optional(
-                        CONF_TASK_ICON, default=DEFAULT_TASK_ICON
-                    ): selector.IconSelector(
-                        selector.IconSelectorConfig()  # ← Changed!
-                    ),
-                    vol.Optional(
-                        CONF_TASK_CATEGORY, default="other"
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(
-                                    value="chores", label="chores"
-                                ),
-                                selector.SelectOptionDict(
-                                    value="learning", label="learning"
-                                ),
-                                selector.SelectOptionDict(
-                                    value="health", label="health"
-                                ),
-                                selector.SelectOptionDict(value="other", label="other"),
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                            translation_key="task_category",  # ← Key for translations
-                        )
-                    ),
-                }
-            ),
+            data_schema=_task_schema(),
             errors=errors,
         )
 
+    @profiled(SECTION_CONFIG_FLOW)
     async def async_step_add_another_task(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -241,29 +467,26 @@ class ChampConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
             },
         )
 
+    @profiled(SECTION_CONFIG_FLOW)
     async def async_step_level_config(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Configure level progression."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            self._level_config = {
-                CONF_POINTS_PER_LEVEL: user_input.get(
-                    CONF_POINTS_PER_LEVEL, DEFAULT_POINTS_PER_LEVEL
-                )
-            }
-            return await self.async_step_finish()
+            level_config, errors = _parse_level_config(user_input)
+            if not errors:
+                self._level_config = level_config
+                return await self.async_step_finish()
 
         return self.async_show_form(
             step_id="level_config",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_POINTS_PER_LEVEL, default=DEFAULT_POINTS_PER_LEVEL
-                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=500)),
-                }
-            ),
+            data_schema=_level_config_schema(self._level_config),
+            errors=errors,
         )
 
+    @profiled(SECTION_CONFIG_FLOW)
     async def async_step_finish(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -288,23 +511,451 @@ class ChampConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
 
 
 class ChampOptionsFlow(config_entries.OptionsFlow):
-    """Handle options flow for CHAMP."""
+    """Handle options flow for CHAMP.
+
+    Member, task and level changes are written to the entry data; the update
+    listener then applies them to the running coordinator in place.
+    """
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
-
+        self._member_id: str | None = None
+        self._task_id: str | None = None
+        self._reward_id: str | None = None
+
+    @property
+    def _members(self) -> list[dict[str, Any]]:
+        """Return the configured members."""
+        return list(self.config_entry.data.get(CONF_MEMBERS, []))
+
+    @property
+    def _tasks(self) -> list[dict[str, Any]]:
+        """Return the configured tasks."""
+        return list(self.config_entry.data.get(CONF_TASKS, []))
+
+    @property
+    def _rewards(self) -> list[dict[str, Any]]:
+        """Return the configured rewards."""
+        return list(self.config_entry.data.get(CONF_REWARDS, []))
+
+    @profiled(SECTION_CONFIG_FLOW)
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        menu_options = ["add_member"]
+        if self._members:
+            menu_options.extend(["edit_member", "remove_member"])
+        menu_options.append("add_task")
+        if self._tasks:
+            menu_options.extend(["edit_task", "remove_task"])
+        menu_options.append("add_reward")
+        if self._rewards:
+            menu_options.extend(["edit_reward", "remove_reward"])
+        menu_options.extend(["level_config", "settings"])
+
+        return self.async_show_menu(step_id="init", menu_options=menu_options)
+
+    @callback
+    def _async_save_data(self, changes: dict[str, Any]) -> FlowResult:
+        """Write changed configuration to the entry and finish the flow."""
+        data = {**self.config_entry.data, **changes}
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            title=f"CHAMP ({len(data[CONF_MEMBERS])} members)",
+            data=data,
+        )
+        return self.async_create_entry(title="", data=dict(self.config_entry.options))
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_add_member(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add a member."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            # Update the config entry with new data
-            return self.async_create_entry(title="", data=user_input)
+            errors = _validate_member(user_input)
+            if not errors:
+                member = _build_member(user_input, str(uuid.uuid4())[:8])
+                _LOGGER.debug("Adding member: %s", member[CONF_MEMBER_NAME])
+                return self._async_save_data({CONF_MEMBERS: [*self._members, member]})
 
-        # For now, show current configuration
-        # Full options flow will be implemented in Phase 2
         return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema({}),
+            step_id="add_member",
+            data_schema=_member_schema(),
+            errors=errors,
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_edit_member(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Select the member to edit."""
+        if user_input is not None:
+            self._member_id = user_input[CONF_MEMBER_ID]
+            return await self.async_step_edit_member_details()
+
+        return self.async_show_form(
+            step_id="edit_member",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_MEMBER_ID): self._member_selector()}
+            ),
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_edit_member_details(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Edit the selected member."""
+        errors: dict[str, str] = {}
+        members = self._members
+        member = next(m for m in members if m[CONF_MEMBER_ID] == self._member_id)
+
+        if user_input is not None:
+            errors = _validate_member(user_input)
+            if not errors:
+                updated = _build_member(user_input, member[CONF_MEMBER_ID])
+                return self._async_save_data(
+                    {
+                        CONF_MEMBERS: [
+                            updated if m[CONF_MEMBER_ID] == self._member_id else m
+                            for m in members
+                        ]
+                    }
+                )
+
+        return self.async_show_form(
+            step_id="edit_member_details",
+            data_schema=_member_schema(member),
+            errors=errors,
+            description_placeholders={"member_name": member[CONF_MEMBER_NAME]},
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_remove_member(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Remove members together with their entities."""
+        errors: dict[str, str] = {}
+        placeholders = {"tasks": ""}
+        members = self._members
+
+        if user_input is not None:
+            removed = set(user_input[CONF_MEMBERS])
+            # Drop the removed members from task assignments as well
+            tasks = []
+            unassigned = []
+            for task in self._tasks:
+                assigned_to = task.get(CONF_TASK_ASSIGNED_TO, ["all"])
+                if "all" not in assigned_to:
+                    assigned_to = [m for m in assigned_to if m not in removed]
+                    if not assigned_to:
+                        unassigned.append(task[CONF_TASK_NAME])
+                    task = {**task, CONF_TASK_ASSIGNED_TO: assigned_to}
+                tasks.append(task)
+
+            if len(removed) >= len(members):
+                errors["base"] = "member_required"
+            elif unassigned:
+                # Tasks are not silently reassigned to everyone
+                errors["base"] = "task_unassigned"
+                placeholders["tasks"] = ", ".join(unassigned)
+            else:
+                return self._async_save_data(
+                    {
+                        CONF_MEMBERS: [
+                            m for m in members if m[CONF_MEMBER_ID] not in removed
+                        ],
+                        CONF_TASKS: tasks,
+                    }
+                )
+
+        return self.async_show_form(
+            step_id="remove_member",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_MEMBERS): self._member_selector(multiple=True)}
+            ),
+            errors=errors,
+            description_placeholders=placeholders,
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_add_task(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add a task."""
+        errors: dict[str, str] = {}
+        tasks = self._tasks
+
+        if user_input is not None:
+            errors = _validate_task(user_input)
+            if not errors:
+                task = _build_task(
+                    user_input, _new_item_id(user_input[CONF_TASK_NAME], tasks)
+                )
+                _LOGGER.debug("Adding task: %s", task[CONF_TASK_NAME])
+                return self._async_save_data({CONF_TASKS: [*tasks, task]})
+
+        return self.async_show_form(
+            step_id="add_task",
+            data_schema=_task_schema(members=self._members),
+            errors=errors,
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_edit_task(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Select the task to edit."""
+        if user_input is not None:
+            self._task_id = user_input[CONF_TASK_ID]
+            return await self.async_step_edit_task_details()
+
+        return self.async_show_form(
+            step_id="edit_task",
+            data_schema=vol.Schema({vol.Required(CONF_TASK_ID): self._task_selector()}),
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_edit_task_details(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Edit the selected task."""
+        errors: dict[str, str] = {}
+        tasks = self._tasks
+        task = next(t for t in tasks if t[CONF_TASK_ID] == self._task_id)
+
+        if user_input is not None:
+            errors = _validate_task(user_input)
+            if not errors:
+                # Keep settings that are not part of the form
+                updated = {**task, **_build_task(user_input, task[CONF_TASK_ID])}
+                return self._async_save_data(
+                    {
+                        CONF_TASKS: [
+                            updated if t[CONF_TASK_ID] == self._task_id else t
+                            for t in tasks
+                        ]
+                    }
+                )
+
+        return self.async_show_form(
+            step_id="edit_task_details",
+            data_schema=_task_schema(task, self._members),
+            errors=errors,
+            description_placeholders={"task_name": task[CONF_TASK_NAME]},
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_remove_task(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Remove tasks together with their switches."""
+        if user_input is not None:
+            removed = set(user_input[CONF_TASKS])
+            return self._async_save_data(
+                {CONF_TASKS: [t for t in self._tasks if t[CONF_TASK_ID] not in removed]}
+            )
+
+        return self.async_show_form(
+            step_id="remove_task",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_TASKS): self._task_selector(multiple=True)}
+            ),
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_add_reward(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add a reward."""
+        errors: dict[str, str] = {}
+        rewards = self._rewards
+
+        if user_input is not None:
+            if not user_input.get(CONF_REWARD_NAME):
+                errors["base"] = "name_required"
+            else:
+                reward = _build_reward(
+                    user_input, _new_item_id(user_input[CONF_REWARD_NAME], rewards)
+                )
+                _LOGGER.debug("Adding reward: %s", reward[CONF_REWARD_NAME])
+                return self._async_save_data({CONF_REWARDS: [*rewards, reward]})
+
+        return self.async_show_form(
+            step_id="add_reward",
+            data_schema=_reward_schema(),
+            errors=errors,
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_edit_reward(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Select the reward to edit."""
+        if user_input is not None:
+            self._reward_id = user_input[CONF_REWARD_ID]
+            return await self.async_step_edit_reward_details()
+
+        return self.async_show_form(
+            step_id="edit_reward",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_REWARD_ID): self._reward_selector()}
+            ),
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_edit_reward_details(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Edit the selected reward."""
+        errors: dict[str, str] = {}
+        rewards = self._rewards
+        reward = next(r for r in rewards if r[CONF_REWARD_ID] == self._reward_id)
+
+        if user_input is not None:
+            if not user_input.get(CONF_REWARD_NAME):
+                errors["base"] = "name_required"
+            else:
+                updated = _build_reward(user_input, reward[CONF_REWARD_ID])
+                return self._async_save_data(
+                    {
+                        CONF_REWARDS: [
+                            updated if r[CONF_REWARD_ID] == self._reward_id else r
+                            for r in rewards
+                        ]
+                    }
+                )
+
+        return self.async_show_form(
+            step_id="edit_reward_details",
+            data_schema=_reward_schema(reward),
+            errors=errors,
+            description_placeholders={"reward_name": reward[CONF_REWARD_NAME]},
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_remove_reward(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Remove rewards from the catalog."""
+        if user_input is not None:
+            removed = set(user_input[CONF_REWARDS])
+            return self._async_save_data(
+                {
+                    CONF_REWARDS: [
+                        r for r in self._rewards if r[CONF_REWARD_ID] not in removed
+                    ]
+                }
+            )
+
+        return self.async_show_form(
+            step_id="remove_reward",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_REWARDS): self._reward_selector(multiple=True)}
+            ),
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_level_config(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure level progression."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            level_config, errors = _parse_level_config(user_input)
+            if not errors:
+                return self._async_save_data({CONF_LEVEL_CONFIG: level_config})
+
+        return self.async_show_form(
+            step_id="level_config",
+            data_schema=_level_config_schema(
+                self.config_entry.data.get(CONF_LEVEL_CONFIG, {})
+            ),
+            errors=errors,
+        )
+
+    @profiled(SECTION_CONFIG_FLOW)
+    async def async_step_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure runtime settings."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title="", data={**self.config_entry.options, **user_input}
+            )
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_COMPLETION_DEBOUNCE,
+                        default=options.get(
+                            CONF_COMPLETION_DEBOUNCE, DEFAULT_COMPLETION_DEBOUNCE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Required(
+                        CONF_NOTIFICATION_WINDOW,
+                        default=options.get(
+                            CONF_NOTIFICATION_WINDOW, DEFAULT_NOTIFICATION_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Required(
+                        CONF_RECONCILE_INTERVAL,
+                        default=options.get(
+                            CONF_RECONCILE_INTERVAL, DEFAULT_RECONCILE_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                }
+            ),
+        )
+
+    def _member_selector(self, multiple: bool = False) -> selector.SelectSelector:
+        """Return a selector listing the configured members."""
+        return selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    selector.SelectOptionDict(
+                        value=member[CONF_MEMBER_ID], label=member[CONF_MEMBER_NAME]
+                    )
+                    for member in self._members
+                ],
+                multiple=multiple,
+                mode=selector.SelectSelectorMode.LIST,
+            )
+        )
+
+    def _task_selector(self, multiple: bool = False) -> selector.SelectSelector:
+        """Return a selector listing the configured tasks."""
+        return selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    selector.SelectOptionDict(
+                        value=task[CONF_TASK_ID], label=task[CONF_TASK_NAME]
+                    )
+                    for task in self._tasks
+                ],
+                multiple=multiple,
+                mode=selector.SelectSelectorMode.LIST,
+            )
+        )
+
+    def _reward_selector(self, multiple: bool = False) -> selector.SelectSelector:
+        """Return a selector listing the configured rewards."""
+        return selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    selector.SelectOptionDict(
+                        value=reward[CONF_REWARD_ID], label=reward[CONF_REWARD_NAME]
+                    )
+                    for reward in self._rewards
+                ],
+                multiple=multiple,
+                mode=selector.SelectSelectorMode.LIST,
+            )
         )
@@ -21,20 +21,40 @@ CONF_TASK_NAME = "name"
 CONF_TASK_ICON = "icon"
 CONF_TASK_POINTS = "points"
 CONF_TASK_CATEGORY = "category"
+CONF_TASK_APPROVAL_REQUIRED = "approval_required"
 CONF_TASK_ASSIGNED_TO = "assigned_to"
+CONF_TASK_RECURRENCE = "recurrence"
 
 # Level configuration
 CONF_POINTS_PER_LEVEL = "points_per_level"
 CONF_MAX_LEVEL = "max_level"
+CONF_LEVEL_CURVE = "level_curve"
+CONF_LEVEL_GROWTH = "level_growth"
+CONF_LEVEL_THRESHOLDS = "level_thresholds"
+
+# Level curves
+LEVEL_CURVE_LINEAR = "linear"
+LEVEL_CURVE_QUADRATIC = "quadratic"
+LEVEL_CURVE_EXPONENTIAL = "exponential"
+LEVEL_CURVE_THRESHOLDS = "thresholds"
+
+LEVEL_CURVES = [
+    LEVEL_CURVE_LINEAR,
+    LEVEL_CURVE_QUADRATIC,
+    LEVEL_CURVE_EXPONENTIAL,
+    LEVEL_CURVE_THRESHOLDS,
+]
 
 # Reward configuration
 CONF_REWARD_ID = "id"
+CONF_REWARD_NAME = "name"
 CONF_REWARD_DESCRIPTION = "description"
 CONF_REWARD_COST = "cost"
 CONF_REWARD_APPROVAL_REQUIRED = "approval_required"
 
 # Defaults
 DEFAULT_POINTS_PER_LEVEL = 50
+DEFAULT_LEVEL_GROWTH = 1.5
 DEFAULT_TASK_ICON = "mdi:checkbox-marked-circle"
 DEFAULT_MEMBER_ICON = "mdi:account-member"
 
@@ -51,23 +71,136 @@ TASK_CATEGORIES = [
     TASK_CATEGORY_OTHER,
 ]
 
+# Task recurrence. Completed recurring tasks stay done until they reset at
+# local midnight (daily) or at the start of the week (weekly).
+RECURRENCE_NONE = "none"
+RECURRENCE_DAILY = "daily"
+RECURRENCE_WEEKLY = "weekly"
+
+RECURRENCES = [
+    RECURRENCE_NONE,
+    RECURRENCE_DAILY,
+    RECURRENCE_WEEKLY,
+]
+
 # Services
 SERVICE_AWARD_POINTS = "award_points"
 SERVICE_RESET_POINTS = "reset_points"
 SERVICE_COMPLETE_TASK = "complete_task"
+SERVICE_AWARD_BATCH = "award_batch"
+SERVICE_REDEEM_REWARD = "redeem_reward"
+SERVICE_APPROVE = "approve"
+SERVICE_REJECT = "reject"
+SERVICE_EXPORT_HISTORY = "export_history"
+SERVICE_IMPORT_HISTORY = "import_history"
+SERVICE_PROFILE = "profile"
 SERVICE_GENERATE_DASHBOARD = "generate_dashboard"
 
+# Points a single award may add or deduct
+MAX_AWARD_POINTS = 1000
+
 # Attributes
 ATTR_MEMBER_ID = "member_id"
 ATTR_POINTS = "points"
 ATTR_TASK_ID = "task_id"
+ATTR_ITEMS = "items"
+ATTR_IDEMPOTENCY_KEY = "idempotency_key"
+ATTR_REWARD_ID = "reward_id"
+ATTR_ITEM_IDS = "item_ids"
+ATTR_ALL = "all"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_FORMAT = "format"
+ATTR_FILENAME = "filename"
+ATTR_DURATION = "duration"
+ATTR_TOP = "top"
 ATTR_DASHBOARD_TYPE = "dashboard_type"
 
+# Dispatcher signals for entities added by configuration changes
+SIGNAL_MEMBERS_ADDED = "champ_{entry_id}_members_added"
+SIGNAL_TASKS_ADDED = "champ_{entry_id}_tasks_added"
+
 # Entity ID formats
 SENSOR_POINTS = "{domain}_{member_id}_points"
 SENSOR_LEVEL = "{domain}_{member_id}_level"
 SENSOR_POINTS_TO_NEXT = "{domain}_{member_id}_points_to_next_level"
 SWITCH_TASK = "{domain}_{member_id}_{task_id}"
 
-# Update interval (in seconds)
-UPDATE_INTERVAL = 30
+# Task switches turn off again after this delay (in seconds)
+SWITCH_AUTO_OFF_DELAY = 2
+
+# Duplicate completions of the same task by the same member within this
+# window (in seconds) are ignored, as are repeated idempotency keys
+CONF_COMPLETION_DEBOUNCE = "completion_debounce"
+DEFAULT_COMPLETION_DEBOUNCE = 2
+IDEMPOTENCY_KEY_TTL = 600
+COMPLETION_CACHE_SIZE = 1024
+
+# Completion notifications are summarized per member over this window (in
+# seconds) and sent at most once per NOTIFICATION_MIN_INTERVAL
+CONF_NOTIFICATION_WINDOW = "notification_window"
+DEFAULT_NOTIFICATION_WINDOW = 5
+NOTIFICATION_MIN_INTERVAL = 30
+
+# Reward redemptions. Redemptions of rewards requiring approval stay pending;
+# the most recent REDEMPTION_HISTORY_SIZE completed redemptions are kept.
+REDEMPTION_FULFILLED = "fulfilled"
+REDEMPTION_PENDING = "pending"
+REDEMPTION_REJECTED = "rejected"
+REDEMPTION_HISTORY_SIZE = 100
+
+# Completions of tasks and redemptions of rewards requiring approval wait in
+# a queue of at most this many items
+APPROVAL_QUEUE_SIZE = 1000
+
+# Rolling statistics: points and completions are aggregated into daily,
+# weekly and monthly buckets, kept for this many days, weeks and months
+STATS_PERIOD_TODAY = "today"
+STATS_PERIOD_WEEK = "week"
+STATS_PERIOD_MONTH = "month"
+
+STATS_PERIODS = [
+    STATS_PERIOD_TODAY,
+    STATS_PERIOD_WEEK,
+    STATS_PERIOD_MONTH,
+]
+
+STATS_DAYS_KEPT = 31
+STATS_WEEKS_KEPT = 13
+STATS_MONTHS_KEPT = 12
+
+# Storage
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10  # seconds, coalesces bursts of changes into one write
+
+# Transaction log
+LEDGER_FLUSH_DELAY = 5  # seconds
+LEDGER_SEGMENT_SIZE = 1000  # events per segment file
+LEDGER_SNAPSHOT_INTERVAL = 5000  # events between balance snapshots
+
+# History export. Exports are written to EXPORT_DIR in the config directory,
+# either as JSON lines with one event per line or gzip-compressed with the
+# events grouped into columns of EXPORT_CHUNK_SIZE events per line.
+EXPORT_FORMAT_JSONL = "jsonl"
+EXPORT_FORMAT_COLUMNAR = "columnar"
+
+EXPORT_FORMATS = [
+    EXPORT_FORMAT_JSONL,
+    EXPORT_FORMAT_COLUMNAR,
+]
+
+EXPORT_DIR = "champ_exports"
+EXPORT_VERSION = 1
+EXPORT_CHUNK_SIZE = 1000
+
+# Profiling. Stats files are written to the config directory as
+# PROFILE_PREFIX<timestamp>.prof and can be opened with pstats or snakeviz.
+PROFILE_PREFIX = "champ_profile_"
+PROFILE_DEFAULT_DURATION = 60  # seconds
+PROFILE_MAX_DURATION = 600  # seconds
+PROFILE_DEFAULT_TOP = 20
+PROFILE_MAX_TOP = 100
+
+# Coordinator is push-based; an optional reconciliation interval (in seconds)
+# can be configured for external storage. 0 disables polling.
+CONF_RECONCILE_INTERVAL = "reconcile_interval"
+DEFAULT_RECONCILE_INTERVAL = 0
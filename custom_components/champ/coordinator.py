@@ -3,55 +3,205 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+import time
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from itertools import takewhile
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
+from .approvals import APPROVAL_REWARD, APPROVAL_TASK, ApprovalQueue
+from .commands import Changes, CommandQueue
 from .const import (
+    APPROVAL_QUEUE_SIZE,
+    ATTR_MEMBER_ID,
+    ATTR_POINTS,
+    ATTR_TASK_ID,
+    COMPLETION_CACHE_SIZE,
+    CONF_COMPLETION_DEBOUNCE,
     CONF_LEVEL_CONFIG,
+    CONF_MEMBER_BIRTHDATE,
     CONF_MEMBER_ID,
+    CONF_MEMBER_NAME,
     CONF_MEMBERS,
+    CONF_NOTIFICATION_WINDOW,
     CONF_POINTS_PER_LEVEL,
+    CONF_RECONCILE_INTERVAL,
+    CONF_REWARD_APPROVAL_REQUIRED,
+    CONF_REWARD_COST,
+    CONF_REWARD_ID,
+    CONF_REWARDS,
+    CONF_TASK_APPROVAL_REQUIRED,
+    CONF_TASK_ASSIGNED_TO,
+    CONF_TASK_CATEGORY,
+    CONF_TASK_ID,
+    CONF_TASK_NAME,
+    CONF_TASK_POINTS,
+    CONF_TASK_RECURRENCE,
     CONF_TASKS,
+    DEFAULT_COMPLETION_DEBOUNCE,
+    DEFAULT_NOTIFICATION_WINDOW,
     DEFAULT_POINTS_PER_LEVEL,
+    DEFAULT_RECONCILE_INTERVAL,
     DOMAIN,
-    UPDATE_INTERVAL,
+    EXPORT_VERSION,
+    IDEMPOTENCY_KEY_TTL,
+    RECURRENCE_NONE,
+    REDEMPTION_FULFILLED,
+    REDEMPTION_HISTORY_SIZE,
+    REDEMPTION_PENDING,
+    REDEMPTION_REJECTED,
+    SIGNAL_MEMBERS_ADDED,
+    SIGNAL_TASKS_ADDED,
+    STATS_PERIODS,
 )
+from .history import ImportedHistory
+from .instrumentation import (
+    PERF_AWARD,
+    PERF_BATCH,
+    PERF_COMPLETE,
+    PERF_DECIDE,
+    PERF_RECONCILE,
+    PERF_REDEEM,
+    PERF_REFRESH,
+    PERF_RESET,
+    PERF_STATE_WRITE,
+    Instrumentation,
+    timed,
+)
+from .leaderboard import RANKING_TOTAL, Leaderboard
+from .ledger import (
+    EVENT_AWARD,
+    EVENT_COMPLETE,
+    EVENT_REDEEM,
+    EVENT_REFUND,
+    EVENT_RESET,
+    ChampLedger,
+    apply_event,
+)
+from .levels import LevelTable
+from .notifications import ChampNotifier
+from .profiler import profiled
+from .scheduler import RecurrenceScheduler, ResetKey, next_reset
+from .stats import Bucket, StatsTracker
+from .storage import ChampStorage
+from .streaks import StreakTracker
+from .utils import TTLCache, age_on, parse_birthdate
 
 _LOGGER = logging.getLogger(__name__)
 
+# Listener scopes
+SCOPE_MEMBER = "member"
+SCOPE_PROFILE = "profile"
+SCOPE_TASK = "task"
+SCOPE_APPROVALS = "approvals"
+SCOPE_ASSIGNMENT = "assignment"
+SCOPE_LEADERBOARD = "leaderboard"
+
 
 class ChampDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching CHAMP data."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
+        # All changes are pushed by awards, resets and config updates, so
+        # polling is disabled unless a reconciliation interval is configured
+        reconcile_interval: int = entry.options.get(
+            CONF_RECONCILE_INTERVAL, DEFAULT_RECONCILE_INTERVAL
+        )
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            update_interval=(
+                timedelta(seconds=reconcile_interval) if reconcile_interval else None
+            ),
         )
         self.config_entry = entry
+        self.reconcile_interval = reconcile_interval
+
+        # Counts and durations of hot paths, shown in the diagnostics
+        self.perf = Instrumentation()
+
+        self.storage = ChampStorage(hass, entry.entry_id, self.perf)
+        self.ledger = ChampLedger(hass, entry.entry_id, self.perf)
+        self.ledger.async_set_balances_func(self._balances)
+        self.notifier = ChampNotifier(
+            hass,
+            entry.options.get(CONF_NOTIFICATION_WINDOW, DEFAULT_NOTIFICATION_WINDOW),
+            self._completion_message,
+            self.perf,
+        )
+
+        # Listeners scoped to a single member or task, so a change only wakes
+        # the entities depending on it instead of every entity in the entry
+        self._scoped_listeners: dict[tuple[str, ...], dict[CALLBACK_TYPE, None]] = {}
+
+        # Recently completed (member, task) pairs and idempotency keys, so
+        # duplicate completions are rejected without touching any state
+        self._recent_completions = TTLCache(
+            COMPLETION_CACHE_SIZE,
+            entry.options.get(CONF_COMPLETION_DEBOUNCE, DEFAULT_COMPLETION_DEBOUNCE),
+        )
+        self._idempotency_keys = TTLCache(COMPLETION_CACHE_SIZE, IDEMPOTENCY_KEY_TTL)
+
+        # All mutations are applied by a single consumer and committed in
+        # batches, so concurrent calls cannot interleave between a check and
+        # the change depending on it, e.g. two redemptions of the same points
+        self.commands = CommandQueue(hass, self._async_commit_changes, self.perf)
+        self._redemptions: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+        # Completions and redemptions waiting for a parent's decision
+        self.approvals = ApprovalQueue(APPROVAL_QUEUE_SIZE)
+
+        # Daily completion streaks per member and per (member, task)
+        self.streaks = StreakTracker()
+
+        # Points and completions per day, week and month
+        self.stats = StatsTracker()
+
+        # Rankings by balance and by period points, kept sorted on each change
+        self.leaderboard = Leaderboard(STATS_PERIODS)
+
+        # Completed recurring tasks stay done until their reset is due
+        self.scheduler = RecurrenceScheduler(
+            hass, self._async_reset_recurring, self.perf
+        )
 
         # Initialize member data from config entry
+        self.levels = LevelTable(
+            entry.data.get(
+                CONF_LEVEL_CONFIG, {CONF_POINTS_PER_LEVEL: DEFAULT_POINTS_PER_LEVEL}
+            )
+        )
         self._init_member_data()
 
+        # Precomputed attributes shared by all sensors of a member. Ages are
+        # recomputed once a day instead of on every state write.
+        self._profiles: dict[str, dict[str, Any]] = {}
+        self._birthdates: dict[str, date] = {}
+        for member_id in self.data["members"]:
+            self._build_profile(member_id)
+        self._unsub_midnight: CALLBACK_TYPE | None = async_track_time_change(
+            hass, self._async_midnight, hour=0, minute=0, second=0
+        )
+
     def _init_member_data(self) -> None:
         """Initialize member data structure."""
         members_data = {}
 
         for member in self.config_entry.data.get(CONF_MEMBERS, []):
-            member_id = member[CONF_MEMBER_ID]
-            members_data[member_id] = {
-                "points": 0,  # Will be loaded from state if available
-                "level": 0,
-                "points_to_next_level": self._get_points_per_level(),
-                "config": member,
-            }
+            members_data[member[CONF_MEMBER_ID]] = self._new_member_data(member)
 
         self.data = {
             "members": members_data,
@@ -61,41 +211,843 @@ class ChampDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ),
         }
 
+        # Task indexes: task_id -> task, task_id -> assigned member IDs (None
+        # for all members) and member_id -> task IDs in configuration order
+        self._tasks_by_id: dict[str, dict[str, Any]] = {}
+        self._task_assignees: dict[str, frozenset[str] | None] = {}
+        self._member_tasks: dict[str, dict[str, None]] = {
+            member_id: {} for member_id in members_data
+        }
+        for task in self.data["tasks"]:
+            self._index_task(task)
+
+        self._rewards_by_id: dict[str, dict[str, Any]] = {
+            reward[CONF_REWARD_ID]: reward
+            for reward in self.config_entry.data.get(CONF_REWARDS, [])
+        }
+
+    def _new_member_data(self, member: dict[str, Any]) -> dict[str, Any]:
+        """Return the initial data of a member."""
+        return {
+            "points": 0,  # Loaded from storage in async_load
+            "level": 0,
+            "points_to_next_level": self.levels.points_to_next_level(0),
+            "config": member,
+        }
+
+    @staticmethod
+    def _assignees(task: dict[str, Any]) -> frozenset[str] | None:
+        """Return the member IDs a task is assigned to, None for all."""
+        assigned_to = task.get(CONF_TASK_ASSIGNED_TO, ["all"])
+        if "all" in assigned_to:
+            return None
+        return frozenset(assigned_to)
+
+    @callback
+    def _index_task(self, task: dict[str, Any]) -> None:
+        """Add a task to the task indexes."""
+        task_id = task[CONF_TASK_ID]
+        assignees = self._assignees(task)
+        self._tasks_by_id[task_id] = task
+        self._task_assignees[task_id] = assignees
+
+        for member_id, member_tasks in self._member_tasks.items():
+            if assignees is None or member_id in assignees:
+                member_tasks[task_id] = None
+
+    @callback
+    def _unindex_task(self, task_id: str) -> None:
+        """Remove a task from the task indexes."""
+        self._tasks_by_id.pop(task_id, None)
+        assignees = self._task_assignees.pop(task_id, None)
+
+        member_ids = self._member_tasks if assignees is None else assignees
+        for member_id in member_ids:
+            self._member_tasks.get(member_id, {}).pop(task_id, None)
+
+    @callback
+    @profiled(PERF_RECONCILE)
+    def async_reconcile(self) -> None:
+        """Apply a changed configuration entry without reloading.
+
+        Members, tasks and the level configuration are diffed against the
+        current state. Entities are only added for new members and task
+        assignments, removed for deleted ones and updated in place for
+        changed ones, so points and untouched entities are kept.
+        """
+        started = time.perf_counter()
+        entry = self.config_entry
+        self._async_apply_options()
+
+        # Switch entities before the change, as (member_id, task_id) pairs
+        old_switches = {
+            (member_id, task_id)
+            for member_id, task_ids in self._member_tasks.items()
+            for task_id in task_ids
+        }
+
+        # Members
+        members = {
+            member[CONF_MEMBER_ID]: member
+            for member in entry.data.get(CONF_MEMBERS, [])
+        }
+        removed_members = [
+            member_id for member_id in self.data["members"] if member_id not in members
+        ]
+        added_members = [
+            member_id for member_id in members if member_id not in self.data["members"]
+        ]
+        changed_members = [
+            member_id
+            for member_id, member in members.items()
+            if member_id in self.data["members"]
+            and member != self.data["members"][member_id]["config"]
+        ]
+
+        for member_id in removed_members:
+            for item_id in self.approvals.select(member_id=member_id):
+                self.approvals.pop(item_id)
+            del self.data["members"][member_id]
+            del self._member_tasks[member_id]
+            self.streaks.remove_member(member_id)
+            self.stats.remove_member(member_id)
+            self.leaderboard.remove(member_id)
+            self.notifier.async_remove_member(member_id)
+            self._profiles.pop(member_id, None)
+            self._birthdates.pop(member_id, None)
+
+        for member_id in added_members:
+            self.data["members"][member_id] = self._new_member_data(members[member_id])
+            self._member_tasks[member_id] = {
+                task_id: None
+                for task_id, assignees in self._task_assignees.items()
+                if assignees is None or member_id in assignees
+            }
+            self._build_profile(member_id)
+
+        for member_id in changed_members:
+            self.data["members"][member_id]["config"] = members[member_id]
+            self._build_profile(member_id)
+
+        # Tasks
+        tasks = {task[CONF_TASK_ID]: task for task in entry.data.get(CONF_TASKS, [])}
+        changed_tasks = [
+            task_id
+            for task_id, task in tasks.items()
+            if task_id in self._tasks_by_id and task != self._tasks_by_id[task_id]
+        ]
+        removed_tasks = [
+            task_id for task_id in self._tasks_by_id if task_id not in tasks
+        ]
+        recurrence_changed = {
+            task_id
+            for task_id in changed_tasks
+            if self._recurrence(self._tasks_by_id[task_id])
+            != self._recurrence(tasks[task_id])
+        }
+        for task_id in removed_tasks + changed_tasks:
+            self._unindex_task(task_id)
+        for task_id in removed_tasks:
+            self.streaks.remove_task(task_id)
+        for task_id, task in tasks.items():
+            if task_id not in self._tasks_by_id:
+                self._index_task(task)
+        self.data["tasks"] = list(tasks.values())
+
+        # Rewards have no entities, the catalog is replaced as a whole
+        self._rewards_by_id = {
+            reward[CONF_REWARD_ID]: reward
+            for reward in entry.data.get(CONF_REWARDS, [])
+        }
+
+        # Level configuration
+        level_config = entry.data.get(
+            CONF_LEVEL_CONFIG, {CONF_POINTS_PER_LEVEL: DEFAULT_POINTS_PER_LEVEL}
+        )
+        levels_changed = level_config != self.data["level_config"]
+        if levels_changed:
+            self.data["level_config"] = level_config
+            self.levels = LevelTable(level_config)
+            for member_id, member_data in self.data["members"].items():
+                self._set_member_points(member_id, member_data["points"])
+
+        new_switches = {
+            (member_id, task_id)
+            for member_id, task_ids in self._member_tasks.items()
+            for task_id in task_ids
+        }
+
+        # Forget completions of removed assignments and of tasks whose
+        # recurrence changed
+        for key, _ in self.scheduler:
+            if key not in new_switches:
+                self.scheduler.async_cancel(key)
+            elif key[1] in recurrence_changed:
+                self.scheduler.async_cancel(key)
+                self._async_update_scoped_listeners((SCOPE_ASSIGNMENT, *key))
+
+        # Remove entities of deleted members and task assignments
+        self._async_remove_entities(
+            removed_members,
+            [
+                pair
+                for pair in old_switches - new_switches
+                if pair[0] not in removed_members
+            ],
+        )
+
+        # Update entities of changed members and tasks in place
+        device_registry = dr.async_get(self.hass)
+        for member_id in changed_members:
+            if device := device_registry.async_get_device(
+                identifiers={(DOMAIN, member_id)}
+            ):
+                device_registry.async_update_device(
+                    device.id, name=members[member_id][CONF_MEMBER_NAME]
+                )
+            self._async_update_scoped_listeners((SCOPE_PROFILE, member_id))
+        for task_id in changed_tasks:
+            self._async_update_scoped_listeners((SCOPE_TASK, task_id))
+        if levels_changed:
+            for member_id in self.data["members"]:
+                self.async_update_member_listeners(member_id)
+
+        # Names, levels and the set of members are shown on the leaderboard
+        for member_id in added_members:
+            self.leaderboard.update(member_id, self._ranking_scores(member_id))
+        if added_members or removed_members or changed_members or levels_changed:
+            self.async_update_leaderboard_listeners()
+
+        # Add entities for new members and task assignments
+        if added_members:
+            async_dispatcher_send(
+                self.hass,
+                SIGNAL_MEMBERS_ADDED.format(entry_id=entry.entry_id),
+                added_members,
+            )
+        if added_switches := sorted(new_switches - old_switches):
+            async_dispatcher_send(
+                self.hass,
+                SIGNAL_TASKS_ADDED.format(entry_id=entry.entry_id),
+                added_switches,
+            )
+
+        if removed_members or added_members:
+            self.storage.async_schedule_save(self._storage_data)
+            self.async_update_approval_listeners()
+
+        _LOGGER.debug(
+            "Reconciled CHAMP config: members %d added, %d removed, %d changed; "
+            "tasks %d removed, %d changed; switches %d added, %d removed",
+            len(added_members),
+            len(removed_members),
+            len(changed_members),
+            len(removed_tasks),
+            len(changed_tasks),
+            len(new_switches - old_switches),
+            len(old_switches - new_switches),
+        )
+        self.perf.record(PERF_RECONCILE, started)
+
+    @callback
+    def _async_remove_entities(
+        self, member_ids: list[str], switches: list[tuple[str, str]]
+    ) -> None:
+        """Remove the devices of members and single task switches."""
+        device_registry = dr.async_get(self.hass)
+        for member_id in member_ids:
+            if device := device_registry.async_get_device(
+                identifiers={(DOMAIN, member_id)}
+            ):
+                device_registry.async_update_device(
+                    device.id, remove_config_entry_id=self.config_entry.entry_id
+                )
+
+        entity_registry = er.async_get(self.hass)
+        for member_id, task_id in switches:
+            if entity_id := entity_registry.async_get_entity_id(
+                "switch", DOMAIN, f"{DOMAIN}_{member_id}_{task_id}"
+            ):
+                entity_registry.async_remove(entity_id)
+
+    @callback
+    def _async_apply_options(self) -> None:
+        """Apply options that can change at runtime."""
+        options = self.config_entry.options
+        self._recent_completions.ttl = options.get(
+            CONF_COMPLETION_DEBOUNCE, DEFAULT_COMPLETION_DEBOUNCE
+        )
+        self.notifier.window = options.get(
+            CONF_NOTIFICATION_WINDOW, DEFAULT_NOTIFICATION_WINDOW
+        )
+
+    async def async_load(self) -> None:
+        """Load persisted member balances.
+
+        Balances come from the store, or from the ledger snapshot if that is
+        newer. Ledger events recorded after that point are replayed on top.
+        Streaks and statistics are only stored with the balances, so they
+        replay everything recorded after the store, including the events
+        covered by a newer snapshot.
+        """
+        stored = await self.storage.async_load()
+        snapshot, tail = await self.ledger.async_load()
+
+        balances = {
+            member_id: member_state.get("points", 0)
+            for member_id, member_state in stored.get("members", {}).items()
+        }
+        stored_seq = base_seq = stored.get("ledger_seq", 0)
+        missed: list[dict[str, Any]] = []
+        if snapshot is not None and snapshot["seq"] > base_seq:
+            balances = dict(snapshot["balances"])
+            base_seq = snapshot["seq"]
+            missed = await self.ledger.async_read(
+                lambda events: list(
+                    takewhile(lambda event: event["seq"] <= base_seq, events)
+                ),
+                stored_seq,
+            )
+
+        self.ledger.async_advance_seq(base_seq)
+
+        self.streaks.load(
+            row for row in stored.get("streaks", []) if row[0] in self.data["members"]
+        )
+
+        self.stats.load(
+            {
+                member_id: periods
+                for member_id, periods in stored.get("stats", {}).items()
+                if member_id in self.data["members"]
+            }
+        )
+
+        for event in missed:
+            self._record_event_stats(event)
+
+        replayed = len(missed)
+        for event in tail:
+            if event["seq"] > base_seq:
+                apply_event(balances, event)
+                self._record_event_stats(event)
+                replayed += 1
+
+        for member_id, points in balances.items():
+            if member_id in self.data["members"]:
+                self._set_member_points(member_id, points)
+
+        # Break streaks that were not continued while stopped
+        today = dt_util.now().date()
+        self.streaks.roll_over(today)
+        self.stats.roll_over(today)
+
+        for member_id in self.data["members"]:
+            self.leaderboard.update(member_id, self._ranking_scores(member_id))
+
+        for record in stored.get("redemptions", []):
+            self._redemptions[record["id"]] = record
+        self.approvals.load(
+            item
+            for item in stored.get("approvals", [])
+            if item["member"] in self.data["members"]
+        )
+
+        # Resets that became due while stopped fire right away
+        for member_id, task_id, due in stored.get("recurring", []):
+            task = self.get_task(task_id)
+            if (
+                task is not None
+                and self._recurrence(task) != RECURRENCE_NONE
+                and self.is_task_assigned(task_id, member_id)
+            ):
+                self.scheduler.async_schedule(
+                    (member_id, task_id), dt_util.parse_datetime(due)
+                )
+
+        if replayed:
+            self.storage.async_schedule_save(self._storage_data)
+
+        _LOGGER.debug(
+            "Loaded CHAMP state for %d members, replayed %d ledger events",
+            len(self.data["members"]),
+            replayed,
+        )
+
+    @timed(PERF_REFRESH)
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Update data via library.
+
+        Only called on the first refresh and, if configured, on the
+        reconciliation interval. There is no external source yet.
+        """
+        return self.data
+
+    def _build_profile(self, member_id: str) -> None:
+        """Precompute the shared attributes of a member."""
+        member_config = self.data["members"][member_id]["config"]
+        profile: dict[str, Any] = {
+            "member_id": member_id,
+            "member_name": member_config[CONF_MEMBER_NAME],
+        }
+
+        birthdate = parse_birthdate(member_config.get(CONF_MEMBER_BIRTHDATE))
+        if birthdate is not None:
+            self._birthdates[member_id] = birthdate
+            profile["birthdate"] = birthdate.isoformat()
+            profile["age"] = age_on(birthdate, dt_util.now().date())
+        else:
+            self._birthdates.pop(member_id, None)
+
+        self._profiles[member_id] = profile
+
+    def get_member_attributes(self, member_id: str) -> dict[str, Any]:
+        """Return the precomputed attributes of a member."""
+        return self._profiles[member_id]
+
+    @callback
+    def _async_midnight(self, now: datetime) -> None:
+        """Update ages of members with a birthday today and roll over streaks."""
+        today = now.date()
+        changed = self.streaks.roll_over(today) | self.stats.roll_over(today)
+        if changed:
+            self.storage.async_schedule_save(self._storage_data)
+
+        for member_id, birthdate in self._birthdates.items():
+            age = age_on(birthdate, today)
+            if self._profiles[member_id]["age"] != age:
+                self._profiles[member_id]["age"] = age
+                changed.add(member_id)
+
+        for member_id in changed:
+            self.async_update_member_listeners(member_id)
+
+        # Period rankings restart with every new day, week and month
+        leaderboard_changed = False
+        for period in STATS_PERIODS:
+            leaderboard_changed |= self.leaderboard.rebuild(
+                period,
+                {
+                    member_id: self.get_member_stats(member_id, period).points
+                    for member_id in self.data["members"]
+                },
+            )
+        if leaderboard_changed:
+            self.async_update_leaderboard_listeners()
+
+    @callback
+    def _balances(self) -> dict[str, int]:
+        """Return the current points of all members."""
+        return {
+            member_id: member_data["points"]
+            for member_id, member_data in self.data["members"].items()
+        }
+
+    @callback
+    def _storage_data(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "members": {
+                member_id: {"points": points}
+                for member_id, points in self._balances().items()
+            },
+            "ledger_seq": self.ledger.last_seq,
+            "redemptions": list(self._redemptions.values()),
+            "approvals": self.approvals.as_list(),
+            "streaks": self.streaks.as_rows(),
+            "stats": self.stats.as_dict(),
+            "recurring": [
+                [member_id, task_id, due.isoformat()]
+                for (member_id, task_id), due in self.scheduler
+            ],
+        }
+
+    def export_header(self, fmt: str) -> dict[str, Any]:
+        """Return the configuration and state written ahead of exported events."""
+        entry = self.config_entry
+        return {
+            "version": EXPORT_VERSION,
+            "format": fmt,
+            "exported": dt_util.utcnow().isoformat(),
+            "last_seq": self.ledger.last_seq,
+            CONF_MEMBERS: entry.data.get(CONF_MEMBERS, []),
+            CONF_TASKS: entry.data.get(CONF_TASKS, []),
+            CONF_REWARDS: entry.data.get(CONF_REWARDS, []),
+            CONF_LEVEL_CONFIG: self.data["level_config"],
+            "balances": self._balances(),
+            "redemptions": [dict(record) for record in self._redemptions.values()],
+            "approvals": self.approvals.as_list(),
+        }
+
+    async def apply_import(self, imported: ImportedHistory) -> None:
+        """Replace configuration, state and ledger with an imported history.
+
+        Applied as a single command, so no other mutation interleaves with
+        the replacement. Members, tasks, rewards and levels are reconciled in
+        place; the ledger, balances, streaks, statistics, redemptions and
+        pending approvals are then replaced in one step, with a single save
+        and one update per member.
+        """
+        await self.commands.async_submit(self._async_apply_import, imported)
+
+    @callback
+    def _async_apply_import(self, changes: Changes, imported: ImportedHistory) -> None:
+        """Replace configuration and state with an imported history."""
+        self.ledger.async_replace(imported.last_seq)
+
+        header = imported.header
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            title=f"CHAMP ({len(header[CONF_MEMBERS])} members)",
+            data={
+                **self.config_entry.data,
+                CONF_MEMBERS: header[CONF_MEMBERS],
+                CONF_TASKS: header[CONF_TASKS],
+                CONF_REWARDS: header[CONF_REWARDS],
+                CONF_LEVEL_CONFIG: header[CONF_LEVEL_CONFIG],
+            },
+        )
+        self.async_reconcile()
+
+        members = self.data["members"]
+        self.streaks = imported.streaks
+        self.stats = imported.stats
+        for member_id in members:
+            self._set_member_points(member_id, imported.balances.get(member_id, 0))
+        self._redemptions = OrderedDict(
+            (record["id"], record) for record in header["redemptions"]
+        )
+        self.approvals.load(
+            item for item in header["approvals"] if item["member"] in members
+        )
+
+        # Done states of recurring tasks are not part of the history
+        for key, _ in self.scheduler:
+            self.scheduler.async_cancel(key)
+            self._async_update_scoped_listeners((SCOPE_ASSIGNMENT, *key))
+
+        scores = {member_id: self._ranking_scores(member_id) for member_id in members}
+        for name in self.leaderboard.rankings:
+            self.leaderboard.rebuild(
+                name, {member_id: scores[member_id][name] for member_id in scores}
+            )
+
+        # The rankings were rebuilt, so the commit sees no order change
+        self.async_update_leaderboard_listeners()
+        changes.members.update(members)
+        changes.approvals = True
+
+    async def async_handle_final_write(self, _event: Event) -> None:
+        """Flush the ledger when Home Assistant is shutting down."""
+        self.notifier.async_cancel()
+        await self.ledger.async_flush()
+
+    async def async_shutdown(self) -> None:
+        """Flush pending changes and shut down the coordinator.
+
+        Timers are cancelled and the ledger and storage are written before
+        any notification is sent, so a failing notification cannot leak
+        timers or lose changes.
+        """
+        self.commands.async_drain()
+        if self._unsub_midnight is not None:
+            self._unsub_midnight()
+            self._unsub_midnight = None
+        self.scheduler.async_stop()
+        await self.ledger.async_flush()
+        await self.storage.async_flush()
+        await self.notifier.async_flush()
+        await super().async_shutdown()
+
+    @callback
+    def _async_add_scoped_listener(
+        self, scope: tuple[str, ...], update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates of a single scope."""
+        listeners = self._scoped_listeners.setdefault(scope, {})
+        listeners[update_callback] = None
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the scoped listener."""
+            listeners.pop(update_callback, None)
+            if not listeners:
+                self._scoped_listeners.pop(scope, None)
+
+        return remove_listener
+
+    @callback
+    @profiled(PERF_STATE_WRITE)
+    def _async_update_scoped_listeners(self, scope: tuple[str, ...]) -> None:
+        """Notify the listeners of a single scope."""
+        listeners = list(self._scoped_listeners.get(scope, ()))
+        if not listeners:
+            return
+        started = time.perf_counter()
+        for update_callback in listeners:
+            update_callback()
+        self.perf.record(PERF_STATE_WRITE, started, len(listeners))
+
+    @callback
+    def async_add_member_listener(
+        self, member_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for points updates of a single member."""
+        return self._async_add_scoped_listener(
+            (SCOPE_MEMBER, member_id), update_callback
+        )
+
+    @callback
+    def async_update_member_listeners(self, member_id: str) -> None:
+        """Notify the listeners of a single member."""
+        self._async_update_scoped_listeners((SCOPE_MEMBER, member_id))
+
+    @callback
+    def async_add_profile_listener(
+        self, member_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for configuration updates of a single member."""
+        return self._async_add_scoped_listener(
+            (SCOPE_PROFILE, member_id), update_callback
+        )
+
+    @callback
+    def async_add_task_listener(
+        self, task_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for configuration updates of a single task."""
+        return self._async_add_scoped_listener((SCOPE_TASK, task_id), update_callback)
+
+    @callback
+    def async_add_assignment_listener(
+        self, member_id: str, task_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for the done state of a recurring task of a member."""
+        return self._async_add_scoped_listener(
+            (SCOPE_ASSIGNMENT, member_id, task_id), update_callback
+        )
+
+    @callback
+    def async_add_leaderboard_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of the leaderboard order."""
+        return self._async_add_scoped_listener(
+            (SCOPE_LEADERBOARD, self.config_entry.entry_id), update_callback
+        )
+
+    @callback
+    def async_update_leaderboard_listeners(self) -> None:
+        """Notify the listeners of the leaderboard."""
+        self._async_update_scoped_listeners(
+            (SCOPE_LEADERBOARD, self.config_entry.entry_id)
+        )
+
+    @callback
+    def async_add_approval_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of the approval queue."""
+        return self._async_add_scoped_listener(
+            (SCOPE_APPROVALS, self.config_entry.entry_id), update_callback
+        )
+
+    @callback
+    def async_update_approval_listeners(self) -> None:
+        """Notify the listeners of the approval queue."""
+        self._async_update_scoped_listeners(
+            (SCOPE_APPROVALS, self.config_entry.entry_id)
+        )
+
+    @callback
+    @profiled(PERF_STATE_WRITE)
+    def async_update_listeners(self) -> None:
+        """Notify all coordinator-wide listeners."""
+        started = time.perf_counter()
+        count = len(self._listeners)
+        super().async_update_listeners()
+        if count:
+            self.perf.record(PERF_STATE_WRITE, started, count)
+
+    @property
+    def state_writes(self) -> int:
+        """Return the number of entity state writes triggered by this entry."""
+        return self.perf.counter(PERF_STATE_WRITE).count
+
+    def get_sizes(self) -> dict[str, int]:
+        """Return the sizes of the data structures of this entry."""
+        return {
+            "members": len(self.data["members"]),
+            "tasks": len(self._tasks_by_id),
+            "task_switches": sum(
+                len(task_ids) for task_ids in self._member_tasks.values()
+            ),
+            "rewards": len(self._rewards_by_id),
+            "ledger_events": self.ledger.last_seq,
+            "ledger_events_since_snapshot": (
+                self.ledger.last_seq - self.ledger.snapshot_seq
+            ),
+            "ledger_buffered": self.ledger.buffered,
+            "redemptions": len(self._redemptions),
+            "pending_approvals": len(self.approvals),
+            "scheduled_resets": len(self.scheduler),
+            "scoped_listeners": sum(
+                len(listeners) for listeners in self._scoped_listeners.values()
+            ),
+            "recent_completions": len(self._recent_completions),
+            "idempotency_keys": len(self._idempotency_keys),
+            "pending_notifications": self.notifier.pending,
+            "queued_commands": len(self.commands),
+        }
+
     def _get_points_per_level(self) -> int:
         """Get points required per level."""
-        level_config = self.config_entry.data.get(CONF_LEVEL_CONFIG, {})
-        return level_config.get(CONF_POINTS_PER_LEVEL, DEFAULT_POINTS_PER_LEVEL)
+        return self.levels.points_per_level
 
     def get_member_points(self, member_id: str) -> int:
         """Get current points for a member."""
         return self.data["members"].get(member_id, {}).get("points", 0)
 
     def get_member_level(self, member_id: str) -> int:
-        """Calculate current level for a member."""
-        points = self.get_member_points(member_id)
-        points_per_level = self._get_points_per_level()
-        return points // points_per_level
+        """Get current level for a member."""
+        return self.data["members"].get(member_id, {}).get("level", 0)
 
     def get_points_to_next_level(self, member_id: str) -> int:
-        """Calculate points needed for next level."""
-        points = self.get_member_points(member_id)
-        points_per_level = self._get_points_per_level()
-        return points_per_level - (points % points_per_level)
+        """Get points needed for next level."""
+        return self.data["members"].get(member_id, {}).get("points_to_next_level", 0)
 
-    async def award_points(self, member_id: str, points: int) -> None:
-        """Award points to a member."""
-        if member_id not in self.data["members"]:
-            _LOGGER.error("Member ID %s not found", member_id)
+    def _set_member_points(self, member_id: str, points: int) -> None:
+        """Set the points of a member and update derived values."""
+        member_data = self.data["members"][member_id]
+        member_data["points"] = points
+        member_data["level"] = self.levels.level(points)
+        member_data["points_to_next_level"] = self.levels.points_to_next_level(points)
+
+    def get_member_name(self, member_id: str) -> str:
+        """Return the display name of a member."""
+        return self.data["members"][member_id]["config"][CONF_MEMBER_NAME]
+
+    def get_task(self, task_id: str) -> dict[str, Any] | None:
+        """Return the configuration of a task."""
+        return self._tasks_by_id.get(task_id)
+
+    def get_member_tasks(self, member_id: str) -> list[dict[str, Any]]:
+        """Return the tasks assigned to a member."""
+        return [
+            self._tasks_by_id[task_id]
+            for task_id in self._member_tasks.get(member_id, {})
+        ]
+
+    def is_task_assigned(self, task_id: str, member_id: str) -> bool:
+        """Return whether a task is assigned to a member."""
+        return task_id in self._member_tasks.get(member_id, {})
+
+    @staticmethod
+    def _recurrence(task: dict[str, Any]) -> str:
+        """Return the recurrence of a task."""
+        return task.get(CONF_TASK_RECURRENCE, RECURRENCE_NONE)
+
+    def is_task_done(self, member_id: str, task_id: str) -> bool:
+        """Return whether a recurring task is done until its next reset."""
+        return (member_id, task_id) in self.scheduler
+
+    @callback
+    def _mark_done(self, member_id: str, task_id: str) -> None:
+        """Mark a recurring task done until its next reset."""
+        due = next_reset(self._recurrence(self._tasks_by_id[task_id]), dt_util.utcnow())
+        if due is None:
+            return
+        self.scheduler.async_schedule((member_id, task_id), due)
+        self._async_update_scoped_listeners((SCOPE_ASSIGNMENT, member_id, task_id))
+
+    @callback
+    def _async_reset_recurring(self, keys: list[ResetKey]) -> None:
+        """Reset recurring tasks that are due, in one pass."""
+        for key in keys:
+            self._async_update_scoped_listeners((SCOPE_ASSIGNMENT, *key))
+        self.storage.async_schedule_save(self._storage_data)
+
+    def get_reward(self, reward_id: str) -> dict[str, Any] | None:
+        """Return the configuration of a reward."""
+        return self._rewards_by_id.get(reward_id)
+
+    def get_rewards(self) -> list[dict[str, Any]]:
+        """Return the reward catalog."""
+        return list(self._rewards_by_id.values())
+
+    def get_redemptions(self, member_id: str | None = None) -> list[dict[str, Any]]:
+        """Return the redemption records, optionally of a single member."""
+        return [
+            record
+            for record in self._redemptions.values()
+            if member_id is None or record["member"] == member_id
+        ]
+
+    def _task_category(self, task_id: str | None) -> str | None:
+        """Return the category of a task."""
+        task = self.get_task(task_id) if task_id else None
+        return task.get(CONF_TASK_CATEGORY) if task else None
+
+    @callback
+    def _record_event_stats(self, event: dict[str, Any]) -> None:
+        """Update streaks and statistics from a replayed ledger event."""
+        if (
+            event["type"] not in (EVENT_AWARD, EVENT_COMPLETE)
+            or event["member"] not in self.data["members"]
+        ):
             return
+        day = dt_util.as_local(dt_util.parse_datetime(event["ts"])).date()
+        if event["type"] == EVENT_COMPLETE:
+            self.streaks.record(event["member"], event["task"], day)
+        if event["delta"] > 0:
+            self.stats.record(
+                event["member"],
+                day,
+                event["delta"],
+                event["task"],
+                self._task_category(event["task"]),
+            )
 
-        current_points = self.data["members"][member_id]["points"]
-        new_points = current_points + points
+    def get_member_stats(self, member_id: str, period: str) -> Bucket:
+        """Return the statistics of a member for the current period."""
+        return self.stats.get(member_id, period, dt_util.now().date())
+
+    def _resolve_award(self, item: dict[str, Any]) -> tuple[str, int, str | None]:
+        """Validate an award item and return (member_id, points, task_id)."""
+        member_id = item[ATTR_MEMBER_ID]
+        if member_id not in self.data["members"]:
+            raise HomeAssistantError(f"Member ID {member_id} not found")
 
-        self.data["members"][member_id]["points"] = new_points
-        self.data["members"][member_id]["level"] = self.get_member_level(member_id)
-        self.data["members"][member_id]["points_to_next_level"] = (
-            self.get_points_to_next_level(member_id)
+        task_id = item.get(ATTR_TASK_ID)
+        if task_id is None:
+            return member_id, item[ATTR_POINTS], None
+
+        task = self.get_task(task_id)
+        if task is None:
+            raise HomeAssistantError(f"Task ID {task_id} not found")
+        if not self.is_task_assigned(task_id, member_id):
+            raise HomeAssistantError(
+                f"Task {task_id} is not assigned to member {member_id}"
+            )
+        return member_id, task[CONF_TASK_POINTS], task_id
+
+    @callback
+    def _apply_award(
+        self, member_id: str, points: int, task_id: str | None = None
+    ) -> None:
+        """Add points to a member without notifying listeners."""
+        new_points = self.data["members"][member_id]["points"] + points
+        self._set_member_points(member_id, new_points)
+        self.ledger.async_append(
+            EVENT_COMPLETE if task_id else EVENT_AWARD, member_id, points, task_id
         )
+        today = dt_util.now().date()
+        if task_id:
+            self.streaks.record(member_id, task_id, today)
+        if points > 0:
+            self.stats.record(
+                member_id, today, points, task_id, self._task_category(task_id)
+            )
 
         _LOGGER.debug(
             "Awarded %d points to %s. New total: %d",
@@ -104,28 +1056,432 @@ class ChampDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             new_points,
         )
 
-        # Notify all listeners
-        await self.async_refresh()
+    @callback
+    def _async_commit(self, member_ids: set[str]) -> None:
+        """Persist changes and notify the entities of the changed members."""
+        self.storage.async_schedule_save(self._storage_data)
+
+        # Only the entities of these members depend on their points
+        leaderboard_changed = False
+        for member_id in member_ids:
+            self.async_update_member_listeners(member_id)
+            leaderboard_changed |= self.leaderboard.update(
+                member_id, self._ranking_scores(member_id)
+            )
+
+        # The leaderboard is only written when the order changes
+        if leaderboard_changed:
+            self.async_update_leaderboard_listeners()
+
+    @callback
+    def _async_commit_changes(self, changes: Changes) -> None:
+        """Commit the changes of a batch of commands."""
+        self._async_commit(changes.members)
+        if changes.approvals:
+            self.async_update_approval_listeners()
+        self.async_notify_completions(changes.completions)
+
+    def _ranking_scores(self, member_id: str) -> dict[str, int]:
+        """Return the scores of a member in every ranking."""
+        scores = {RANKING_TOTAL: self.get_member_points(member_id)}
+        for period in STATS_PERIODS:
+            scores[period] = self.get_member_stats(member_id, period).points
+        return scores
+
+    @timed(PERF_AWARD)
+    async def award_points(
+        self, member_id: str, points: int, task_id: str | None = None
+    ) -> None:
+        """Award points to a member, optionally for completing a task."""
+        await self.commands.async_submit(self._async_award, member_id, points, task_id)
+
+    @callback
+    def _async_award(
+        self, changes: Changes, member_id: str, points: int, task_id: str | None
+    ) -> None:
+        """Award points to a member."""
+        if member_id not in self.data["members"]:
+            _LOGGER.error("Member ID %s not found", member_id)
+            return
+
+        self._apply_award(member_id, points, task_id)
+        changes.members.add(member_id)
+
+    @timed(PERF_COMPLETE)
+    async def complete_task(
+        self, member_id: str, task_id: str, idempotency_key: str | None = None
+    ) -> bool:
+        """Complete a task for a member.
+
+        Returns False if the completion was rejected as a duplicate, either
+        because the idempotency key was already used or because the same task
+        was completed by the same member within the debounce window.
+        Completions of tasks requiring approval are queued instead of booked.
+        """
+        return await self.commands.async_submit(
+            self._async_complete, member_id, task_id, idempotency_key
+        )
+
+    @callback
+    def _async_complete(
+        self,
+        changes: Changes,
+        member_id: str,
+        task_id: str,
+        idempotency_key: str | None,
+    ) -> bool:
+        """Complete a task for a member."""
+        member_id, points, _ = self._resolve_award(
+            {ATTR_MEMBER_ID: member_id, ATTR_TASK_ID: task_id}
+        )
+        if self.is_task_done(member_id, task_id):
+            _LOGGER.debug("Task %s is already done by %s", task_id, member_id)
+            return False
+
+        approval_required = self._requires_approval(task_id)
+        if approval_required:
+            self._async_check_queue_capacity(1)
+
+        if idempotency_key is not None and not self._idempotency_keys.add(
+            idempotency_key
+        ):
+            _LOGGER.debug("Ignoring repeated idempotency key %s", idempotency_key)
+            return False
+
+        if not self._recent_completions.add((member_id, task_id)):
+            _LOGGER.debug(
+                "Ignoring duplicate completion of %s by %s", task_id, member_id
+            )
+            return False
+
+        if approval_required:
+            self._enqueue_approval(APPROVAL_TASK, member_id, points, task=task_id)
+            self._mark_done(member_id, task_id)
+            changes.approvals = True
+            return True
+
+        self._apply_award(member_id, points, task_id)
+        self._mark_done(member_id, task_id)
+        changes.members.add(member_id)
+        changes.completions.append((member_id, task_id, points))
+        return True
+
+    @timed(PERF_BATCH)
+    async def award_batch(self, items: list[dict[str, Any]]) -> None:
+        """Apply a batch of awards and task completions atomically.
+
+        All items are validated before anything is applied. The batch results
+        in a single storage save, one update per affected member and one
+        notification. Completions of tasks requiring approval are queued.
+        """
+        await self.commands.async_submit(self._async_award_batch, items)
+
+    @callback
+    def validate_batch(
+        self, items: list[dict[str, Any]]
+    ) -> tuple[list[tuple[str, int, str | None]], list[tuple[str, int, str]]]:
+        """Validate a batch and return its (awards, queued completions).
+
+        Raises without changing anything if any item of the batch is invalid.
+        Like complete_task, completions of recurring tasks that are already
+        done, or completed earlier in the batch, are skipped.
+        """
+        awards: list[tuple[str, int, str | None]] = []
+        queued: list[tuple[str, int, str]] = []
+        done: set[tuple[str, str]] = set()
+        for item in items:
+            member_id, points, task_id = self._resolve_award(item)
+            if task_id is None:
+                awards.append((member_id, points, None))
+                continue
+            if (member_id, task_id) in done or self.is_task_done(member_id, task_id):
+                _LOGGER.debug("Task %s is already done by %s", task_id, member_id)
+                continue
+            if self._recurrence(self._tasks_by_id[task_id]) != RECURRENCE_NONE:
+                done.add((member_id, task_id))
+            if self._requires_approval(task_id):
+                queued.append((member_id, points, task_id))
+            else:
+                awards.append((member_id, points, task_id))
+        self._async_check_queue_capacity(len(queued))
+        return awards, queued
+
+    @callback
+    def _async_award_batch(self, changes: Changes, items: list[dict[str, Any]]) -> None:
+        """Apply a batch of awards and task completions."""
+        awards, queued = self.validate_batch(items)
+
+        for member_id, points, task_id in awards:
+            self._apply_award(member_id, points, task_id)
+        for member_id, points, task_id in queued:
+            self._enqueue_approval(APPROVAL_TASK, member_id, points, task=task_id)
+        for member_id, task_id in dict.fromkeys(
+            (member_id, task_id)
+            for member_id, _, task_id in awards + queued
+            if task_id is not None
+        ):
+            self._mark_done(member_id, task_id)
+
+        changes.members.update(member_id for member_id, _, _ in awards)
+        changes.approvals |= bool(queued)
+        changes.completions.extend(
+            (member_id, task_id, points)
+            for member_id, points, task_id in awards
+            if task_id is not None
+        )
 
+        _LOGGER.info(
+            "Applied batch of %d awards, %d queued for approval",
+            len(awards),
+            len(queued),
+        )
+
+    @timed(PERF_RESET)
     async def reset_points(self, member_id: str) -> None:
         """Reset points for a member."""
+        await self.commands.async_submit(self._async_reset, member_id)
+
+    @callback
+    def _async_reset(self, changes: Changes, member_id: str) -> None:
+        """Reset the points of a member."""
         if member_id not in self.data["members"]:
             _LOGGER.error("Member ID %s not found", member_id)
             return
 
-        self.data["members"][member_id]["points"] = 0
-        self.data["members"][member_id]["level"] = 0
-        self.data["members"][member_id][
-            "points_to_next_level"
-        ] = self._get_points_per_level()
+        previous_points = self.data["members"][member_id]["points"]
+        self._set_member_points(member_id, 0)
+        self.ledger.async_append(EVENT_RESET, member_id, -previous_points)
 
         _LOGGER.info("Reset points for member %s", member_id)
 
-        # Notify all listeners
-        await self.async_refresh()
+        changes.members.add(member_id)
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via library."""
-        # For now, we just return the current data
-        # In future phases, this could sync with external storage
-        return self.data
+    @timed(PERF_REDEEM)
+    async def redeem_reward(self, member_id: str, reward_id: str) -> dict[str, Any]:
+        """Redeem a reward for a member and return the redemption record.
+
+        The balance check and the deduction happen in one command, so
+        concurrent redemptions cannot spend the same points twice.
+        Redemptions of rewards requiring approval are recorded as pending;
+        their points are reserved until the redemption is decided.
+        """
+        return await self.commands.async_submit(
+            self._async_redeem, member_id, reward_id
+        )
+
+    @callback
+    def _async_redeem(
+        self, changes: Changes, member_id: str, reward_id: str
+    ) -> dict[str, Any]:
+        """Redeem a reward for a member."""
+        if member_id not in self.data["members"]:
+            raise HomeAssistantError(f"Member ID {member_id} not found")
+        reward = self.get_reward(reward_id)
+        if reward is None:
+            raise HomeAssistantError(f"Reward ID {reward_id} not found")
+
+        cost = reward[CONF_REWARD_COST]
+        approval_required = bool(reward.get(CONF_REWARD_APPROVAL_REQUIRED))
+        if approval_required:
+            self._async_check_queue_capacity(1)
+
+        points = self.get_member_points(member_id)
+        if points < cost:
+            raise HomeAssistantError(
+                f"Member {member_id} has {points} points, "
+                f"reward {reward_id} costs {cost}"
+            )
+
+        self._set_member_points(member_id, points - cost)
+        event = self.ledger.async_append(
+            EVENT_REDEEM, member_id, -cost, reward_id=reward_id
+        )
+        record = {
+            "id": uuid.uuid4().hex[:12],
+            "member": member_id,
+            "reward": reward_id,
+            "cost": cost,
+            "ts": event["ts"],
+            "status": (
+                REDEMPTION_PENDING if approval_required else REDEMPTION_FULFILLED
+            ),
+        }
+        self._add_redemption(record)
+        if approval_required:
+            self._enqueue_approval(
+                APPROVAL_REWARD,
+                member_id,
+                cost,
+                reward=reward_id,
+                redemption=record["id"],
+            )
+        changes.members.add(member_id)
+        changes.approvals |= approval_required
+
+        _LOGGER.info(
+            "Member %s redeemed %s for %d points (%s)",
+            member_id,
+            reward_id,
+            cost,
+            record["status"],
+        )
+        return record
+
+    @callback
+    def _add_redemption(self, record: dict[str, Any]) -> None:
+        """Add a redemption record, dropping the oldest completed ones."""
+        self._redemptions[record["id"]] = record
+
+        excess = len(self._redemptions) - REDEMPTION_HISTORY_SIZE
+        if excess <= 0:
+            return
+        for redemption_id in [
+            redemption_id
+            for redemption_id, old in self._redemptions.items()
+            if old["status"] != REDEMPTION_PENDING
+        ][:excess]:
+            del self._redemptions[redemption_id]
+
+    def _requires_approval(self, task_id: str) -> bool:
+        """Return whether completions of a task need approval."""
+        return bool(self._tasks_by_id[task_id].get(CONF_TASK_APPROVAL_REQUIRED))
+
+    @callback
+    def _async_check_queue_capacity(self, count: int) -> None:
+        """Raise if the approval queue cannot take count more items."""
+        if len(self.approvals) + count > self.approvals.maxsize:
+            raise HomeAssistantError(
+                f"Approval queue is full ({self.approvals.maxsize} pending items)"
+            )
+
+    @callback
+    def _enqueue_approval(
+        self, kind: str, member_id: str, points: int, **refs: str
+    ) -> dict[str, Any]:
+        """Queue a completion or redemption for approval."""
+        item = {
+            "id": uuid.uuid4().hex[:12],
+            "kind": kind,
+            "member": member_id,
+            "points": points,
+            "ts": dt_util.utcnow().isoformat(),
+            **refs,
+        }
+        self.approvals.add(item)
+        _LOGGER.debug("Queued %s of %s for approval", kind, member_id)
+        return item
+
+    @timed(PERF_DECIDE)
+    async def approve_pending(
+        self, item_ids: list[str] | None = None, member_id: str | None = None
+    ) -> int:
+        """Approve pending items and return how many were approved.
+
+        Approved task completions are booked, approved redemptions are
+        fulfilled. Without filters the whole queue is approved.
+        """
+        return await self.commands.async_submit(
+            self._async_decide, True, item_ids, member_id
+        )
+
+    @timed(PERF_DECIDE)
+    async def reject_pending(
+        self, item_ids: list[str] | None = None, member_id: str | None = None
+    ) -> int:
+        """Reject pending items and return how many were rejected.
+
+        Rejected task completions are dropped, the points reserved by rejected
+        redemptions are refunded. Without filters the whole queue is rejected.
+        """
+        return await self.commands.async_submit(
+            self._async_decide, False, item_ids, member_id
+        )
+
+    @callback
+    def _async_decide(
+        self,
+        changes: Changes,
+        approve: bool,
+        item_ids: list[str] | None,
+        member_id: str | None,
+    ) -> int:
+        """Decide on pending items in a single command.
+
+        However many items are decided, this results in one storage save, one
+        update per affected member and one notification per member.
+        """
+        selected = self.approvals.select(item_ids, member_id)
+        if not selected:
+            return 0
+
+        for item_id in selected:
+            item = self.approvals.pop(item_id)
+            assert item is not None
+            item_member_id = item["member"]
+
+            if item["kind"] == APPROVAL_TASK:
+                if approve:
+                    self._apply_award(item_member_id, item["points"], item["task"])
+                    changes.completions.append(
+                        (item_member_id, item["task"], item["points"])
+                    )
+                    changes.members.add(item_member_id)
+                continue
+
+            record = self._redemptions.get(item["redemption"])
+            if approve:
+                if record is not None:
+                    record["status"] = REDEMPTION_FULFILLED
+                continue
+
+            # Refund the points reserved by the redemption
+            self._set_member_points(
+                item_member_id, self.get_member_points(item_member_id) + item["points"]
+            )
+            self.ledger.async_append(
+                EVENT_REFUND, item_member_id, item["points"], reward_id=item["reward"]
+            )
+            if record is not None:
+                record["status"] = REDEMPTION_REJECTED
+            changes.members.add(item_member_id)
+
+        changes.approvals = True
+
+        _LOGGER.info(
+            "%s %d pending items", "Approved" if approve else "Rejected", len(selected)
+        )
+        return len(selected)
+
+    @callback
+    def async_notify_completions(self, completions: list[tuple[str, str, int]]) -> None:
+        """Queue notifications for (member_id, task_id, points) completions."""
+        for member_id, task_id, points in completions:
+            self.notifier.async_add(member_id, task_id, points)
+
+    @callback
+    def _completion_message(
+        self, member_id: str, completions: list[tuple[str, int]]
+    ) -> str:
+        """Build the summary message for completions of a member."""
+        counts: dict[str, list[int]] = {}
+        for task_id, points in completions:
+            count_points = counts.setdefault(task_id, [0, 0])
+            count_points[0] += 1
+            count_points[1] += points
+
+        lines = []
+        for task_id, (count, points) in counts.items():
+            task = self.get_task(task_id)
+            task_name = task[CONF_TASK_NAME] if task else task_id
+            if count > 1:
+                task_name = f"{task_name} ({count}x)"
+            lines.append(
+                f"{self.get_member_name(member_id)} hat {points} Punkte "
+                f"für {task_name} verdient!"
+            )
+
+        lines.append(
+            f"Gesamt: {self.get_member_points(member_id)} Punkte "
+            f"(Level {self.get_member_level(member_id)})"
+        )
+        return "\n".join(lines)
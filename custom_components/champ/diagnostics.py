@@ -0,0 +1,31 @@
+"""Diagnostics support for CHAMP integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_MEMBER_BIRTHDATE, CONF_MEMBER_NAME, DOMAIN
+from .coordinator import ChampDataCoordinator
+
+TO_REDACT = {CONF_MEMBER_NAME, CONF_MEMBER_BIRTHDATE}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ChampDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "performance": coordinator.perf.as_dict(),
+        "sizes": coordinator.get_sizes(),
+    }
@@ -0,0 +1,378 @@
+"""History export and import for CHAMP integration."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import shutil
+from collections.abc import Iterator
+from datetime import date
+from itertools import islice, takewhile
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_LEVEL_CONFIG,
+    CONF_MEMBER_ID,
+    CONF_MEMBER_NAME,
+    CONF_MEMBERS,
+    CONF_REWARD_COST,
+    CONF_REWARD_ID,
+    CONF_REWARDS,
+    CONF_TASK_CATEGORY,
+    CONF_TASK_ID,
+    CONF_TASK_POINTS,
+    CONF_TASKS,
+    EXPORT_CHUNK_SIZE,
+    EXPORT_DIR,
+    EXPORT_FORMAT_COLUMNAR,
+    EXPORT_FORMAT_JSONL,
+    EXPORT_FORMATS,
+    EXPORT_VERSION,
+)
+from .ledger import (
+    EVENT_AWARD,
+    EVENT_COMPLETE,
+    EVENT_REDEEM,
+    EVENT_REFUND,
+    EVENT_RESET,
+    SNAPSHOT_FILE,
+    apply_event,
+    archive_name,
+)
+from .stats import StatsTracker
+from .streaks import StreakTracker
+
+if TYPE_CHECKING:
+    from .coordinator import ChampDataCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Columns of the columnar format, in event key order
+COLUMNS = ("seq", "ts", "type", "member", "task", "delta", "reward")
+
+_EVENT_TYPES = [EVENT_AWARD, EVENT_COMPLETE, EVENT_RESET, EVENT_REDEEM, EVENT_REFUND]
+
+HEADER_SCHEMA = vol.Schema(
+    {
+        vol.Required("version"): vol.In([EXPORT_VERSION]),
+        vol.Required("format"): vol.In(EXPORT_FORMATS),
+        vol.Required("exported"): str,
+        vol.Required("last_seq"): vol.All(int, vol.Range(min=0)),
+        vol.Required(CONF_MEMBERS): [
+            vol.Schema(
+                {
+                    vol.Required(CONF_MEMBER_ID): str,
+                    vol.Required(CONF_MEMBER_NAME): str,
+                },
+                extra=vol.ALLOW_EXTRA,
+            )
+        ],
+        vol.Required(CONF_TASKS): [
+            vol.Schema(
+                {
+                    vol.Required(CONF_TASK_ID): str,
+                    vol.Required(CONF_TASK_POINTS): int,
+                },
+                extra=vol.ALLOW_EXTRA,
+            )
+        ],
+        vol.Required(CONF_REWARDS): [
+            vol.Schema(
+                {
+                    vol.Required(CONF_REWARD_ID): str,
+                    vol.Required(CONF_REWARD_COST): int,
+                },
+                extra=vol.ALLOW_EXTRA,
+            )
+        ],
+        vol.Required(CONF_LEVEL_CONFIG): dict,
+        vol.Required("balances"): {str: int},
+        vol.Required("redemptions"): [
+            vol.Schema(
+                {
+                    vol.Required("id"): str,
+                    vol.Required("member"): str,
+                    vol.Required("status"): str,
+                },
+                extra=vol.ALLOW_EXTRA,
+            )
+        ],
+        vol.Required("approvals"): [
+            vol.Schema(
+                {
+                    vol.Required("id"): str,
+                    vol.Required("member"): str,
+                    vol.Required("points"): int,
+                },
+                extra=vol.ALLOW_EXTRA,
+            )
+        ],
+    }
+)
+
+EVENT_SCHEMA = vol.Schema(
+    {
+        vol.Required("seq"): vol.All(int, vol.Range(min=1)),
+        vol.Required("ts"): str,
+        vol.Required("type"): vol.In(_EVENT_TYPES),
+        vol.Required("member"): str,
+        vol.Required("task"): vol.Any(None, str),
+        vol.Required("delta"): int,
+        vol.Optional("reward"): str,
+    }
+)
+
+
+class ImportedHistory:
+    """A validated history, staged as a ledger and replayed into trackers."""
+
+    def __init__(
+        self,
+        header: dict[str, Any],
+        balances: dict[str, int],
+        streaks: StreakTracker,
+        stats: StatsTracker,
+        events: int,
+    ) -> None:
+        """Initialize the imported history."""
+        self.header = header
+        self.balances = balances
+        self.streaks = streaks
+        self.stats = stats
+        self.events = events
+
+    @property
+    def last_seq(self) -> int:
+        """Return the sequence number of the last imported event."""
+        return self.header["last_seq"]
+
+
+def export_path(config_dir: str, filename: str) -> Path:
+    """Return the path of an export file in the config directory."""
+    return Path(config_dir, EXPORT_DIR, filename)
+
+
+def default_filename(fmt: str) -> str:
+    """Return a timestamped file name for a new export."""
+    suffix = ".jsonl.gz" if fmt == EXPORT_FORMAT_COLUMNAR else ".jsonl"
+    return f"champ-{dt_util.now():%Y%m%d-%H%M%S}{suffix}"
+
+
+def _dumps(data: Any) -> str:
+    """Serialize a line of the export."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _to_columns(events: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Transpose events into one list per column."""
+    return {column: [event.get(column) for event in events] for column in COLUMNS}
+
+
+def _from_columns(chunk: dict[str, list[Any]]) -> Iterator[dict[str, Any]]:
+    """Transpose a chunk of columns back into events."""
+    if not isinstance(chunk, dict) or set(chunk) != set(COLUMNS):
+        raise vol.Invalid(f"expected columns {', '.join(COLUMNS)}")
+    if len({len(values) for values in chunk.values()}) != 1:
+        raise vol.Invalid("columns differ in length")
+    for row in zip(*(chunk[column] for column in COLUMNS), strict=True):
+        event = dict(zip(COLUMNS, row, strict=True))
+        if event["reward"] is None:
+            del event["reward"]
+        yield event
+
+
+def write_export(
+    path: Path,
+    header: dict[str, Any],
+    events: Iterator[dict[str, Any]],
+) -> int:
+    """Stream the header and events to an export file, returning the count.
+
+    Events are written as they are read, so at most one chunk is held in
+    memory. Blocking, must be run in the executor.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+
+    # Events flushed after the header was taken are left out
+    events = takewhile(lambda event: event["seq"] <= header["last_seq"], events)
+
+    count = 0
+    with _open(tmp_path, "wt", header["format"] == EXPORT_FORMAT_COLUMNAR) as file:
+        file.write(_dumps(header) + "\n")
+        if header["format"] == EXPORT_FORMAT_JSONL:
+            for event in events:
+                file.write(_dumps(event) + "\n")
+                count += 1
+        else:
+            while chunk := list(islice(events, EXPORT_CHUNK_SIZE)):
+                file.write(_dumps(_to_columns(chunk)) + "\n")
+                count += len(chunk)
+
+    os.replace(tmp_path, path)
+    return count
+
+
+def read_import(path: Path, staging_path: Path, today: date) -> ImportedHistory:
+    """Validate an export file and stage its events as a ledger.
+
+    The events are streamed into a ledger archive while they are checked
+    and replayed into balances, streaks and statistics, so the history is
+    never held in memory. Blocking, must be run in the executor.
+    """
+    if not path.is_file():
+        raise HomeAssistantError(f"Export file {path.name} not found")
+
+    shutil.rmtree(staging_path, True)
+    staging_path.mkdir(parents=True)
+    try:
+        return _read_import(path, staging_path, today)
+    except BaseException:
+        shutil.rmtree(staging_path, True)
+        raise
+
+
+def _read_import(path: Path, staging_path: Path, today: date) -> ImportedHistory:
+    """Read, validate and stage an export file."""
+    with path.open("rb") as file:
+        compressed = file.read(2) == b"\x1f\x8b"
+
+    with _open(path, "rt", compressed) as file:
+        try:
+            header = HEADER_SCHEMA(json.loads(file.readline()))
+        except (ValueError, vol.Invalid) as err:
+            raise HomeAssistantError(f"Invalid export header: {err}") from err
+
+        member_ids = {member[CONF_MEMBER_ID] for member in header[CONF_MEMBERS]}
+        categories = {
+            task[CONF_TASK_ID]: task.get(CONF_TASK_CATEGORY)
+            for task in header[CONF_TASKS]
+        }
+        balances: dict[str, int] = {}
+        streaks = StreakTracker()
+        stats = StatsTracker()
+        seq = count = 0
+
+        with gzip.open(
+            staging_path / archive_name(0), "wt", encoding="utf-8"
+        ) as archive:
+            for line_number, event in _iter_events(file, header["format"]):
+                if event["seq"] <= seq:
+                    raise HomeAssistantError(
+                        f"Line {line_number}: event {event['seq']} is out of order"
+                    )
+                if (timestamp := dt_util.parse_datetime(event["ts"])) is None:
+                    raise HomeAssistantError(
+                        f"Line {line_number}: invalid timestamp {event['ts']}"
+                    )
+                seq = event["seq"]
+                count += 1
+
+                apply_event(balances, event)
+                if (
+                    event["type"] in (EVENT_AWARD, EVENT_COMPLETE)
+                    and event["member"] in member_ids
+                ):
+                    day = dt_util.as_local(timestamp).date()
+                    if event["type"] == EVENT_COMPLETE:
+                        streaks.record(event["member"], event["task"], day)
+                    if event["delta"] > 0:
+                        stats.record(
+                            event["member"],
+                            day,
+                            event["delta"],
+                            event["task"],
+                            categories.get(event["task"]),
+                        )
+                archive.write(_dumps(event) + "\n")
+
+    if seq != header["last_seq"]:
+        raise HomeAssistantError(
+            f"Export ends at event {seq}, expected {header['last_seq']}"
+        )
+
+    # Balances may predate the ledger, the exported ones are authoritative
+    mismatched = [
+        member_id
+        for member_id, points in header["balances"].items()
+        if balances.get(member_id, 0) != points
+    ]
+    if mismatched:
+        _LOGGER.warning(
+            "Imported history does not add up to the balances of %s, "
+            "using the exported balances",
+            ", ".join(mismatched),
+        )
+
+    (staging_path / SNAPSHOT_FILE).write_text(
+        json.dumps({"seq": seq, "balances": header["balances"]}), encoding="utf-8"
+    )
+
+    streaks.roll_over(today)
+    stats.roll_over(today)
+    return ImportedHistory(header, dict(header["balances"]), streaks, stats, count)
+
+
+def _iter_events(file: IO[str], fmt: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Parse and validate the events of an export, with their line numbers."""
+    for line_number, line in enumerate(file, 2):
+        try:
+            data = json.loads(line)
+            if fmt == EXPORT_FORMAT_JSONL:
+                yield line_number, EVENT_SCHEMA(data)
+            else:
+                for event in _from_columns(data):
+                    yield line_number, EVENT_SCHEMA(event)
+        except (ValueError, TypeError, vol.Invalid) as err:
+            raise HomeAssistantError(f"Line {line_number}: {err}") from err
+
+
+def _open(path: Path, mode: str, compressed: bool) -> IO[str]:
+    """Open a text file, gzip-compressed or not."""
+    if compressed:
+        return gzip.open(path, mode, encoding="utf-8")  # type: ignore[return-value]
+    return path.open(mode, encoding="utf-8")
+
+
+async def async_export_history(
+    coordinator: ChampDataCoordinator, fmt: str, filename: str | None
+) -> dict[str, Any]:
+    """Export the history of an entry and return the path and event count."""
+    hass = coordinator.hass
+    path = export_path(hass.config.config_dir, filename or default_filename(fmt))
+
+    # Flush first, so the header and the files cover the same events
+    await coordinator.ledger.async_flush()
+    header = coordinator.export_header(fmt)
+    count = await coordinator.ledger.async_read(
+        lambda events: write_export(path, header, events)
+    )
+
+    _LOGGER.info("Exported %d CHAMP ledger events to %s", count, path)
+    return {"path": str(path), "events": count}
+
+
+async def async_import_history(
+    coordinator: ChampDataCoordinator, filename: str
+) -> dict[str, Any]:
+    """Import an exported history, replacing the history of an entry."""
+    hass = coordinator.hass
+    path = export_path(hass.config.config_dir, filename)
+    imported = await hass.async_add_executor_job(
+        read_import, path, coordinator.ledger.staging_path, dt_util.now().date()
+    )
+
+    await coordinator.apply_import(imported)
+    # Swap the staged ledger in before saving the state that refers to it
+    await coordinator.ledger.async_flush()
+    await coordinator.storage.async_flush()
+
+    _LOGGER.info("Imported %d CHAMP ledger events from %s", imported.events, path)
+    return {"events": imported.events, "members": len(imported.header[CONF_MEMBERS])}
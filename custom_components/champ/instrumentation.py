@@ -0,0 +1,104 @@
+"""Always-on performance counters for CHAMP integration."""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from .profiler import profile_steps
+
+# Counter names
+PERF_AWARD = "award"
+PERF_COMPLETE = "complete"
+PERF_BATCH = "batch"
+PERF_COMMANDS = "commands"
+PERF_REDEEM = "redeem"
+PERF_DECIDE = "decide"
+PERF_RESET = "reset"
+PERF_REFRESH = "refresh"
+PERF_RECONCILE = "reconcile"
+PERF_STATE_WRITE = "state_write"
+PERF_NOTIFICATION = "notification"
+PERF_STORAGE_FLUSH = "storage_flush"
+PERF_LEDGER_FLUSH = "ledger_flush"
+PERF_SCHEDULER_WAKEUP = "scheduler_wakeup"
+
+_F = TypeVar("_F", bound=Callable[..., Awaitable[Any]])
+
+
+class PerfCounter:
+    """Count, cumulative and peak duration of an operation."""
+
+    __slots__ = ("count", "total", "peak")
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.count = 0
+        self.total = 0.0
+        self.peak = 0.0
+
+    def add(self, duration: float, count: int = 1) -> None:
+        """Count operations that took duration seconds together."""
+        self.count += count
+        self.total += duration
+        if duration > self.peak:
+            self.peak = duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counter with durations in milliseconds."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "peak_ms": round(self.peak * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 3) if self.count else 0,
+        }
+
+
+class Instrumentation:
+    """Named performance counters shared by the parts of an entry.
+
+    Recording is a dictionary lookup and a few additions, with durations
+    taken from the monotonic performance clock, so the counters can stay on
+    permanently. Everything runs in the event loop, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self._counters: dict[str, PerfCounter] = {}
+
+    def counter(self, name: str) -> PerfCounter:
+        """Return a counter, creating it on first use."""
+        if (counter := self._counters.get(name)) is None:
+            counter = self._counters[name] = PerfCounter()
+        return counter
+
+    def record(self, name: str, started: float, count: int = 1) -> None:
+        """Count an operation that started at a perf_counter() value."""
+        self.counter(name).add(time.perf_counter() - started, count)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return all counters."""
+        return {name: counter.as_dict() for name, counter in self._counters.items()}
+
+
+def timed(name: str) -> Callable[[_F], _F]:
+    """Count calls of an async method and their durations, including errors.
+
+    The instance must hold its Instrumentation as perf. Calls are also
+    profiled as a section named like the counter while a profile runs.
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return await profile_steps(name, func(self, *args, **kwargs))
+            finally:
+                self.perf.record(name, started)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,97 @@
+"""Leaderboard for CHAMP integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable
+
+# Ranking by the current balance; the other rankings are by statistics period
+RANKING_TOTAL = "total"
+
+
+class Ranking:
+    """Members ordered by descending score, ties ordered by member ID.
+
+    The order is kept in a sorted list, so moving a member after a score
+    change needs a binary search instead of sorting all members.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty ranking."""
+        self._order: list[tuple[int, str]] = []
+        self._scores: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of ranked members."""
+        return len(self._order)
+
+    def update(self, member_id: str, score: int) -> bool:
+        """Set the score of a member, returning whether the order changed."""
+        old_score = self._scores.get(member_id)
+        if old_score == score:
+            return False
+
+        old_index = None
+        if old_score is not None:
+            old_index = bisect_left(self._order, (-old_score, member_id))
+            del self._order[old_index]
+
+        index = bisect_left(self._order, (-score, member_id))
+        self._order.insert(index, (-score, member_id))
+        self._scores[member_id] = score
+        return index != old_index
+
+    def remove(self, member_id: str) -> bool:
+        """Remove a member, returning whether it was ranked."""
+        score = self._scores.pop(member_id, None)
+        if score is None:
+            return False
+        del self._order[bisect_left(self._order, (-score, member_id))]
+        return True
+
+    def rebuild(self, scores: dict[str, int]) -> bool:
+        """Replace all scores, returning whether the order changed."""
+        old_members = self.members()
+        self._scores = dict(scores)
+        self._order = sorted((-score, member_id) for member_id, score in scores.items())
+        return self.members() != old_members
+
+    def members(self) -> list[str]:
+        """Return the member IDs, best first."""
+        return [member_id for _, member_id in self._order]
+
+    def score(self, member_id: str) -> int:
+        """Return the score of a member."""
+        return self._scores.get(member_id, 0)
+
+    def rank(self, member_id: str) -> int:
+        """Return the 1-based rank of a member; equal scores share a rank."""
+        return bisect_left(self._order, (-self._scores[member_id], "")) + 1
+
+
+class Leaderboard:
+    """Rankings of all members by balance and by statistics period."""
+
+    def __init__(self, periods: Iterable[str]) -> None:
+        """Initialize the rankings."""
+        self.rankings: dict[str, Ranking] = {
+            name: Ranking() for name in (RANKING_TOTAL, *periods)
+        }
+
+    def update(self, member_id: str, scores: dict[str, int]) -> bool:
+        """Update the scores of a member, returning whether any order changed."""
+        changed = False
+        for name, score in scores.items():
+            changed |= self.rankings[name].update(member_id, score)
+        return changed
+
+    def remove(self, member_id: str) -> bool:
+        """Remove a member from all rankings."""
+        changed = False
+        for ranking in self.rankings.values():
+            changed |= ranking.remove(member_id)
+        return changed
+
+    def rebuild(self, name: str, scores: dict[str, int]) -> bool:
+        """Replace all scores of a ranking, returning whether the order changed."""
+        return self.rankings[name].rebuild(scores)
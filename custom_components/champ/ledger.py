@@ -0,0 +1,444 @@
+"""Append-only transaction log for CHAMP integration."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import shutil
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    LEDGER_FLUSH_DELAY,
+    LEDGER_SEGMENT_SIZE,
+    LEDGER_SNAPSHOT_INTERVAL,
+)
+from .instrumentation import PERF_LEDGER_FLUSH, Instrumentation
+
+_LOGGER = logging.getLogger(__name__)
+
+# Event types
+EVENT_AWARD = "award"
+EVENT_COMPLETE = "complete"
+EVENT_RESET = "reset"
+EVENT_REDEEM = "redeem"
+EVENT_REFUND = "refund"
+
+# Each compaction writes its own archive, named after its first event
+ARCHIVE_PREFIX = "archive-"
+ARCHIVE_SUFFIX = ".jsonl.gz"
+# Single archive extended in place by earlier versions, read before the others
+LEGACY_ARCHIVE_FILE = "archive.jsonl.gz"
+SNAPSHOT_FILE = "snapshot.json"
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+
+_T = TypeVar("_T")
+
+
+def archive_name(first_seq: int) -> str:
+    """Return the file name of the archive starting at an event."""
+    return f"{ARCHIVE_PREFIX}{first_seq:012d}{ARCHIVE_SUFFIX}"
+
+
+def _first_seq(archive: str) -> int:
+    """Return the first sequence number in the name of a numbered archive."""
+    return int(archive[len(ARCHIVE_PREFIX) : -len(ARCHIVE_SUFFIX)])
+
+
+def apply_event(balances: dict[str, int], event: dict[str, Any]) -> None:
+    """Apply a ledger event to a balances mapping."""
+    member_id = event["member"]
+    if event["type"] == EVENT_RESET:
+        balances[member_id] = 0
+    else:
+        balances[member_id] = balances.get(member_id, 0) + event["delta"]
+
+
+class ChampLedger:
+    """Transaction log stored as append-only JSON-lines segments.
+
+    Events are buffered and appended to the current segment in one write per
+    flush. Every LEDGER_SNAPSHOT_INTERVAL events the balances are snapshotted
+    and the segments covered by the snapshot are compacted into a new gzip
+    archive, so a restart only replays the events after the last snapshot.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        perf: Instrumentation | None = None,
+    ) -> None:
+        """Initialize the ledger."""
+        self._hass = hass
+        self._path = Path(hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.ledger"))
+        self._buffer: list[dict[str, Any]] = []
+        self._seq = 0
+        self._snapshot_seq = 0
+        self._events_since_snapshot = 0
+        self._segment: Path | None = None
+        self._segment_events = 0
+        # Sequence number of a staged ledger the next flush swaps in
+        self._staged_seq: int | None = None
+        # Incremented on replacement, so flushes of the old log are dropped
+        self._generation = 0
+        self._flush_lock = asyncio.Lock()
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._balances_func: Callable[[], dict[str, int]] | None = None
+        self._perf = perf or Instrumentation()
+
+    @property
+    def path(self) -> Path:
+        """Return the directory of the ledger."""
+        return self._path
+
+    @property
+    def staging_path(self) -> Path:
+        """Return the directory an imported ledger is staged in."""
+        return self._path.with_name(f"{self._path.name}.import")
+
+    @property
+    def flush_count(self) -> int:
+        """Return the number of flushes to disk."""
+        return self._perf.counter(PERF_LEDGER_FLUSH).count
+
+    @property
+    def buffered(self) -> int:
+        """Return the number of events waiting for a flush."""
+        return len(self._buffer)
+
+    @property
+    def last_seq(self) -> int:
+        """Return the sequence number of the last recorded event."""
+        return self._seq
+
+    @property
+    def snapshot_seq(self) -> int:
+        """Return the sequence number covered by the last snapshot."""
+        return self._snapshot_seq
+
+    @callback
+    def async_set_balances_func(
+        self, balances_func: Callable[[], dict[str, int]]
+    ) -> None:
+        """Set the function returning the current balances for snapshots."""
+        self._balances_func = balances_func
+
+    @callback
+    def async_advance_seq(self, seq: int) -> None:
+        """Make sure new events are numbered after the given sequence."""
+        self._seq = max(self._seq, seq)
+
+    async def async_load(self) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+        """Load the last snapshot and the events recorded after it."""
+        async with self._flush_lock:
+            return await self._hass.async_add_executor_job(self._load)
+
+    @callback
+    def async_append(
+        self,
+        event_type: str,
+        member_id: str,
+        delta: int,
+        task_id: str | None = None,
+        timestamp: datetime | None = None,
+        reward_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Record an event and schedule a flush."""
+        self._seq += 1
+        event = {
+            "seq": self._seq,
+            "ts": (timestamp or dt_util.utcnow()).isoformat(),
+            "type": event_type,
+            "member": member_id,
+            "task": task_id,
+            "delta": delta,
+        }
+        if reward_id is not None:
+            event["reward"] = reward_id
+        self._buffer.append(event)
+
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self._hass, LEDGER_FLUSH_DELAY, self._async_scheduled_flush
+            )
+
+        return event
+
+    async def _async_scheduled_flush(self, _now: datetime) -> None:
+        """Flush the buffer when the flush delay expires."""
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Append buffered events to disk and snapshot if due."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        if not self._buffer and self._staged_seq is None:
+            return
+
+        started = time.perf_counter()
+        generation = self._generation
+        events, self._buffer = self._buffer, []
+        self._events_since_snapshot += len(events)
+
+        # Balances are captured together with the buffer, so they match the
+        # sequence number of the last buffered event
+        snapshot = None
+        if (
+            self._events_since_snapshot >= LEDGER_SNAPSHOT_INTERVAL
+            and self._balances_func is not None
+        ):
+            snapshot = {"seq": self._seq, "balances": dict(self._balances_func())}
+            self._events_since_snapshot = 0
+
+        async with self._flush_lock:
+            if generation != self._generation:
+                # The log was replaced while waiting, these events belong to it
+                events, snapshot = [], None
+            staged_seq, self._staged_seq = self._staged_seq, None
+            await self._hass.async_add_executor_job(
+                self._write, events, snapshot, staged_seq
+            )
+
+        self._perf.record(PERF_LEDGER_FLUSH, started)
+
+    async def async_remove(self) -> None:
+        """Remove the ledger from disk."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._buffer = []
+        self._staged_seq = None
+        async with self._flush_lock:
+            await self._hass.async_add_executor_job(shutil.rmtree, self._path, True)
+
+    async def async_read(
+        self, func: Callable[[Iterator[dict[str, Any]]], _T], after: int = 0
+    ) -> _T:
+        """Run a blocking function over flushed events after a sequence number.
+
+        Flushes wait until the function returns, so the files are not changed
+        while they are read.
+        """
+        async with self._flush_lock:
+            return await self._hass.async_add_executor_job(
+                lambda: func(self.iter_events(after))
+            )
+
+    @callback
+    def async_replace(self, seq: int) -> None:
+        """Replace the log with the staged ledger, which ends at seq.
+
+        The staged ledger holds an archive and a snapshot, so nothing needs
+        to be replayed on the next load. Buffered events are discarded and
+        events appended from now on follow seq. The next flush swaps the
+        files before it writes anything.
+        """
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._buffer = []
+        self._generation += 1
+        self._staged_seq = self._seq = seq
+        self._events_since_snapshot = 0
+
+    def _replace(self) -> None:
+        """Swap the staged ledger in for the current one."""
+        old_path = self._path.with_name(f"{self._path.name}.old")
+        shutil.rmtree(old_path, True)
+        if self._path.exists():
+            os.replace(self._path, old_path)
+        os.replace(self.staging_path, self._path)
+        shutil.rmtree(old_path, True)
+
+    def iter_events(self, after: int = 0) -> Iterator[dict[str, Any]]:
+        """Iterate over the flushed events after a sequence number, oldest first.
+
+        Archives followed by one that starts right after that number are not
+        read. Blocking, must be run in the executor.
+        """
+        archives = self._archives()
+        for index, archive in enumerate(archives):
+            if index + 1 < len(archives) and (
+                _first_seq(archives[index + 1].name) <= after + 1
+            ):
+                continue
+            with gzip.open(archive, "rt", encoding="utf-8") as file:
+                yield from (
+                    event for event in _read_lines(file) if event["seq"] > after
+                )
+
+        for segment in self._segments():
+            with segment.open(encoding="utf-8") as file:
+                yield from (
+                    event for event in _read_lines(file) if event["seq"] > after
+                )
+
+    def _archives(self) -> list[Path]:
+        """Return the archives, oldest first."""
+        if not self._path.exists():
+            return []
+        archives = sorted(
+            path
+            for path in self._path.iterdir()
+            if path.name.startswith(ARCHIVE_PREFIX)
+            and path.name.endswith(ARCHIVE_SUFFIX)
+        )
+        if (legacy := self._path / LEGACY_ARCHIVE_FILE).exists():
+            archives.insert(0, legacy)
+        return archives
+
+    def _segments(self) -> list[Path]:
+        """Return the live segments, oldest first."""
+        if not self._path.exists():
+            return []
+        return sorted(
+            path
+            for path in self._path.iterdir()
+            if path.name.startswith(SEGMENT_PREFIX)
+            and path.name.endswith(SEGMENT_SUFFIX)
+        )
+
+    def _load(self) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+        """Read the snapshot and replay the tail of the log."""
+        snapshot = None
+        snapshot_path = self._path / SNAPSHOT_FILE
+        if snapshot_path.exists():
+            snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+            self._snapshot_seq = snapshot["seq"]
+            self._seq = self._snapshot_seq
+
+        tail: list[dict[str, Any]] = []
+        segments = self._segments()
+        for segment in segments:
+            with segment.open(encoding="utf-8") as file:
+                events = list(_read_lines(file))
+            tail.extend(event for event in events if event["seq"] > self._snapshot_seq)
+            if events:
+                self._seq = max(self._seq, events[-1]["seq"])
+            self._segment = segment
+            self._segment_events = len(events)
+
+        # Finish a compaction that was interrupted after the snapshot. The
+        # archive may already hold some of the segments, so skip their events
+        if segments and not tail:
+            self._compact(segments, self._archived_seq())
+
+        self._events_since_snapshot = len(tail)
+
+        _LOGGER.debug(
+            "Loaded CHAMP ledger: snapshot at %d, %d events to replay",
+            self._snapshot_seq,
+            len(tail),
+        )
+        return snapshot, tail
+
+    def _write(
+        self,
+        events: list[dict[str, Any]],
+        snapshot: dict[str, Any] | None,
+        staged_seq: int | None = None,
+    ) -> None:
+        """Append events to the current segment and compact if snapshotted.
+
+        If staged_seq is given, the staged ledger ending there is swapped in
+        first.
+        """
+        if staged_seq is not None:
+            self._replace()
+            self._snapshot_seq = staged_seq
+            self._segment = None
+            self._segment_events = 0
+
+        self._path.mkdir(parents=True, exist_ok=True)
+
+        while events:
+            if self._segment is None or self._segment_events >= LEDGER_SEGMENT_SIZE:
+                self._segment = self._path / (
+                    f"{SEGMENT_PREFIX}{events[0]['seq']:012d}{SEGMENT_SUFFIX}"
+                )
+                self._segment_events = 0
+
+            chunk = events[: LEDGER_SEGMENT_SIZE - self._segment_events]
+            events = events[len(chunk) :]
+            with self._segment.open("a", encoding="utf-8") as file:
+                file.writelines(
+                    json.dumps(event, separators=(",", ":")) + "\n" for event in chunk
+                )
+            self._segment_events += len(chunk)
+
+        if snapshot is None:
+            return
+
+        tmp_path = self._path / f"{SNAPSHOT_FILE}.tmp"
+        tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+        os.replace(tmp_path, self._path / SNAPSHOT_FILE)
+        self._snapshot_seq = snapshot["seq"]
+
+        self._compact(self._segments())
+
+    def _compact(self, segments: list[Path], archived_seq: int = 0) -> None:
+        """Move segments covered by the snapshot into a new archive.
+
+        The archive is written to a temporary file and renamed once complete,
+        so it never holds a torn write. Events up to archived_seq are skipped.
+        """
+        events: list[dict[str, Any]] = []
+        for segment in segments:
+            with segment.open(encoding="utf-8") as file:
+                events.extend(
+                    event for event in _read_lines(file) if event["seq"] > archived_seq
+                )
+
+        if events:
+            archive_path = self._path / archive_name(events[0]["seq"])
+            tmp_path = archive_path.with_name(f"{archive_path.name}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as archive:
+                archive.writelines(
+                    json.dumps(event, separators=(",", ":")) + "\n" for event in events
+                )
+            os.replace(tmp_path, archive_path)
+
+        for segment in segments:
+            segment.unlink()
+
+        # Start a new segment with the next event
+        self._segment = None
+        self._segment_events = 0
+
+        _LOGGER.debug("Compacted %d CHAMP ledger segments", len(segments))
+
+    def _archived_seq(self) -> int:
+        """Return the sequence number of the last archived event."""
+        if not (archives := self._archives()):
+            return 0
+        seq = 0
+        with gzip.open(archives[-1], "rt", encoding="utf-8") as file:
+            for event in _read_lines(file):
+                seq = event["seq"]
+        return seq
+
+
+def _read_lines(file: Any) -> Iterator[dict[str, Any]]:
+    """Parse JSON lines, skipping a torn last line."""
+    for line in file:
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            _LOGGER.warning("Skipping corrupt CHAMP ledger line")
@@ -0,0 +1,104 @@
+"""Level progression for CHAMP integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from math import isqrt, log
+from typing import Any
+
+from .const import (
+    CONF_LEVEL_CURVE,
+    CONF_LEVEL_GROWTH,
+    CONF_LEVEL_THRESHOLDS,
+    CONF_MAX_LEVEL,
+    CONF_POINTS_PER_LEVEL,
+    DEFAULT_LEVEL_GROWTH,
+    DEFAULT_POINTS_PER_LEVEL,
+    LEVEL_CURVE_EXPONENTIAL,
+    LEVEL_CURVE_LINEAR,
+    LEVEL_CURVE_QUADRATIC,
+    LEVEL_CURVE_THRESHOLDS,
+)
+
+
+class LevelTable:
+    """Cumulative point thresholds per level.
+
+    threshold(n) is the number of points needed to reach level n. Formula
+    curves compute level and threshold in closed form, so any balance costs
+    O(1). Explicit thresholds are kept in a table searched with bisect.
+    """
+
+    def __init__(self, level_config: dict[str, Any]) -> None:
+        """Initialize the level table from the level configuration."""
+        self.curve: str = level_config.get(CONF_LEVEL_CURVE, LEVEL_CURVE_LINEAR)
+        self.points_per_level: int = level_config.get(
+            CONF_POINTS_PER_LEVEL, DEFAULT_POINTS_PER_LEVEL
+        )
+        self.growth: float = level_config.get(CONF_LEVEL_GROWTH, DEFAULT_LEVEL_GROWTH)
+        self.max_level: int | None = level_config.get(CONF_MAX_LEVEL) or None
+
+        # A growth factor of 1 would be a linear curve
+        if self.curve == LEVEL_CURVE_EXPONENTIAL and self.growth <= 1:
+            self.curve = LEVEL_CURVE_LINEAR
+
+        self._thresholds = [0]
+        if self.curve == LEVEL_CURVE_THRESHOLDS:
+            self._thresholds.extend(
+                sorted(int(points) for points in level_config[CONF_LEVEL_THRESHOLDS])
+            )
+            last_level = len(self._thresholds) - 1
+            self.max_level = min(self.max_level or last_level, last_level)
+            del self._thresholds[self.max_level + 1 :]
+
+    @property
+    def thresholds(self) -> list[int]:
+        """Return the explicit thresholds, [0] for formula curves."""
+        return self._thresholds
+
+    def threshold(self, level: int) -> int:
+        """Return the points needed to reach a level."""
+        if self.curve == LEVEL_CURVE_THRESHOLDS:
+            return self._thresholds[level]
+        if self.curve == LEVEL_CURVE_QUADRATIC:
+            return self.points_per_level * level * level
+        if self.curve == LEVEL_CURVE_EXPONENTIAL:
+            return round(
+                self.points_per_level * (self.growth**level - 1) / (self.growth - 1)
+            )
+        return self.points_per_level * level
+
+    def _uncapped_level(self, points: int) -> int:
+        """Return the level reached with the given points, ignoring max_level."""
+        if points <= 0:
+            return 0
+        if self.curve == LEVEL_CURVE_THRESHOLDS:
+            return bisect_right(self._thresholds, points) - 1
+        if self.curve == LEVEL_CURVE_QUADRATIC:
+            return isqrt(points // self.points_per_level)
+        if self.curve == LEVEL_CURVE_LINEAR:
+            return points // self.points_per_level
+
+        # Invert the geometric series, then correct for float and rounding
+        level = int(
+            log(points * (self.growth - 1) / self.points_per_level + 1, self.growth)
+        )
+        while self.threshold(level + 1) <= points:
+            level += 1
+        while level and self.threshold(level) > points:
+            level -= 1
+        return level
+
+    def level(self, points: int) -> int:
+        """Return the level reached with the given points."""
+        level = self._uncapped_level(points)
+        if self.max_level is not None:
+            return min(level, self.max_level)
+        return level
+
+    def points_to_next_level(self, points: int) -> int:
+        """Return the points missing for the next level, 0 at max level."""
+        level = self.level(points)
+        if self.max_level is not None and level >= self.max_level:
+            return 0
+        return self.threshold(level + 1) - points
@@ -0,0 +1,126 @@
+"""Completion notifications for CHAMP integration."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime
+from functools import partial
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, NOTIFICATION_MIN_INTERVAL
+from .instrumentation import PERF_NOTIFICATION, Instrumentation
+
+_LOGGER = logging.getLogger(__name__)
+
+NOTIFICATION_TITLE = "🎉 Punkte verdient!"
+
+
+class ChampNotifier:
+    """Aggregate task completions into one notification per member.
+
+    Completions are collected per member for a window and then sent as a
+    single summary with a stable notification_id, so the notification is
+    updated in place. Summaries of one member are at least
+    NOTIFICATION_MIN_INTERVAL seconds apart.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: float,
+        message_func: Callable[[str, list[tuple[str, int]]], str],
+        perf: Instrumentation | None = None,
+    ) -> None:
+        """Initialize the notifier."""
+        self._hass = hass
+        self.window = window
+        self._message_func = message_func
+        self._pending: dict[str, list[tuple[str, int]]] = {}
+        self._unsub_send: dict[str, CALLBACK_TYPE] = {}
+        self._last_sent: dict[str, float] = {}
+        self._perf = perf or Instrumentation()
+
+    @property
+    def sent_count(self) -> int:
+        """Return the number of notification service calls."""
+        return self._perf.counter(PERF_NOTIFICATION).count
+
+    @property
+    def pending(self) -> int:
+        """Return the number of completions waiting for a summary."""
+        return sum(len(completions) for completions in self._pending.values())
+
+    @callback
+    def async_add(self, member_id: str, task_id: str, points: int) -> None:
+        """Add a completion to the pending summary of a member."""
+        self._pending.setdefault(member_id, []).append((task_id, points))
+
+        if member_id in self._unsub_send:
+            return
+
+        delay = self.window
+        last_sent = self._last_sent.get(member_id)
+        if last_sent is not None:
+            delay = max(delay, last_sent + NOTIFICATION_MIN_INTERVAL - time.monotonic())
+
+        self._unsub_send[member_id] = async_call_later(
+            self._hass, delay, partial(self._async_send, member_id)
+        )
+
+    async def async_flush(self) -> None:
+        """Send all pending summaries immediately."""
+        for member_id in list(self._pending):
+            await self._async_send(member_id)
+
+    @callback
+    def async_remove_member(self, member_id: str) -> None:
+        """Drop the pending summary of a removed member."""
+        if unsub := self._unsub_send.pop(member_id, None):
+            unsub()
+        self._pending.pop(member_id, None)
+        self._last_sent.pop(member_id, None)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop all pending summaries."""
+        for unsub in self._unsub_send.values():
+            unsub()
+        self._unsub_send.clear()
+        self._pending.clear()
+
+    async def _async_send(self, member_id: str, _now: datetime | None = None) -> None:
+        """Send the summary notification of a member."""
+        if unsub := self._unsub_send.pop(member_id, None):
+            unsub()
+
+        completions = self._pending.pop(member_id, None)
+        if not completions:
+            return
+
+        self._last_sent[member_id] = time.monotonic()
+        started = time.perf_counter()
+
+        _LOGGER.debug(
+            "Sending summary of %d completions for %s", len(completions), member_id
+        )
+
+        try:
+            await self._hass.services.async_call(
+                "persistent_notification",
+                "create",
+                {
+                    "title": NOTIFICATION_TITLE,
+                    "message": self._message_func(member_id, completions),
+                    "notification_id": f"{DOMAIN}_{member_id}",
+                },
+            )
+        except HomeAssistantError as err:
+            # Sent from timers and on shutdown, where nobody could handle it
+            _LOGGER.warning("Could not send summary for %s: %s", member_id, err)
+            return
+        self._perf.record(PERF_NOTIFICATION, started)
@@ -0,0 +1,265 @@
+"""On-demand profiling of CHAMP code sections."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import functools
+import inspect
+import logging
+import pstats
+from collections.abc import Awaitable, Callable, Generator
+from pathlib import Path
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, PROFILE_PREFIX
+
+_LOGGER = logging.getLogger(__name__)
+
+# Section names besides the instrumentation counter names
+SECTION_CONFIG_FLOW = "config_flow"
+
+NOTIFICATION_TITLE = "CHAMP profile"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+_T = TypeVar("_T")
+
+
+class ChampProfiler:
+    """A cProfile session that only records inside CHAMP code sections.
+
+    Python allows a single active profiler per process, so there is one
+    instance shared by all entries. While no session runs, entering a
+    section is a single attribute check. The profile is only enabled while
+    code of a section runs: coroutine sections are resumed and paused around
+    each of their steps, so other tasks running while a section awaits are
+    not recorded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self._profile: cProfile.Profile | None = None
+        self._depth = 0
+        self.sections: dict[str, int] = {}
+
+    @property
+    def active(self) -> bool:
+        """Return whether a session is running."""
+        return self._profile is not None
+
+    def start(self) -> None:
+        """Start a session."""
+        if self._profile is not None:
+            raise HomeAssistantError("A CHAMP profile is already running")
+
+        probe = cProfile.Profile()
+        try:
+            # Fails if another profiler is active, e.g. the profiler integration
+            probe.enable()
+            probe.disable()
+        except ValueError as err:
+            raise HomeAssistantError(f"Cannot start profiling: {err}") from err
+
+        self._profile = cProfile.Profile()
+        self._depth = 0
+        self.sections = {}
+
+    def stop(self) -> cProfile.Profile:
+        """Stop the session and return its profile."""
+        if (profile := self._profile) is None:
+            raise HomeAssistantError("No CHAMP profile is running")
+        if self._depth:
+            profile.disable()
+        self._profile = None
+        self._depth = 0
+        return profile
+
+    def count(self, section: str) -> None:
+        """Count a call of a section."""
+        if self._profile is not None:
+            self.sections[section] = self.sections.get(section, 0) + 1
+
+    def resume(self) -> None:
+        """Enable the profile unless code of a section is already running."""
+        if (profile := self._profile) is None:
+            return
+        if not self._depth:
+            profile.enable()
+        self._depth += 1
+
+    def pause(self) -> None:
+        """Disable the profile when the outermost running section stops."""
+        if (profile := self._profile) is None or not self._depth:
+            return
+        self._depth -= 1
+        if not self._depth:
+            profile.disable()
+
+    def enter(self, section: str) -> None:
+        """Open a synchronous section."""
+        self.count(section)
+        self.resume()
+
+    def exit(self) -> None:
+        """Close a synchronous section."""
+        self.pause()
+
+
+PROFILER = ChampProfiler()
+
+
+class _ProfiledSteps:
+    """Await a coroutine with the profile enabled only while it runs."""
+
+    __slots__ = ("_coro",)
+
+    def __init__(self, coro: Awaitable[Any]) -> None:
+        """Initialize the wrapper."""
+        self._coro = coro
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        """Run the coroutine step by step, pausing the profile in between."""
+        steps = self._coro.__await__()
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            PROFILER.resume()
+            try:
+                if error is None:
+                    yielded = steps.send(value)
+                else:
+                    yielded = steps.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                PROFILER.pause()
+            try:
+                value, error = (yield yielded), None
+            except BaseException as err:
+                value, error = None, err
+
+
+def profile_steps(section: str, coro: Awaitable[_T]) -> Awaitable[_T]:
+    """Return a coroutine profiled as a section if a session runs."""
+    if not PROFILER.active:
+        return coro
+    PROFILER.count(section)
+    return _ProfiledSteps(coro)
+
+
+def profiled(section: str) -> Callable[[_F], _F]:
+    """Record calls of a function or coroutine function as a section."""
+
+    def decorator(func: _F) -> _F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await profile_steps(section, func(*args, **kwargs))
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            PROFILER.enter(section)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.exit()
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _function_name(func: tuple[str, int, str]) -> str:
+    """Return file, line and name of a profiled function like pstats does."""
+    filename, line, name = func
+    if filename == "~" and line == 0:
+        # Built-in functions have no source location
+        return name
+    return f"{filename}:{line}({name})"
+
+
+def write_stats(
+    profile: cProfile.Profile, path: Path, top: int
+) -> list[dict[str, Any]]:
+    """Write the stats file and return the top functions by cumulative time."""
+    profile.dump_stats(path)
+
+    stats = pstats.Stats(profile).sort_stats(pstats.SortKey.CUMULATIVE)
+    table = stats.stats  # type: ignore[attr-defined]
+    summary = []
+    for func in stats.fcn_list[:top]:  # type: ignore[attr-defined]
+        primitive_calls, calls, total, cumulative, _ = table[func]
+        summary.append(
+            {
+                "function": _function_name(func),
+                "calls": calls,
+                "primitive_calls": primitive_calls,
+                "total_ms": round(total * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3),
+            }
+        )
+    return summary
+
+
+def _message(
+    path: Path | None, sections: dict[str, int], top: list[dict[str, Any]]
+) -> str:
+    """Return the notification text of a finished session."""
+    if path is None:
+        return "No CHAMP code ran while profiling."
+
+    lines = [f"Stats written to `{path}`.", ""]
+    lines.append(
+        "Sections: "
+        + ", ".join(f"{name} ({count})" for name, count in sorted(sections.items()))
+    )
+    lines.append("")
+    lines.extend(
+        f"{index}. `{entry['function']}`: {entry['cumulative_ms']} ms "
+        f"in {entry['calls']} calls"
+        for index, entry in enumerate(top, 1)
+    )
+    return "\n".join(lines)
+
+
+async def async_profile(
+    hass: HomeAssistant, duration: float, top: int
+) -> dict[str, Any]:
+    """Profile CHAMP code for duration seconds and store the stats."""
+    PROFILER.start()
+    _LOGGER.info("Profiling CHAMP for %s seconds", duration)
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        profile = PROFILER.stop()
+    sections = PROFILER.sections
+
+    # pstats cannot read a profile that recorded nothing
+    path: Path | None = None
+    summary: list[dict[str, Any]] = []
+    if sections:
+        timestamp = dt_util.now().strftime("%Y%m%d-%H%M%S")
+        path = Path(hass.config.path(f"{PROFILE_PREFIX}{timestamp}.prof"))
+        summary = await hass.async_add_executor_job(write_stats, profile, path, top)
+
+    await hass.services.async_call(
+        "persistent_notification",
+        "create",
+        {
+            "title": NOTIFICATION_TITLE,
+            "message": _message(path, sections, summary),
+            "notification_id": f"{DOMAIN}_profile",
+        },
+    )
+    return {
+        "path": str(path) if path is not None else None,
+        "sections": sections,
+        "top": summary,
+    }
@@ -0,0 +1,152 @@
+"""Recurring task scheduler for CHAMP integration."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import RECURRENCE_DAILY, RECURRENCE_WEEKLY
+from .instrumentation import PERF_SCHEDULER_WAKEUP, Instrumentation
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key of a scheduled reset: (member_id, task_id)
+ResetKey = tuple[str, str]
+
+
+def next_reset(recurrence: str, now: datetime) -> datetime | None:
+    """Return the next reset of a recurrence after now, in UTC.
+
+    Daily tasks reset at local midnight, weekly tasks at local midnight
+    between Sunday and Monday.
+    """
+    today = dt_util.as_local(now).date()
+    if recurrence == RECURRENCE_DAILY:
+        days = 1
+    elif recurrence == RECURRENCE_WEEKLY:
+        days = 7 - today.weekday()
+    else:
+        return None
+    return dt_util.as_utc(dt_util.start_of_local_day(today + timedelta(days=days)))
+
+
+class RecurrenceScheduler:
+    """Reset deadlines of completed recurring tasks behind a single timer.
+
+    Deadlines are kept in a heap and only one Home Assistant timer is armed,
+    for the earliest deadline. When it fires, every reset due by then is
+    handed to the reset function in one batch, so any number of recurring
+    tasks costs one wakeup per distinct due time. Cancelled or rescheduled
+    entries are dropped lazily when they reach the top of the heap.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        reset_func: Callable[[list[ResetKey]], None],
+        perf: Instrumentation | None = None,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._reset_func = reset_func
+        self._heap: list[tuple[datetime, int, ResetKey]] = []
+        self._due: dict[ResetKey, datetime] = {}
+        self._counter = itertools.count()
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._armed_for: datetime | None = None
+        self._perf = perf or Instrumentation()
+
+    def __len__(self) -> int:
+        """Return the number of scheduled resets."""
+        return len(self._due)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a reset is scheduled for the key."""
+        return key in self._due
+
+    def __iter__(self) -> Iterator[tuple[ResetKey, datetime]]:
+        """Iterate over the scheduled resets."""
+        return iter(list(self._due.items()))
+
+    @property
+    def wakeups(self) -> int:
+        """Return the number of timer wakeups."""
+        return self._perf.counter(PERF_SCHEDULER_WAKEUP).count
+
+    @property
+    def next_due(self) -> datetime | None:
+        """Return the time the timer is armed for."""
+        return self._armed_for
+
+    @callback
+    def async_schedule(self, key: ResetKey, due: datetime) -> None:
+        """Schedule a reset, replacing an earlier one of the same key."""
+        self._due[key] = due
+        heapq.heappush(self._heap, (due, next(self._counter), key))
+        if self._armed_for is None or due < self._armed_for:
+            self._async_arm()
+
+    @callback
+    def async_cancel(self, key: ResetKey) -> None:
+        """Cancel the reset of a key.
+
+        The heap entry stays until it surfaces; the timer is left armed, a
+        wakeup without due resets is harmless.
+        """
+        self._due.pop(key, None)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._armed_for = None
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the timer for the earliest live deadline."""
+        heap = self._heap
+        while heap and self._due.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+
+        due = heap[0][0] if heap else None
+        if due == self._armed_for:
+            return
+
+        self.async_stop()
+        if due is not None:
+            self._armed_for = due
+            self._unsub_timer = async_track_point_in_utc_time(
+                self._hass, self._async_fire, due
+            )
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Reset everything that is due and re-arm for the next deadline."""
+        self._unsub_timer = None
+        self._armed_for = None
+        started = time.perf_counter()
+
+        due_keys: list[ResetKey] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            due, _, key = heapq.heappop(heap)
+            if self._due.get(key) == due:
+                del self._due[key]
+                due_keys.append(key)
+
+        if due_keys:
+            _LOGGER.debug("Resetting %d recurring tasks", len(due_keys))
+            self._reset_func(due_keys)
+
+        self._async_arm()
+        self._perf.record(PERF_SCHEDULER_WAKEUP, started)
@@ -7,15 +7,31 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_MEMBER_NAME, DOMAIN
+from .const import (
+    CONF_MEMBER_NAME,
+    DOMAIN,
+    SIGNAL_MEMBERS_ADDED,
+    STATS_PERIOD_MONTH,
+    STATS_PERIOD_TODAY,
+    STATS_PERIOD_WEEK,
+    TASK_CATEGORIES,
+)
 from .coordinator import ChampDataCoordinator
+from .leaderboard import RANKING_TOTAL
 
 _LOGGER = logging.getLogger(__name__)
 
+PERIOD_NAME_SUFFIXES = {
+    STATS_PERIOD_TODAY: "Points Today",
+    STATS_PERIOD_WEEK: "Points This Week",
+    STATS_PERIOD_MONTH: "Points This Month",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,35 +41,63 @@ async def async_setup_entry(
     """Set up CHAMP sensor platform."""
     coordinator: ChampDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[SensorEntity] = []
+    @callback
+    def async_add_member_sensors(member_ids: list[str]) -> None:
+        """Add the sensors of members."""
+        entities: list[SensorEntity] = []
+
+        # Create sensors for each member
+        for member_id in member_ids:
+            member_config = coordinator.data["members"][member_id]["config"]
+
+            # Points sensor
+            entities.append(ChampPointsSensor(coordinator, member_id, member_config))
+
+            # Level sensor
+            entities.append(ChampLevelSensor(coordinator, member_id, member_config))
 
-    # Create sensors for each member
-    for member_id, member_data in coordinator.data["members"].items():
-        member_config = member_data["config"]
+            # Points to next level sensor
+            entities.append(
+                ChampPointsToNextLevelSensor(coordinator, member_id, member_config)
+            )
 
-        # Points sensor
-        entities.append(ChampPointsSensor(coordinator, member_id, member_config))
+            # Streak sensor
+            entities.append(ChampStreakSensor(coordinator, member_id, member_config))
 
-        # Level sensor
-        entities.append(ChampLevelSensor(coordinator, member_id, member_config))
+            # Points earned today, this week and this month
+            entities.extend(
+                ChampPeriodPointsSensor(coordinator, member_id, member_config, period)
+                for period in PERIOD_NAME_SUFFIXES
+            )
 
-        # Points to next level sensor
-        entities.append(
-            ChampPointsToNextLevelSensor(coordinator, member_id, member_config)
+        async_add_entities(entities)
+
+        _LOGGER.debug(
+            "Added %d sensor entities for %d members",
+            len(entities),
+            len(member_ids),
         )
 
-    async_add_entities(entities)
+    async_add_member_sensors(list(coordinator.data["members"]))
+    async_add_entities(
+        [ChampApprovalQueueSensor(coordinator), ChampLeaderboardSensor(coordinator)]
+    )
 
-    _LOGGER.debug(
-        "Added %d sensor entities for %d members",
-        len(entities),
-        len(coordinator.data["members"]),
+    # Members added by a configuration change
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_MEMBERS_ADDED.format(entry_id=config_entry.entry_id),
+            async_add_member_sensors,
+        )
     )
 
 
 class ChampBaseSensor(CoordinatorEntity[ChampDataCoordinator], SensorEntity):
     """Base class for CHAMP sensors."""
 
+    _name_suffix: str
+
     def __init__(
         self,
         coordinator: ChampDataCoordinator,
@@ -71,6 +115,33 @@ class ChampBaseSensor(CoordinatorEntity[ChampDataCoordinator], SensorEntity):
             "model": "Member Profile",
         }
 
+    async def async_added_to_hass(self) -> None:
+        """Register member-scoped listener when added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_member_listener(
+                self._member_id, self._handle_coordinator_update
+            )
+        )
+        self.async_on_remove(
+            self.coordinator.async_add_profile_listener(
+                self._member_id, self._handle_profile_update
+            )
+        )
+
+    @callback
+    def _handle_profile_update(self) -> None:
+        """Handle a changed member configuration."""
+        member_data = self.coordinator.data["members"][self._member_id]
+        self._member_config = member_data["config"]
+        self._attr_name = f"{self._member_config[CONF_MEMBER_NAME]} {self._name_suffix}"
+        self.async_write_ha_state()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the member attributes shared by all sensors."""
+        return self.coordinator.get_member_attributes(self._member_id)
+
 
 class ChampPointsSensor(ChampBaseSensor):
     """Sensor for member's current points."""
@@ -78,6 +149,7 @@ class ChampPointsSensor(ChampBaseSensor):
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = "points"
     _attr_icon = "mdi:star"
+    _name_suffix = "Points"
 
     def __init__(
         self,
@@ -88,7 +160,7 @@ class ChampPointsSensor(ChampBaseSensor):
         """Initialize the points sensor."""
         super().__init__(coordinator, member_id, member_config)
 
-        self._attr_name = f"{member_config[CONF_MEMBER_NAME]} Points"
+        self._attr_name = f"{member_config[CONF_MEMBER_NAME]} {self._name_suffix}"
         self._attr_unique_id = f"{DOMAIN}_{member_id}_points"
         self.entity_id = f"sensor.{DOMAIN}_{member_id}_points"
 
@@ -97,48 +169,6 @@ class ChampPointsSensor(ChampBaseSensor):
         """Return the current points."""
         return self.coordinator.get_member_points(self._member_id)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        attributes = {
-            "member_id": self._member_id,
-            "member_name": self._member_config[CONF_MEMBER_NAME],
-        }
-
-        # NEW: Add birthdate and age if available
-        birthdate = self._member_config.get(
-            "birthdate"
-        )  # Get birthdate (might be None)
-        if birthdate:
-            attributes["birthdate"] = birthdate
-
-            # Calculate age from birthdate
-            age = self._calculate_age(birthdate)
-            if age is not None:
-                attributes["age"] = age
-
-        return attributes
-
-    def _calculate_age(self, birthdate_str: str) -> int | None:
-        """Calculate age from birthdate string."""
-        from datetime import date, datetime
-
-        try:
-            # Convert string "1985-03-15" to date object
-            birthdate = datetime.fromisoformat(birthdate_str).date()
-            today = date.today()
-
-            # Calculate age
-            age = today.year - birthdate.year
-
-            # Adjust if birthday hasn't happened yet this year
-            if (today.month, today.day) < (birthdate.month, birthdate.day):
-                age -= 1
-
-            return age
-        except (ValueError, AttributeError):
-            return None
-
 
 class ChampLevelSensor(ChampBaseSensor):
     """Sensor for member's current level."""
@@ -146,6 +176,7 @@ class ChampLevelSensor(ChampBaseSensor):
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = "level"
     _attr_icon = "mdi:trophy"
+    _name_suffix = "Level"
 
     def __init__(
         self,
@@ -156,7 +187,7 @@ class ChampLevelSensor(ChampBaseSensor):
         """Initialize the level sensor."""
         super().__init__(coordinator, member_id, member_config)
 
-        self._attr_name = f"{member_config[CONF_MEMBER_NAME]} Level"
+        self._attr_name = f"{member_config[CONF_MEMBER_NAME]} {self._name_suffix}"
         self._attr_unique_id = f"{DOMAIN}_{member_id}_level"
         self.entity_id = f"sensor.{DOMAIN}_{member_id}_level"
 
@@ -168,29 +199,21 @@ class ChampLevelSensor(ChampBaseSensor):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        attributes = {
-            "member_id": self._member_id,
-            "member_name": self._member_config[CONF_MEMBER_NAME],
+        return {
+            **self.coordinator.get_member_attributes(self._member_id),
             "points": self.coordinator.get_member_points(self._member_id),
             "points_per_level": self.coordinator._get_points_per_level(),
+            "level_curve": self.coordinator.levels.curve,
+            "max_level": self.coordinator.levels.max_level,
         }
 
-        # Add birthdate/age
-        birthdate = self._member_config.get("birthdate")
-        if birthdate:
-            attributes["birthdate"] = birthdate
-            age = self._calculate_age(birthdate)
-            if age is not None:
-                attributes["age"] = age
-
-        return attributes
-
 
 class ChampPointsToNextLevelSensor(ChampBaseSensor):
     """Sensor for points needed to reach next level."""
 
     _attr_native_unit_of_measurement = "points"
     _attr_icon = "mdi:star-outline"
+    _name_suffix = "Points to Next Level"
 
     def __init__(
         self,
@@ -201,7 +224,7 @@ class ChampPointsToNextLevelSensor(ChampBaseSensor):
         """Initialize the points to next level sensor."""
         super().__init__(coordinator, member_id, member_config)
 
-        self._attr_name = f"{member_config[CONF_MEMBER_NAME]} Points to Next Level"
+        self._attr_name = f"{member_config[CONF_MEMBER_NAME]} {self._name_suffix}"
         self._attr_unique_id = f"{DOMAIN}_{member_id}_points_to_next_level"
         self.entity_id = f"sensor.{DOMAIN}_{member_id}_points_to_next_level"
 
@@ -215,9 +238,198 @@ class ChampPointsToNextLevelSensor(ChampBaseSensor):
         """Return additional attributes."""
         current_level = self.coordinator.get_member_level(self._member_id)
         return {
-            "member_id": self._member_id,
-            "member_name": self._member_config[CONF_MEMBER_NAME],
+            **self.coordinator.get_member_attributes(self._member_id),
             "current_level": current_level,
             "next_level": current_level + 1,
             "current_points": self.coordinator.get_member_points(self._member_id),
         }
+
+
+class ChampStreakSensor(ChampBaseSensor):
+    """Sensor for member's current daily completion streak."""
+
+    _attr_native_unit_of_measurement = "days"
+    _attr_icon = "mdi:fire"
+    _name_suffix = "Streak"
+
+    def __init__(
+        self,
+        coordinator: ChampDataCoordinator,
+        member_id: str,
+        member_config: dict[str, Any],
+    ) -> None:
+        """Initialize the streak sensor."""
+        super().__init__(coordinator, member_id, member_config)
+
+        self._attr_name = f"{member_config[CONF_MEMBER_NAME]} {self._name_suffix}"
+        self._attr_unique_id = f"{DOMAIN}_{member_id}_streak"
+        self.entity_id = f"sensor.{DOMAIN}_{member_id}_streak"
+
+    @property
+    def native_value(self) -> int:
+        """Return the current streak."""
+        return self.coordinator.streaks.member(self._member_id).current
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the longest streak and the streaks per task."""
+        streak = self.coordinator.streaks.member(self._member_id)
+        return {
+            **self.coordinator.get_member_attributes(self._member_id),
+            "longest_streak": streak.longest,
+            "last_completion": streak.last.isoformat() if streak.last else None,
+            "tasks": {
+                task_id: task_streak.as_dict()
+                for task_id, task_streak in self.coordinator.streaks.tasks(
+                    self._member_id
+                ).items()
+            },
+        }
+
+
+class ChampPeriodPointsSensor(ChampBaseSensor):
+    """Sensor for points earned in the current day, week or month."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "points"
+    _attr_icon = "mdi:chart-bar"
+
+    def __init__(
+        self,
+        coordinator: ChampDataCoordinator,
+        member_id: str,
+        member_config: dict[str, Any],
+        period: str,
+    ) -> None:
+        """Initialize the period points sensor."""
+        super().__init__(coordinator, member_id, member_config)
+        self._period = period
+        self._name_suffix = PERIOD_NAME_SUFFIXES[period]
+
+        self._attr_name = f"{member_config[CONF_MEMBER_NAME]} {self._name_suffix}"
+        self._attr_unique_id = f"{DOMAIN}_{member_id}_points_{period}"
+        self.entity_id = f"sensor.{DOMAIN}_{member_id}_points_{period}"
+
+    @property
+    def native_value(self) -> int:
+        """Return the points earned in the period."""
+        return self.coordinator.get_member_stats(self._member_id, self._period).points
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return completions per category and per task."""
+        stats = self.coordinator.get_member_stats(self._member_id, self._period)
+        return {
+            **self.coordinator.get_member_attributes(self._member_id),
+            "completions": stats.completions,
+            "categories": {
+                category: stats.categories.get(category, 0)
+                for category in TASK_CATEGORIES
+            },
+            "tasks": dict(stats.tasks),
+        }
+
+
+class ChampHouseholdSensor(CoordinatorEntity[ChampDataCoordinator], SensorEntity):
+    """Base class for CHAMP sensors covering all members."""
+
+    _key: str
+
+    def __init__(self, coordinator: ChampDataCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{DOMAIN}_{entry_id}_{self._key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry_id)},
+            "name": "CHAMP",
+            "manufacturer": "CHAMP",
+            "model": "Household",
+        }
+
+    @property
+    def suggested_object_id(self) -> str:
+        """Return the object ID, numbered by the registry for further entries."""
+        return f"{DOMAIN}_{self._key}"
+
+
+class ChampLeaderboardSensor(ChampHouseholdSensor):
+    """Sensor for the member ranking.
+
+    The state is written when the order of any ranking changes, not on every
+    change of points.
+    """
+
+    _attr_icon = "mdi:podium"
+    _attr_name = "Leaderboard"
+    _key = "leaderboard"
+
+    async def async_added_to_hass(self) -> None:
+        """Register leaderboard listener when added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_leaderboard_listener(
+                self._handle_coordinator_update
+            )
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the name of the leading member."""
+        members = self.coordinator.leaderboard.rankings[RANKING_TOTAL].members()
+        return self.coordinator.get_member_name(members[0]) if members else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the overall ranking and the rankings per period."""
+        attributes: dict[str, Any] = {}
+        for name, ranking in self.coordinator.leaderboard.rankings.items():
+            attributes[name] = [
+                {
+                    "rank": ranking.rank(member_id),
+                    "member_id": member_id,
+                    "member_name": self.coordinator.get_member_name(member_id),
+                    "points": ranking.score(member_id),
+                }
+                for member_id in ranking.members()
+            ]
+        for entry in attributes[RANKING_TOTAL]:
+            entry["level"] = self.coordinator.get_member_level(entry["member_id"])
+        return attributes
+
+
+class ChampApprovalQueueSensor(ChampHouseholdSensor):
+    """Sensor for the number of items awaiting approval."""
+
+    _attr_native_unit_of_measurement = "items"
+    _attr_icon = "mdi:clipboard-clock"
+    _attr_name = "Pending Approvals"
+    _key = "pending_approvals"
+
+    # Number of pending items listed in the attributes
+    _max_listed_items = 20
+
+    async def async_added_to_hass(self) -> None:
+        """Register approval queue listener when added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_approval_listener(
+                self._handle_coordinator_update
+            )
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of pending items."""
+        return len(self.coordinator.approvals)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return pending counts per member and the oldest pending items."""
+        approvals = self.coordinator.approvals
+        items = approvals.oldest(self._max_listed_items)
+        return {
+            "by_member": approvals.counts(),
+            "oldest": items[0]["ts"] if items else None,
+            "items": items,
+        }
@@ -0,0 +1,309 @@
+"""Services for CHAMP integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_ALL,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_FILENAME,
+    ATTR_FORMAT,
+    ATTR_IDEMPOTENCY_KEY,
+    ATTR_ITEM_IDS,
+    ATTR_ITEMS,
+    ATTR_MEMBER_ID,
+    ATTR_POINTS,
+    ATTR_REWARD_ID,
+    ATTR_TASK_ID,
+    ATTR_TOP,
+    DOMAIN,
+    EXPORT_FORMAT_JSONL,
+    EXPORT_FORMATS,
+    MAX_AWARD_POINTS,
+    PROFILE_DEFAULT_DURATION,
+    PROFILE_DEFAULT_TOP,
+    PROFILE_MAX_DURATION,
+    PROFILE_MAX_TOP,
+    SERVICE_APPROVE,
+    SERVICE_AWARD_BATCH,
+    SERVICE_AWARD_POINTS,
+    SERVICE_COMPLETE_TASK,
+    SERVICE_EXPORT_HISTORY,
+    SERVICE_IMPORT_HISTORY,
+    SERVICE_PROFILE,
+    SERVICE_REDEEM_REWARD,
+    SERVICE_REJECT,
+    SERVICE_RESET_POINTS,
+)
+from .coordinator import ChampDataCoordinator
+from .history import async_export_history, async_import_history
+from .profiler import async_profile
+
+_LOGGER = logging.getLogger(__name__)
+
+AWARD_POINTS = vol.All(
+    vol.Coerce(int), vol.Range(min=-MAX_AWARD_POINTS, max=MAX_AWARD_POINTS)
+)
+
+AWARD_POINTS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_MEMBER_ID): cv.string,
+        vol.Required(ATTR_POINTS): AWARD_POINTS,
+    }
+)
+
+RESET_POINTS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_MEMBER_ID): cv.string,
+    }
+)
+
+COMPLETE_TASK_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_MEMBER_ID): cv.string,
+        vol.Required(ATTR_TASK_ID): cv.string,
+        vol.Optional(ATTR_IDEMPOTENCY_KEY): cv.string,
+    }
+)
+
+BATCH_ITEM_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_MEMBER_ID): cv.string,
+            vol.Exclusive(ATTR_TASK_ID, "award"): cv.string,
+            vol.Exclusive(ATTR_POINTS, "award"): AWARD_POINTS,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_TASK_ID, ATTR_POINTS),
+)
+
+AWARD_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ITEMS): vol.All(cv.ensure_list, [BATCH_ITEM_SCHEMA]),
+    }
+)
+
+REDEEM_REWARD_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_MEMBER_ID): cv.string,
+        vol.Required(ATTR_REWARD_ID): cv.string,
+    }
+)
+
+
+def _has_selection(data: dict[str, Any]) -> dict[str, Any]:
+    """Require item IDs, a member or all to be selected explicitly."""
+    if ATTR_ITEM_IDS in data or ATTR_MEMBER_ID in data or data.get(ATTR_ALL):
+        return data
+    raise vol.Invalid(f"One of {ATTR_ITEM_IDS}, {ATTR_MEMBER_ID} or {ATTR_ALL} needed")
+
+
+DECIDE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_ITEM_IDS): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_MEMBER_ID): cv.string,
+            vol.Optional(ATTR_ALL): cv.boolean,
+        }
+    ),
+    _has_selection,
+)
+
+# Export files are addressed by name inside the export directory
+_FILENAME = vol.All(cv.string, vol.Match(r"^[\w][\w.-]*$"))
+
+EXPORT_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_FORMAT, default=EXPORT_FORMAT_JSONL): vol.In(EXPORT_FORMATS),
+        vol.Optional(ATTR_FILENAME): _FILENAME,
+    }
+)
+
+IMPORT_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_FILENAME): _FILENAME,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=PROFILE_DEFAULT_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=PROFILE_MAX_DURATION)
+        ),
+        vol.Optional(ATTR_TOP, default=PROFILE_DEFAULT_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_TOP)
+        ),
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, member_id: str) -> ChampDataCoordinator:
+    """Return the coordinator of the entry the member belongs to."""
+    coordinator: ChampDataCoordinator
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        if member_id in coordinator.data["members"]:
+            return coordinator
+    raise HomeAssistantError(f"Member ID {member_id} not found")
+
+
+def _get_entry_coordinator(
+    hass: HomeAssistant, entry_id: str | None
+) -> ChampDataCoordinator:
+    """Return the coordinator of an entry, or of the only entry if not given."""
+    coordinators: dict[str, ChampDataCoordinator] = hass.data.get(DOMAIN, {})
+    if entry_id is not None:
+        if entry_id not in coordinators:
+            raise HomeAssistantError(f"Config entry {entry_id} not found")
+        return coordinators[entry_id]
+    if len(coordinators) != 1:
+        raise HomeAssistantError(
+            f"{len(coordinators)} CHAMP entries loaded, {ATTR_CONFIG_ENTRY_ID} needed"
+        )
+    return next(iter(coordinators.values()))
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up CHAMP services."""
+
+    async def async_award_points(call: ServiceCall) -> None:
+        """Award points to a member."""
+        member_id = call.data[ATTR_MEMBER_ID]
+        coordinator = _get_coordinator(hass, member_id)
+        await coordinator.award_points(member_id, call.data[ATTR_POINTS])
+
+    async def async_reset_points(call: ServiceCall) -> None:
+        """Reset the points of a member."""
+        member_id = call.data[ATTR_MEMBER_ID]
+        coordinator = _get_coordinator(hass, member_id)
+        await coordinator.reset_points(member_id)
+
+    async def async_complete_task(call: ServiceCall) -> None:
+        """Complete a task for a member."""
+        member_id = call.data[ATTR_MEMBER_ID]
+        coordinator = _get_coordinator(hass, member_id)
+        await coordinator.complete_task(
+            member_id,
+            call.data[ATTR_TASK_ID],
+            call.data.get(ATTR_IDEMPOTENCY_KEY),
+        )
+
+    async def async_award_batch(call: ServiceCall) -> None:
+        """Apply a list of awards and task completions in one operation."""
+        # Group items by entry, so every coordinator applies a single batch
+        batches: dict[ChampDataCoordinator, list[dict[str, Any]]] = {}
+        for item in call.data[ATTR_ITEMS]:
+            coordinator = _get_coordinator(hass, item[ATTR_MEMBER_ID])
+            batches.setdefault(coordinator, []).append(item)
+
+        # Validate every group first, so an invalid item in one entry leaves
+        # the other entries unchanged as well
+        for coordinator, items in batches.items():
+            coordinator.validate_batch(items)
+        for coordinator, items in batches.items():
+            await coordinator.award_batch(items)
+
+    async def async_redeem_reward(call: ServiceCall) -> ServiceResponse:
+        """Redeem a reward for a member."""
+        member_id = call.data[ATTR_MEMBER_ID]
+        coordinator = _get_coordinator(hass, member_id)
+        record = await coordinator.redeem_reward(member_id, call.data[ATTR_REWARD_ID])
+        return dict(record)
+
+    async def async_decide(call: ServiceCall) -> ServiceResponse:
+        """Approve or reject pending items."""
+        if ATTR_MEMBER_ID in call.data:
+            coordinators = [_get_coordinator(hass, call.data[ATTR_MEMBER_ID])]
+        else:
+            coordinators = list(hass.data.get(DOMAIN, {}).values())
+
+        count = 0
+        for coordinator in coordinators:
+            decide = (
+                coordinator.approve_pending
+                if call.service == SERVICE_APPROVE
+                else coordinator.reject_pending
+            )
+            count += await decide(
+                call.data.get(ATTR_ITEM_IDS), call.data.get(ATTR_MEMBER_ID)
+            )
+        return {"count": count}
+
+    async def async_export(call: ServiceCall) -> ServiceResponse:
+        """Export the history of an entry to a file."""
+        coordinator = _get_entry_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        return await async_export_history(
+            coordinator, call.data[ATTR_FORMAT], call.data.get(ATTR_FILENAME)
+        )
+
+    async def async_import(call: ServiceCall) -> ServiceResponse:
+        """Replace the history of an entry with an exported one."""
+        coordinator = _get_entry_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        return await async_import_history(coordinator, call.data[ATTR_FILENAME])
+
+    async def async_profile_service(call: ServiceCall) -> ServiceResponse:
+        """Profile CHAMP code for a while and store the stats."""
+        return await async_profile(hass, call.data[ATTR_DURATION], call.data[ATTR_TOP])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_AWARD_POINTS, async_award_points, schema=AWARD_POINTS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_RESET_POINTS, async_reset_points, schema=RESET_POINTS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_COMPLETE_TASK, async_complete_task, schema=COMPLETE_TASK_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_AWARD_BATCH, async_award_batch, schema=AWARD_BATCH_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REDEEM_REWARD,
+        async_redeem_reward,
+        schema=REDEEM_REWARD_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    for service in (SERVICE_APPROVE, SERVICE_REJECT):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            async_decide,
+            schema=DECIDE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        async_export,
+        schema=EXPORT_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_HISTORY,
+        async_import,
+        schema=IMPORT_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile_service,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,191 @@
+"""Rolling statistics for CHAMP integration."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+from .const import (
+    STATS_DAYS_KEPT,
+    STATS_MONTHS_KEPT,
+    STATS_PERIOD_MONTH,
+    STATS_PERIOD_TODAY,
+    STATS_PERIOD_WEEK,
+    STATS_PERIODS,
+    STATS_WEEKS_KEPT,
+)
+
+
+def _day_key(day: date) -> str:
+    """Return the bucket key of a day."""
+    return day.isoformat()
+
+
+def _week_key(day: date) -> str:
+    """Return the bucket key of the week (starting Monday) of a day."""
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def _month_key(day: date) -> str:
+    """Return the bucket key of the month of a day."""
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+def _period_key(period: str, day: date) -> str:
+    """Return the bucket key of a period containing a day."""
+    if period == STATS_PERIOD_WEEK:
+        return _week_key(day)
+    if period == STATS_PERIOD_MONTH:
+        return _month_key(day)
+    return _day_key(day)
+
+
+class Bucket:
+    """Points and completions aggregated over one period."""
+
+    __slots__ = ("points", "completions", "categories", "tasks")
+
+    def __init__(self) -> None:
+        """Initialize an empty bucket."""
+        self.points = 0
+        self.completions = 0
+        self.categories: dict[str, int] = {}
+        self.tasks: dict[str, int] = {}
+
+    def add(self, points: int, task_id: str | None, category: str | None) -> None:
+        """Count an award or completion."""
+        self.points += points
+        if task_id is None:
+            return
+        self.completions += 1
+        self.tasks[task_id] = self.tasks.get(task_id, 0) + 1
+        if category is not None:
+            self.categories[category] = self.categories.get(category, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the bucket for storage."""
+        return {
+            "points": self.points,
+            "completions": self.completions,
+            "categories": self.categories,
+            "tasks": self.tasks,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Bucket:
+        """Restore a stored bucket."""
+        bucket = cls()
+        bucket.points = data["points"]
+        bucket.completions = data["completions"]
+        bucket.categories = dict(data["categories"])
+        bucket.tasks = dict(data["tasks"])
+        return bucket
+
+
+EMPTY_BUCKET = Bucket()
+
+
+class MemberStats:
+    """Daily, weekly and monthly buckets of a member.
+
+    Every award is added to the bucket of its day, week and month, so
+    reading any period is a single lookup. Old buckets expire, so the
+    history grows with the number of days, not of events.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buckets."""
+        self.buckets: dict[str, dict[str, Bucket]] = {
+            period: {} for period in STATS_PERIODS
+        }
+
+    def record(
+        self, day: date, points: int, task_id: str | None, category: str | None
+    ) -> None:
+        """Count an award or completion on a day."""
+        for period, buckets in self.buckets.items():
+            key = _period_key(period, day)
+            if (bucket := buckets.get(key)) is None:
+                bucket = buckets[key] = Bucket()
+            bucket.add(points, task_id, category)
+
+    def get(self, period: str, today: date) -> Bucket:
+        """Return the bucket of the current period."""
+        return self.buckets[period].get(_period_key(period, today), EMPTY_BUCKET)
+
+    def expire(self, today: date) -> None:
+        """Drop buckets that fell out of the retention window."""
+        first_month = today.year * 12 + today.month - 1 - STATS_MONTHS_KEPT
+        cutoffs = {
+            STATS_PERIOD_TODAY: _day_key(today - timedelta(days=STATS_DAYS_KEPT)),
+            STATS_PERIOD_WEEK: _week_key(today - timedelta(weeks=STATS_WEEKS_KEPT)),
+            STATS_PERIOD_MONTH: _month_key(
+                date(first_month // 12, first_month % 12 + 1, 1)
+            ),
+        }
+        for period, buckets in self.buckets.items():
+            # ISO keys sort chronologically
+            for key in [key for key in buckets if key < cutoffs[period]]:
+                del buckets[key]
+
+
+class StatsTracker:
+    """Rolling statistics of all members."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._members: dict[str, MemberStats] = {}
+
+    def record(
+        self,
+        member_id: str,
+        day: date,
+        points: int,
+        task_id: str | None = None,
+        category: str | None = None,
+    ) -> None:
+        """Count an award or completion of a member."""
+        if (stats := self._members.get(member_id)) is None:
+            stats = self._members[member_id] = MemberStats()
+        stats.record(day, points, task_id, category)
+
+    def get(self, member_id: str, period: str, today: date) -> Bucket:
+        """Return the bucket of a member for the current period."""
+        if (stats := self._members.get(member_id)) is None:
+            return EMPTY_BUCKET
+        return stats.get(period, today)
+
+    def roll_over(self, today: date) -> set[str]:
+        """Expire old buckets and return members whose current periods reset."""
+        yesterday = today - timedelta(days=1)
+        changed = set()
+        for member_id, stats in self._members.items():
+            for period in STATS_PERIODS:
+                key = _period_key(period, yesterday)
+                if key != _period_key(period, today) and key in stats.buckets[period]:
+                    changed.add(member_id)
+            stats.expire(today)
+        return changed
+
+    def remove_member(self, member_id: str) -> None:
+        """Forget the statistics of a member."""
+        self._members.pop(member_id, None)
+
+    def load(self, data: dict[str, dict[str, dict[str, Any]]]) -> None:
+        """Load stored buckets."""
+        for member_id, periods in data.items():
+            stats = self._members[member_id] = MemberStats()
+            for period, buckets in periods.items():
+                stats.buckets[period] = {
+                    key: Bucket.from_dict(bucket) for key, bucket in buckets.items()
+                }
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the buckets for storage."""
+        return {
+            member_id: {
+                period: {key: bucket.as_dict() for key, bucket in buckets.items()}
+                for period, buckets in stats.buckets.items()
+            }
+            for member_id, stats in self._members.items()
+        }
@@ -0,0 +1,79 @@
+"""Persistent storage for CHAMP integration."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+from .instrumentation import PERF_STORAGE_FLUSH, Instrumentation
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ChampStorage:
+    """Debounced persistence of CHAMP state on top of the HA store.
+
+    Saves are coalesced: every change schedules a delayed save, and a burst
+    of changes within the delay results in a single write. Pending data is
+    written by the store on Home Assistant shutdown or by async_flush.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        perf: Instrumentation | None = None,
+    ) -> None:
+        """Initialize the storage."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data_func: Callable[[], dict[str, Any]] | None = None
+        self._perf = perf or Instrumentation()
+
+    @property
+    def flush_count(self) -> int:
+        """Return the number of writes to disk."""
+        return self._perf.counter(PERF_STORAGE_FLUSH).count
+
+    async def async_load(self) -> dict[str, Any]:
+        """Load the stored data in a single read."""
+        return await self._store.async_load() or {}
+
+    @callback
+    def async_schedule_save(self, data_func: Callable[[], dict[str, Any]]) -> None:
+        """Schedule a delayed save, coalescing with any pending one."""
+        self._data_func = data_func
+        self._store.async_delay_save(self._async_collect, STORAGE_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write pending data to disk immediately."""
+        if self._data_func is None:
+            return
+        await self._store.async_save(self._async_collect())
+
+    async def async_remove(self) -> None:
+        """Remove the stored data."""
+        self._data_func = None
+        await self._store.async_remove()
+
+    @callback
+    def _async_collect(self) -> dict[str, Any]:
+        """Collect the data to write and clear the pending state.
+
+        The recorded duration is the time spent collecting the data in the
+        event loop; the store serializes and writes it in the executor.
+        """
+        assert self._data_func is not None
+        started = time.perf_counter()
+        data = self._data_func()
+        self._data_func = None
+        self._perf.record(PERF_STORAGE_FLUSH, started)
+        _LOGGER.debug("Writing CHAMP storage (flush %d)", self.flush_count)
+        return data
@@ -0,0 +1,131 @@
+"""Streak tracking for CHAMP integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, timedelta
+from typing import Any
+
+
+class Streak:
+    """Consecutive days with at least one completion."""
+
+    __slots__ = ("current", "longest", "last")
+
+    def __init__(
+        self, current: int = 0, longest: int = 0, last: date | None = None
+    ) -> None:
+        """Initialize the streak."""
+        self.current = current
+        self.longest = longest
+        self.last = last
+
+    def record(self, day: date) -> bool:
+        """Count a completion on a day, returning whether the streak changed."""
+        if self.last is not None and day <= self.last:
+            return False
+        if self.last is not None and day - self.last == timedelta(days=1):
+            self.current += 1
+        else:
+            self.current = 1
+        self.longest = max(self.longest, self.current)
+        self.last = day
+        return True
+
+    def roll_over(self, today: date) -> bool:
+        """Break the streak if nothing was completed yesterday."""
+        if self.current and (
+            self.last is None or today - self.last > timedelta(days=1)
+        ):
+            self.current = 0
+            return True
+        return False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the streak as attributes."""
+        return {
+            "current": self.current,
+            "longest": self.longest,
+            "last": self.last.isoformat() if self.last else None,
+        }
+
+
+class StreakTracker:
+    """Per-member and per-(member, task) streaks.
+
+    Streaks are updated in O(1) per completion. At day rollover every
+    streak is checked once; the completion history is never scanned.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._members: dict[str, Streak] = {}
+        self._tasks: dict[str, dict[str, Streak]] = {}
+
+    def record(self, member_id: str, task_id: str, day: date) -> None:
+        """Count a completion of a task by a member."""
+        self._members.setdefault(member_id, Streak()).record(day)
+        task_streaks = self._tasks.setdefault(member_id, {})
+        task_streaks.setdefault(task_id, Streak()).record(day)
+
+    def roll_over(self, today: date) -> set[str]:
+        """Break streaks not continued yesterday, returning affected members."""
+        changed = {
+            member_id
+            for member_id, streak in self._members.items()
+            if streak.roll_over(today)
+        }
+        for member_id, task_streaks in self._tasks.items():
+            for streak in task_streaks.values():
+                if streak.roll_over(today):
+                    changed.add(member_id)
+        return changed
+
+    def member(self, member_id: str) -> Streak:
+        """Return the streak of a member."""
+        return self._members.get(member_id) or Streak()
+
+    def tasks(self, member_id: str) -> dict[str, Streak]:
+        """Return the task streaks of a member."""
+        return self._tasks.get(member_id, {})
+
+    def remove_member(self, member_id: str) -> None:
+        """Forget the streaks of a member."""
+        self._members.pop(member_id, None)
+        self._tasks.pop(member_id, None)
+
+    def remove_task(self, task_id: str) -> None:
+        """Forget the streaks of a task."""
+        for task_streaks in self._tasks.values():
+            task_streaks.pop(task_id, None)
+
+    def load(self, rows: Iterable[list[Any]]) -> None:
+        """Load stored [member_id, task_id or None, current, longest, last] rows."""
+        for member_id, task_id, current, longest, last in rows:
+            last_day = date.fromisoformat(last) if last else None
+            streak = Streak(current, longest, last_day)
+            if task_id is None:
+                self._members[member_id] = streak
+            else:
+                self._tasks.setdefault(member_id, {})[task_id] = streak
+
+    def as_rows(self) -> list[list[Any]]:
+        """Return the streaks as rows for storage."""
+        rows: list[list[Any]] = []
+        for member_id, streak in self._members.items():
+            rows.append(_row(member_id, None, streak))
+        for member_id, task_streaks in self._tasks.items():
+            for task_id, streak in task_streaks.items():
+                rows.append(_row(member_id, task_id, streak))
+        return rows
+
+
+def _row(member_id: str, task_id: str | None, streak: Streak) -> list[Any]:
+    """Return a storage row of a streak."""
+    return [
+        member_id,
+        task_id,
+        streak.current,
+        streak.longest,
+        streak.last.isoformat() if streak.last else None,
+    ]
@@ -2,24 +2,29 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_MEMBER_NAME,
-    CONF_TASK_ASSIGNED_TO,
     CONF_TASK_ICON,
     CONF_TASK_ID,
     CONF_TASK_NAME,
     CONF_TASK_POINTS,
+    CONF_TASK_RECURRENCE,
     DOMAIN,
+    RECURRENCE_NONE,
+    SIGNAL_TASKS_ADDED,
+    SWITCH_AUTO_OFF_DELAY,
 )
 from .coordinator import ChampDataCoordinator
 
@@ -41,13 +46,10 @@ async def async_setup_entry(
         member_config = member_data["config"]
 
         # Create switches for tasks assigned to this member
-        for task in coordinator.data["tasks"]:
-            # Check if task is assigned to this member or to all
-            assigned_to = task.get(CONF_TASK_ASSIGNED_TO, ["all"])
-            if "all" in assigned_to or member_id in assigned_to:
-                entities.append(
-                    ChampTaskSwitch(coordinator, member_id, member_config, task)
-                )
+        for task in coordinator.get_member_tasks(member_id):
+            entities.append(
+                ChampTaskSwitch(coordinator, member_id, member_config, task)
+            )
 
     async_add_entities(entities)
 
@@ -57,9 +59,36 @@ async def async_setup_entry(
         len(coordinator.data["members"]),
     )
 
+    @callback
+    def async_add_task_switches(switches: list[tuple[str, str]]) -> None:
+        """Add switches for (member_id, task_id) assignments."""
+        async_add_entities(
+            ChampTaskSwitch(
+                coordinator,
+                member_id,
+                coordinator.data["members"][member_id]["config"],
+                task,
+            )
+            for member_id, task_id in switches
+            if (task := coordinator.get_task(task_id)) is not None
+        )
+
+    # Task assignments added by a configuration change
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_TASKS_ADDED.format(entry_id=config_entry.entry_id),
+            async_add_task_switches,
+        )
+    )
+
 
 class ChampTaskSwitch(CoordinatorEntity[ChampDataCoordinator], SwitchEntity):
-    """Switch entity for a CHAMP task."""
+    """Switch entity for a CHAMP task.
+
+    Switches of one-off tasks turn off again after a short delay. Switches
+    of recurring tasks stay on until the task resets.
+    """
 
     _attr_is_on = False
 
@@ -76,15 +105,14 @@ class ChampTaskSwitch(CoordinatorEntity[ChampDataCoordinator], SwitchEntity):
         self._member_id = member_id
         self._member_config = member_config
         self._task_config = task_config
+        self._unsub_auto_off: CALLBACK_TYPE | None = None
 
         task_id = task_config[CONF_TASK_ID]
         member_name = member_config[CONF_MEMBER_NAME]
-        task_name = task_config[CONF_TASK_NAME]
 
-        self._attr_name = f"{member_name} - {task_name}"
         self._attr_unique_id = f"{DOMAIN}_{member_id}_{task_id}"
         self.entity_id = f"switch.{DOMAIN}_{member_id}_{task_id}"
-        self._attr_icon = task_config.get(CONF_TASK_ICON, "mdi:checkbox-marked-circle")
+        self._update_from_config()
 
         self._attr_device_info = {
             "identifiers": {(DOMAIN, member_id)},
@@ -93,6 +121,60 @@ class ChampTaskSwitch(CoordinatorEntity[ChampDataCoordinator], SwitchEntity):
             "model": "Member Profile",
         }
 
+    @callback
+    def _update_from_config(self) -> None:
+        """Update name and icon from the member and task configuration."""
+        member_name = self._member_config[CONF_MEMBER_NAME]
+        task_name = self._task_config[CONF_TASK_NAME]
+        self._attr_name = f"{member_name} - {task_name}"
+        self._attr_icon = self._task_config.get(
+            CONF_TASK_ICON, "mdi:checkbox-marked-circle"
+        )
+        self._recurrence = self._task_config.get(CONF_TASK_RECURRENCE, RECURRENCE_NONE)
+
+    async def async_added_to_hass(self) -> None:
+        """Register member and task configuration listeners."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_profile_listener(
+                self._member_id, self._handle_config_update
+            )
+        )
+        self.async_on_remove(
+            self.coordinator.async_add_task_listener(
+                self._task_config[CONF_TASK_ID], self._handle_config_update
+            )
+        )
+        self.async_on_remove(
+            self.coordinator.async_add_assignment_listener(
+                self._member_id,
+                self._task_config[CONF_TASK_ID],
+                self.async_write_ha_state,
+            )
+        )
+
+    @callback
+    def _handle_config_update(self) -> None:
+        """Handle a changed member or task configuration."""
+        member_data = self.coordinator.data["members"].get(self._member_id)
+        task_config = self.coordinator.get_task(self._task_config[CONF_TASK_ID])
+        if member_data is None or task_config is None:
+            return
+
+        self._member_config = member_data["config"]
+        self._task_config = task_config
+        self._update_from_config()
+        self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether the task is done."""
+        if self._recurrence != RECURRENCE_NONE:
+            return self.coordinator.is_task_done(
+                self._member_id, self._task_config[CONF_TASK_ID]
+            )
+        return self._attr_is_on
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
@@ -102,6 +184,7 @@ class ChampTaskSwitch(CoordinatorEntity[ChampDataCoordinator], SwitchEntity):
             "task_id": self._task_config[CONF_TASK_ID],
             "task_name": self._task_config[CONF_TASK_NAME],
             "points": self._task_config[CONF_TASK_POINTS],
+            "recurrence": self._recurrence,
         }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -117,44 +200,51 @@ class ChampTaskSwitch(CoordinatorEntity[ChampDataCoordinator], SwitchEntity):
             points,
         )
 
-        # Award points
-        await self.coordinator.award_points(self._member_id, points)
+        # Award points, duplicate taps within the debounce window are ignored
+        if not await self.coordinator.complete_task(
+            self._member_id, self._task_config[CONF_TASK_ID]
+        ):
+            return
+
+        # Recurring tasks stay on until reset, the coordinator writes the state
+        if self._recurrence != RECURRENCE_NONE:
+            return
+
+        # Turn switch on temporarily, repeated taps only extend the window
+        if not self._attr_is_on:
+            self._attr_is_on = True
+            self.async_write_ha_state()
+
+        # Auto turn off after a short delay (provides visual feedback)
+        self._cancel_auto_off()
+        self._unsub_auto_off = async_call_later(
+            self.hass, SWITCH_AUTO_OFF_DELAY, self._async_auto_off
+        )
 
-        # Turn switch on temporarily
-        self._attr_is_on = True
+    @callback
+    def _async_auto_off(self, _now: datetime) -> None:
+        """Turn the switch off after the feedback delay."""
+        self._unsub_auto_off = None
+        self._attr_is_on = False
         self.async_write_ha_state()
 
-        # Send notification
-        await self._send_notification(member_name, task_name, points)
+    @callback
+    def _cancel_auto_off(self) -> None:
+        """Cancel a scheduled auto off."""
+        if self._unsub_auto_off is not None:
+            self._unsub_auto_off()
+            self._unsub_auto_off = None
 
-        # Auto turn off after 2 seconds (provides visual feedback)
-        await asyncio.sleep(2)
-        self._attr_is_on = False
-        self.async_write_ha_state()
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the auto off when removed."""
+        self._cancel_auto_off()
+        await super().async_will_remove_from_hass()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
         # Switches auto turn off, manual turn off does nothing
+        if self._recurrence != RECURRENCE_NONE:
+            return
+        self._cancel_auto_off()
         self._attr_is_on = False
         self.async_write_ha_state()
-
-    async def _send_notification(
-        self, member_name: str, task_name: str, points: int
-    ) -> None:
-        """Send a notification about task completion."""
-        total_points = self.coordinator.get_member_points(self._member_id)
-        level = self.coordinator.get_member_level(self._member_id)
-
-        message = (
-            f"{member_name} hat {points} Punkte für {task_name} verdient! "
-            f"Gesamt: {total_points} Punkte (Level {level})"
-        )
-
-        await self.hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "🎉 Punkte verdient!",
-                "message": message,
-            },
-        )
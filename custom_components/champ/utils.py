@@ -1,26 +1,83 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
 from datetime import date, datetime
 from typing import Optional
 
 
-def calculate_age(birthdate_str: Optional[str]) -> Optional[int]:
-    """Calculate age from birthdate string (YYYY-MM-DD).
+def parse_birthdate(birthdate_str: Optional[str]) -> Optional[date]:
+    """Parse a birthdate string (YYYY-MM-DD).
 
     Returns:
-        Age in years, or None if no birthdate provided.
+        The birthdate, or None if not provided or invalid.
     """
     if not birthdate_str:
         return None
 
     try:
-        birthdate = datetime.fromisoformat(birthdate_str).date()
-        today = date.today()
+        return datetime.fromisoformat(birthdate_str).date()
+    except (ValueError, TypeError):
+        return None
+
+
+def age_on(birthdate: date, today: date) -> int:
+    """Calculate the age in years on a given day."""
+    age = today.year - birthdate.year
 
-        age = today.year - birthdate.year
+    # Adjust if birthday hasn't occurred this year yet
+    if (today.month, today.day) < (birthdate.month, birthdate.day):
+        age -= 1
 
-        # Adjust if birthday hasn't occurred this year yet
-        if (today.month, today.day) < (birthdate.month, birthdate.day):
-            age -= 1
+    return age
 
-        return age
-    except (ValueError, AttributeError):
+
+def calculate_age(birthdate_str: Optional[str]) -> Optional[int]:
+    """Calculate age from birthdate string (YYYY-MM-DD).
+
+    Returns:
+        Age in years, or None if no birthdate provided.
+    """
+    birthdate = parse_birthdate(birthdate_str)
+    if birthdate is None:
         return None
+
+    return age_on(birthdate, date.today())
+
+
+class TTLCache:
+    """Bounded set of keys that expire after a fixed time.
+
+    Entries share one TTL, so insertion order is also expiry order and
+    expired keys are evicted from the front in amortized O(1).
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._expiries: OrderedDict[Hashable, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached keys."""
+        return len(self._expiries)
+
+    def add(self, key: Hashable) -> bool:
+        """Add a key, returning False if it is already cached and not expired."""
+        now = time.monotonic()
+        self._evict(now)
+
+        if key in self._expiries:
+            return False
+
+        self._expiries[key] = now + self.ttl
+        if len(self._expiries) > self.maxsize:
+            self._expiries.popitem(last=False)
+        return True
+
+    def _evict(self, now: float) -> None:
+        """Drop expired keys."""
+        while self._expiries:
+            key, expiry = next(iter(self._expiries.items()))
+            if expiry > now:
+                break
+            del self._expiries[key]
@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""Simulate a year of household activity against the CHAMP coordinator.
+
+The coordinator runs on a bare Home Assistant core without a running
+instance. All CHAMP timers (ledger flushes, delayed saves, notification
+windows, recurring resets and midnight rollovers) follow a simulated clock,
+so a year is replayed in seconds while flush and notification counts match
+what the configured delays would produce in real time. Ledger and storage
+files are written to a temporary directory.
+
+Example:
+    python3 simulate_champ.py --members 10 --tasks 200 --days 365
+"""
+
+import argparse
+import asyncio
+import heapq
+import inspect
+import itertools
+import json
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from custom_components.champ import ledger, notifications, storage
+from custom_components.champ.const import (
+    CONF_COMPLETION_DEBOUNCE,
+    CONF_LEVEL_CONFIG,
+    CONF_MEMBER_ID,
+    CONF_MEMBER_NAME,
+    CONF_MEMBERS,
+    CONF_NOTIFICATION_WINDOW,
+    CONF_POINTS_PER_LEVEL,
+    CONF_REWARD_APPROVAL_REQUIRED,
+    CONF_REWARD_COST,
+    CONF_REWARD_ID,
+    CONF_REWARD_NAME,
+    CONF_REWARDS,
+    CONF_TASK_ASSIGNED_TO,
+    CONF_TASK_CATEGORY,
+    CONF_TASK_ID,
+    CONF_TASK_NAME,
+    CONF_TASK_POINTS,
+    CONF_TASK_RECURRENCE,
+    CONF_TASKS,
+    DEFAULT_COMPLETION_DEBOUNCE,
+    DEFAULT_NOTIFICATION_WINDOW,
+    DOMAIN,
+    LEDGER_FLUSH_DELAY,
+    RECURRENCE_DAILY,
+    RECURRENCE_NONE,
+    STORAGE_SAVE_DELAY,
+    TASK_CATEGORIES,
+)
+from custom_components.champ.coordinator import ChampDataCoordinator
+
+# Completions and redemptions happen between these local hours
+DAY_START_HOUR = 7
+DAY_END_HOUR = 21
+
+REWARD_COSTS = [20, 50, 100]
+
+
+class SimClock:
+    """Simulated time with a single timer queue.
+
+    Timers run in due order when the clock advances. Callbacks may return
+    a coroutine, which is awaited before the next timer runs.
+    """
+
+    def __init__(self, start: datetime) -> None:
+        """Initialize the clock."""
+        self.utc = start
+        self._timers: list[tuple[datetime, int, list]] = []
+        self._counter = itertools.count()
+        self._midnight_actions: list = []
+        self.timers_fired = 0
+
+    def utcnow(self) -> datetime:
+        """Return the simulated time in UTC."""
+        return self.utc
+
+    def now(self, time_zone=None) -> datetime:
+        """Return the simulated time in a time zone, local by default."""
+        return self.utc.astimezone(time_zone or dt_util.DEFAULT_TIME_ZONE)
+
+    def monotonic(self) -> float:
+        """Return the simulated time as monotonic seconds."""
+        return self.utc.timestamp()
+
+    def call_later(self, hass, delay, action):
+        """Replacement of async_call_later."""
+        return self._schedule(self.utc + timedelta(seconds=delay), action)
+
+    def track_point_in_utc_time(self, hass, action, point):
+        """Replacement of async_track_point_in_utc_time."""
+        return self._schedule(point, action)
+
+    def track_time_change(self, hass, action, **kwargs):
+        """Replacement of async_track_time_change, firing at local midnight."""
+        if not self._midnight_actions:
+            self._schedule(self._next_midnight(), self._midnight)
+        self._midnight_actions.append(action)
+        return lambda: self._midnight_actions.remove(action)
+
+    def _next_midnight(self) -> datetime:
+        """Return the next local midnight in UTC."""
+        tomorrow = dt_util.as_local(self.utc).date() + timedelta(days=1)
+        return dt_util.as_utc(dt_util.start_of_local_day(tomorrow))
+
+    def _midnight(self, now: datetime) -> None:
+        """Run the midnight actions and schedule the next midnight."""
+        for action in list(self._midnight_actions):
+            action(dt_util.as_local(now))
+        self._schedule(self._next_midnight(), self._midnight)
+
+    def _schedule(self, when: datetime, action):
+        """Queue a timer and return its cancel function."""
+        timer = [action]
+        heapq.heappush(self._timers, (when, next(self._counter), timer))
+
+        def cancel() -> None:
+            timer[0] = None
+
+        return cancel
+
+    async def advance(self, target: datetime) -> None:
+        """Run all timers due up to target and move the clock there."""
+        while self._timers and self._timers[0][0] <= target:
+            when, _, timer = heapq.heappop(self._timers)
+            if timer[0] is None:
+                continue
+            self.utc = max(self.utc, when)
+            self.timers_fired += 1
+            result = timer[0](self.utc)
+            if inspect.isawaitable(result):
+                await result
+        self.utc = max(self.utc, target)
+
+
+class SimTime:
+    """The time module with monotonic following the simulated clock.
+
+    Patched into the CHAMP modules only, so the event loop keeps real time.
+    """
+
+    def __init__(self, clock: SimClock) -> None:
+        """Initialize the time module wrapper."""
+        self.monotonic = clock.monotonic
+
+    def __getattr__(self, name: str):
+        """Return the other functions of the time module."""
+        return getattr(time, name)
+
+
+class SimStore:
+    """Home Assistant store whose delayed saves follow the simulated clock.
+
+    Like the real store, every delayed save restarts the delay.
+    """
+
+    def __init__(self, clock: SimClock, store) -> None:
+        """Initialize the store wrapper."""
+        self._clock = clock
+        self._store = store
+        self._data_func = None
+        self._cancel = None
+
+    async def async_load(self):
+        """Load the stored data."""
+        return await self._store.async_load()
+
+    def async_delay_save(self, data_func, delay: float = 0) -> None:
+        """Save the data after a simulated delay."""
+        if self._cancel is not None:
+            self._cancel()
+        self._data_func = data_func
+        self._cancel = self._clock.call_later(None, delay, self._async_delayed_save)
+
+    async def _async_delayed_save(self, _now: datetime) -> None:
+        """Write the data when the delay expires."""
+        self._cancel = None
+        data_func, self._data_func = self._data_func, None
+        await self._store.async_save(data_func())
+
+    async def async_save(self, data) -> None:
+        """Save the data immediately."""
+        if self._cancel is not None:
+            self._cancel()
+            self._cancel = None
+        self._data_func = None
+        await self._store.async_save(data)
+
+    async def async_remove(self) -> None:
+        """Remove the stored data."""
+        await self._store.async_remove()
+
+
+def build_entry(
+    args: argparse.Namespace, rng: random.Random
+) -> config_entries.ConfigEntry:
+    """Build a config entry with generated members, tasks and rewards."""
+    members = [
+        {CONF_MEMBER_ID: f"member_{index:03d}", CONF_MEMBER_NAME: f"Member {index}"}
+        for index in range(args.members)
+    ]
+    tasks = [
+        {
+            CONF_TASK_ID: f"task_{index:03d}",
+            CONF_TASK_NAME: f"Task {index}",
+            CONF_TASK_POINTS: rng.randint(1, 10),
+            CONF_TASK_CATEGORY: TASK_CATEGORIES[index % len(TASK_CATEGORIES)],
+            CONF_TASK_ASSIGNED_TO: ["all"],
+            CONF_TASK_RECURRENCE: (
+                RECURRENCE_DAILY if rng.random() < args.recurring else RECURRENCE_NONE
+            ),
+        }
+        for index in range(args.tasks)
+    ]
+    rewards = [
+        {
+            CONF_REWARD_ID: f"reward_{cost}",
+            CONF_REWARD_NAME: f"Reward {cost}",
+            CONF_REWARD_COST: cost,
+            CONF_REWARD_APPROVAL_REQUIRED: False,
+        }
+        for cost in REWARD_COSTS
+    ]
+    return config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        entry_id="simulation",
+        title=f"CHAMP ({args.members} members)",
+        source=config_entries.SOURCE_USER,
+        data={
+            CONF_MEMBERS: members,
+            CONF_TASKS: tasks,
+            CONF_REWARDS: rewards,
+            CONF_LEVEL_CONFIG: {CONF_POINTS_PER_LEVEL: 100},
+        },
+        options={
+            CONF_COMPLETION_DEBOUNCE: DEFAULT_COMPLETION_DEBOUNCE,
+            CONF_NOTIFICATION_WINDOW: args.notification_window,
+        },
+    )
+
+
+def day_actions(
+    args: argparse.Namespace,
+    rng: random.Random,
+    day_start: datetime,
+    member_ids: list[str],
+    task_ids: list[str],
+) -> list[tuple[datetime, str, tuple]]:
+    """Generate the (time, action, arguments) of one day, in time order."""
+    window = (DAY_END_HOUR - DAY_START_HOUR) * 3600
+    first = day_start + timedelta(hours=DAY_START_HOUR)
+
+    def at() -> datetime:
+        return first + timedelta(seconds=rng.uniform(0, window))
+
+    actions = []
+    for member_id in member_ids:
+        for task_id in task_ids:
+            if rng.random() < args.completion_rate:
+                actions.append((at(), "complete", (member_id, task_id)))
+        if rng.random() < args.burst_rate:
+            items = [
+                {"member_id": member_id, "task_id": rng.choice(task_ids)}
+                for _ in range(args.burst_size)
+            ]
+            actions.append((at(), "batch", (items,)))
+        if rng.random() < args.redemption_rate:
+            actions.append((at(), "redeem", (member_id, rng.choice(REWARD_COSTS))))
+    actions.sort(key=lambda action: action[0])
+    return actions
+
+
+async def simulate(args: argparse.Namespace) -> dict:
+    """Run the simulation and return the report."""
+    rng = random.Random(args.seed)
+    dt_util.set_default_time_zone(dt_util.get_time_zone(args.time_zone))
+    start = dt_util.as_utc(
+        dt_util.start_of_local_day(datetime.fromisoformat(args.start).date())
+    )
+    clock = SimClock(start)
+    sim_time = SimTime(clock)
+
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        patch.object(dt_util, "utcnow", clock.utcnow),
+        patch.object(dt_util, "now", clock.now),
+        patch("custom_components.champ.utils.time", sim_time),
+        patch.object(notifications, "time", sim_time),
+        patch.object(notifications, "async_call_later", clock.call_later),
+        patch.object(ledger, "async_call_later", clock.call_later),
+        patch.object(ledger, "LEDGER_FLUSH_DELAY", args.ledger_flush_delay),
+        patch.object(storage, "STORAGE_SAVE_DELAY", args.storage_delay),
+        patch(
+            "custom_components.champ.scheduler.async_track_point_in_utc_time",
+            clock.track_point_in_utc_time,
+        ),
+        patch(
+            "custom_components.champ.coordinator.async_track_time_change",
+            clock.track_time_change,
+        ),
+    ):
+        hass = HomeAssistant(config_dir)
+        try:
+            return await _run(hass, args, rng, clock)
+        finally:
+            await hass.async_stop(force=True)
+
+
+async def _run(
+    hass: HomeAssistant,
+    args: argparse.Namespace,
+    rng: random.Random,
+    clock: SimClock,
+) -> dict:
+    """Replay the generated activity through a coordinator."""
+
+    async def create_notification(call: ServiceCall) -> None:
+        """Stand in for persistent notifications."""
+
+    hass.services.async_register(
+        "persistent_notification", "create", create_notification
+    )
+
+    entry = build_entry(args, rng)
+    config_entries.current_entry.set(entry)
+    coordinator = ChampDataCoordinator(hass, entry)
+    coordinator.storage._store = SimStore(clock, coordinator.storage._store)
+    await coordinator.async_load()
+
+    member_ids = list(coordinator.data["members"])
+    task_ids = [task[CONF_TASK_ID] for task in coordinator.data["tasks"]]
+
+    counts = {
+        "completions": 0,
+        "rejected": 0,
+        "batches": 0,
+        "redemptions": 0,
+        "declined": 0,
+    }
+    latencies: list[float] = []
+
+    if args.trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+
+    first_day = dt_util.as_local(clock.utc).date()
+    for day in range(args.days):
+        day_start = dt_util.as_utc(
+            dt_util.start_of_local_day(first_day + timedelta(days=day))
+        )
+        for when, action, action_args in day_actions(
+            args, rng, day_start, member_ids, task_ids
+        ):
+            await clock.advance(when)
+            call_started = time.perf_counter()
+            try:
+                if action == "complete":
+                    if not await coordinator.complete_task(*action_args):
+                        counts["rejected"] += 1
+                    counts["completions"] += 1
+                elif action == "batch":
+                    await coordinator.award_batch(*action_args)
+                    counts["batches"] += 1
+                else:
+                    member_id, cost = action_args
+                    await coordinator.redeem_reward(member_id, f"reward_{cost}")
+                    counts["redemptions"] += 1
+            except HomeAssistantError:
+                counts["declined"] += 1
+            latencies.append(time.perf_counter() - call_started)
+
+    # Let pending flushes, saves and notifications run
+    await clock.advance(clock.utc + timedelta(days=1))
+    elapsed = time.perf_counter() - started
+
+    peak_traced = None
+    if args.trace_memory:
+        peak_traced = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    events = coordinator.ledger.last_seq
+    await coordinator.async_shutdown()
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+    report = {
+        "members": args.members,
+        "tasks": args.tasks,
+        "days": args.days,
+        **counts,
+        "mutations": len(latencies),
+        "ledger_events": events,
+        "wall_time_s": round(elapsed, 3),
+        "events_per_s": round(events / elapsed, 1) if elapsed else None,
+        "latency_p50_ms": round(quantiles[49] * 1000, 3) if quantiles else None,
+        "latency_p99_ms": round(quantiles[98] * 1000, 3) if quantiles else None,
+        "storage_flushes": coordinator.storage.flush_count,
+        "ledger_flushes": coordinator.ledger.flush_count,
+        "notifications_sent": coordinator.notifier.sent_count,
+        "scheduler_wakeups": coordinator.scheduler.wakeups,
+        "state_writes": coordinator.state_writes,
+        "timers_fired": clock.timers_fired,
+        "peak_rss_mib": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+    }
+    if peak_traced is not None:
+        report["peak_traced_mib"] = round(peak_traced / 1024 / 1024, 1)
+    return report
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=4)
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--start", default="2025-01-01", help="first day (ISO)")
+    parser.add_argument("--time-zone", default="UTC")
+    parser.add_argument(
+        "--completion-rate",
+        type=float,
+        default=0.1,
+        help="daily probability that a member completes each task",
+    )
+    parser.add_argument(
+        "--recurring",
+        type=float,
+        default=0.3,
+        help="share of tasks that recur daily",
+    )
+    parser.add_argument(
+        "--burst-rate",
+        type=float,
+        default=0.05,
+        help="daily probability of a batch of completions per member",
+    )
+    parser.add_argument("--burst-size", type=int, default=20)
+    parser.add_argument(
+        "--redemption-rate",
+        type=float,
+        default=0.1,
+        help="daily probability that a member redeems a reward",
+    )
+    parser.add_argument(
+        "--storage-delay",
+        type=float,
+        default=STORAGE_SAVE_DELAY,
+        help="seconds a storage save is delayed",
+    )
+    parser.add_argument(
+        "--ledger-flush-delay",
+        type=float,
+        default=LEDGER_FLUSH_DELAY,
+        help="seconds ledger events are buffered",
+    )
+    parser.add_argument(
+        "--notification-window",
+        type=float,
+        default=DEFAULT_NOTIFICATION_WINDOW,
+        help="seconds completions are summarized per notification",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="measure peak Python allocations (slows the run down)",
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the simulator."""
+    args = parse_args(argv)
+
+    print(
+        f"🏠 Simulating {args.days} days of {args.members} members "
+        f"and {args.tasks} tasks",
+        file=sys.stderr,
+    )
+    report = asyncio.run(simulate(args))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print("=" * 50)
+    width = max(len(key) for key in report)
+    for key, value in report.items():
+        print(f"{key:<{width}}  {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""Fixtures for CHAMP benchmarks."""
+
+import json
+from pathlib import Path
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.champ.const import (
+    CONF_LEVEL_CONFIG,
+    CONF_MEMBER_ID,
+    CONF_MEMBER_NAME,
+    CONF_MEMBERS,
+    CONF_POINTS_PER_LEVEL,
+    CONF_TASK_ASSIGNED_TO,
+    CONF_TASK_CATEGORY,
+    CONF_TASK_ID,
+    CONF_TASK_NAME,
+    CONF_TASK_POINTS,
+    CONF_TASKS,
+    DOMAIN,
+    TASK_CATEGORIES,
+)
+
+BASELINES_FILE = Path(__file__).with_name("baselines.json")
+
+
+def make_household(members: int, tasks: int) -> MockConfigEntry:
+    """Create a config entry with the given number of members and tasks.
+
+    Member IDs are zero-padded, so they sort in creation order. Every task
+    is assigned to all members.
+    """
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=f"CHAMP ({members} members)",
+        data={
+            CONF_MEMBERS: [
+                {
+                    CONF_MEMBER_ID: f"member_{index:03d}",
+                    CONF_MEMBER_NAME: f"Member {index}",
+                }
+                for index in range(members)
+            ],
+            CONF_TASKS: [
+                {
+                    CONF_TASK_ID: f"task_{index:03d}",
+                    CONF_TASK_NAME: f"Task {index}",
+                    CONF_TASK_POINTS: index % 10 + 1,
+                    CONF_TASK_CATEGORY: TASK_CATEGORIES[index % len(TASK_CATEGORIES)],
+                    CONF_TASK_ASSIGNED_TO: ["all"],
+                }
+                for index in range(tasks)
+            ],
+            CONF_LEVEL_CONFIG: {CONF_POINTS_PER_LEVEL: 50},
+        },
+    )
+
+
+@pytest.fixture
+def household():
+    """Return the household generator."""
+    return make_household
+
+
+class Baselines:
+    """Stored benchmark results that new results must not exceed."""
+
+    def __init__(self, data: dict, update: bool) -> None:
+        """Initialize the baselines."""
+        self.data = data
+        self.update = update
+        self.results: dict[str, dict[str, float]] = {}
+
+    def check(self, scenario: str, results: dict[str, float]) -> None:
+        """Fail if a result exceeds its baseline plus tolerance.
+
+        Metrics without a tolerance are only reported. A metric with a
+        tolerance but no stored baseline fails, so it cannot go unchecked.
+        """
+        self.results.setdefault(scenario, {}).update(results)
+        if self.update:
+            return
+
+        baseline = self.data["scenarios"].get(scenario, {})
+        failures = []
+        for metric, value in results.items():
+            if metric not in self.data["tolerance"]:
+                continue
+            if metric not in baseline:
+                failures.append(f"{metric} has no baseline")
+                continue
+            limit = baseline[metric] * (1 + self.data["tolerance"].get(metric, 0))
+            if value > limit:
+                failures.append(
+                    f"{metric} = {value:.4g} exceeds {limit:.4g} "
+                    f"(baseline {baseline[metric]:.4g})"
+                )
+        assert not failures, f"{scenario}: " + "; ".join(failures)
+
+    def save(self) -> None:
+        """Store the collected results as the new baselines."""
+        for scenario, results in self.results.items():
+            self.data["scenarios"].setdefault(scenario, {}).update(
+                {metric: round(value, 4) for metric, value in results.items()}
+            )
+        BASELINES_FILE.write_text(
+            json.dumps(self.data, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+
+
+@pytest.fixture(scope="session")
+def baselines(request):
+    """Load the baselines and store new results if requested."""
+    update = request.config.getoption("--update-baselines")
+    data = json.loads(BASELINES_FILE.read_text(encoding="utf-8"))
+    baselines = Baselines(data, update)
+    yield baselines
+
+    if update and baselines.results:
+        baselines.save()
+
+    reporter = request.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.write_line("")
+        for scenario, results in sorted(baselines.results.items()):
+            metrics = ", ".join(
+                f"{metric}={value:.4g}" for metric, value in results.items()
+            )
+            reporter.write_line(f"{scenario}: {metrics}")
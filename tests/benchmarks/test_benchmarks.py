@@ -0,0 +1,92 @@
+"""Benchmarks of CHAMP with synthetic households."""
+
+import statistics
+import time
+import tracemalloc
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+# Platforms are imported up front, so imports are not measured
+from custom_components.champ import sensor, switch  # noqa: F401
+from custom_components.champ.const import DOMAIN
+
+pytestmark = pytest.mark.benchmark
+
+# (members, tasks) of the benchmarked households
+HOUSEHOLDS = [(1, 1), (3, 20), (10, 200)]
+
+AWARDS = 100
+
+
+def _scenario(members: int, tasks: int) -> str:
+    """Return the baseline key of a household."""
+    return f"{members}x{tasks}"
+
+
+@pytest.mark.parametrize(("members", "tasks"), HOUSEHOLDS)
+async def test_setup_and_awards(
+    hass: HomeAssistant, household, baselines, members, tasks
+):
+    """Measure entry setup and the award path."""
+    entry = household(members, tasks)
+    entry.add_to_hass(hass)
+
+    start = time.perf_counter()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    setup_time = time.perf_counter() - start
+
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    member_ids = list(coordinator.data["members"])
+
+    # Round robin in ID order, so the leaderboard order never changes and
+    # only the member entities are written
+    writes_before = coordinator.state_writes
+    latencies = []
+    for index in range(AWARDS):
+        start = time.perf_counter()
+        await coordinator.award_points(member_ids[index % members], 1)
+        latencies.append(time.perf_counter() - start)
+    await hass.async_block_till_done()
+
+    latencies.sort()
+    baselines.check(
+        _scenario(members, tasks),
+        {
+            "setup_s": setup_time,
+            "entities": len(entities),
+            "award_mean_ms": 1000 * statistics.fmean(latencies),
+            "award_p95_ms": 1000 * latencies[int(0.95 * len(latencies))],
+            "state_writes_per_award": (coordinator.state_writes - writes_before)
+            / AWARDS,
+        },
+    )
+
+
+@pytest.mark.parametrize(("members", "tasks"), HOUSEHOLDS)
+async def test_memory_per_member(
+    hass: HomeAssistant, household, baselines, members, tasks
+):
+    """Measure the memory allocated by entry setup per member."""
+    # Set up the integration first, so its loading is not counted
+    assert await async_setup_component(hass, DOMAIN, {})
+    entry = household(members, tasks)
+    entry.add_to_hass(hass)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    baselines.check(
+        _scenario(members, tasks),
+        {"memory_per_member_kib": allocated / members / 1024},
+    )
@@ -30,6 +30,30 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+def pytest_addoption(parser):
+    """Add the benchmark options."""
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Run the benchmarks in tests/benchmarks",
+    )
+    parser.addoption(
+        "--update-baselines",
+        action="store_true",
+        help="Store benchmark results as the new baselines",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless requested."""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="Benchmarks need --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 # This fixture is provided by pytest-homeassistant-custom-component
 # and enables loading custom integrations
 @pytest.fixture(autouse=True)
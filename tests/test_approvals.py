@@ -0,0 +1,127 @@
+"""Test the CHAMP approval queue."""
+
+import pytest
+import voluptuous as vol
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.champ.approvals import APPROVAL_TASK, ApprovalQueue
+from custom_components.champ.const import (
+    ATTR_ALL,
+    ATTR_MEMBER_ID,
+    CONF_REWARDS,
+    CONF_TASKS,
+    DOMAIN,
+    SERVICE_APPROVE,
+)
+
+APPROVAL_SENSOR = "sensor.champ_pending_approvals"
+
+
+def _item(item_id: str, member_id: str) -> dict:
+    """Return a pending task completion."""
+    return {
+        "id": item_id,
+        "kind": APPROVAL_TASK,
+        "member": member_id,
+        "points": 5,
+        "task": "test_task",
+    }
+
+
+def test_queue_indexes_and_bound():
+    """Test selection by member and ID and the size bound."""
+    queue = ApprovalQueue(3)
+    assert queue.add(_item("a", "m1"))
+    assert queue.add(_item("b", "m2"))
+    assert queue.add(_item("c", "m1"))
+    assert not queue.add(_item("d", "m1"))
+
+    assert queue.select(member_id="m1") == ["a", "c"]
+    assert queue.select(["c", "b"]) == ["b", "c"]
+    assert queue.select(["b"], member_id="m1") == []
+    assert queue.counts() == {"m1": 2, "m2": 1}
+
+    queue.pop("b")
+    assert queue.counts() == {"m1": 2}
+    assert [item["id"] for item in queue.oldest(1)] == ["a"]
+
+
+async def _require_approval(hass: HomeAssistant, entry) -> None:
+    """Make the test task and a reward require approval."""
+    hass.config_entries.async_update_entry(
+        entry,
+        data={
+            **entry.data,
+            CONF_TASKS: [
+                {**task, "approval_required": True} for task in entry.data[CONF_TASKS]
+            ],
+            CONF_REWARDS: [
+                {"id": "movie", "name": "Movie", "cost": 10, "approval_required": True}
+            ],
+        },
+    )
+    await hass.async_block_till_done()
+
+
+async def test_completion_waits_for_approval(hass: HomeAssistant, setup_integration):
+    """Test that only approval books the points of a completion."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    await _require_approval(hass, setup_integration)
+
+    assert await coordinator.complete_task("test_member_1", "test_task")
+    assert coordinator.get_member_points("test_member_1") == 0
+    assert hass.states.get(APPROVAL_SENSOR).state == "1"
+
+    assert await coordinator.approve_pending(member_id="test_member_1") == 1
+    assert coordinator.get_member_points("test_member_1") == 5
+    assert hass.states.get(APPROVAL_SENSOR).state == "0"
+
+
+async def test_bulk_approve_is_one_mutation(hass: HomeAssistant, setup_integration):
+    """Test that approving a backlog saves and updates once."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    await _require_approval(hass, setup_integration)
+    await coordinator.award_batch(
+        [{"member_id": "test_member_1", "task_id": "test_task"}] * 100
+    )
+    assert len(coordinator.approvals) == 100
+
+    writes_before = coordinator.state_writes
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_APPROVE,
+        {ATTR_ALL: True},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {"count": 100}
+    assert coordinator.get_member_points("test_member_1") == 500
+    # Seven member sensors and the queue sensor
+    assert coordinator.state_writes - writes_before == 8
+
+
+async def test_rejected_redemption_is_refunded(hass: HomeAssistant, setup_integration):
+    """Test that rejecting a redemption refunds the reserved points."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    await _require_approval(hass, setup_integration)
+    await coordinator.award_points("test_member_1", 10)
+
+    record = await coordinator.redeem_reward("test_member_1", "movie")
+    assert coordinator.get_member_points("test_member_1") == 0
+
+    assert await coordinator.reject_pending() == 1
+    assert coordinator.get_member_points("test_member_1") == 10
+    assert record["status"] == "rejected"
+
+
+async def test_approve_requires_selection(hass: HomeAssistant, setup_integration):
+    """Test that approving needs an explicit selection."""
+    with pytest.raises((vol.Invalid, HomeAssistantError)):
+        await hass.services.async_call(DOMAIN, SERVICE_APPROVE, {}, blocking=True)
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_APPROVE, {ATTR_MEMBER_ID: "unknown"}, blocking=True
+        )
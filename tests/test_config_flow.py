@@ -0,0 +1,123 @@
+"""Test the CHAMP options flow."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.champ.const import (
+    CONF_COMPLETION_DEBOUNCE,
+    CONF_MEMBER_ID,
+    CONF_MEMBER_NAME,
+    CONF_MEMBERS,
+    CONF_NOTIFICATION_WINDOW,
+    CONF_RECONCILE_INTERVAL,
+    CONF_TASK_ASSIGNED_TO,
+    CONF_TASK_ID,
+    CONF_TASKS,
+    DOMAIN,
+)
+
+
+async def _start(hass: HomeAssistant, entry, step: str):
+    """Open the options flow and pick a menu entry."""
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == FlowResultType.MENU
+    return await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": step}
+    )
+
+
+async def test_add_member(hass: HomeAssistant, setup_integration):
+    """Test that an added member gets entities without a reload."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    result = await _start(hass, setup_integration, "add_member")
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_MEMBER_NAME: "Second Member"}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert len(setup_integration.data[CONF_MEMBERS]) == 2
+    assert hass.data[DOMAIN][setup_integration.entry_id] is coordinator
+    member_id = setup_integration.data[CONF_MEMBERS][1][CONF_MEMBER_ID]
+    assert hass.states.get(f"sensor.champ_{member_id}_points") is not None
+
+
+async def test_edit_task(hass: HomeAssistant, setup_integration):
+    """Test that editing a task updates its points."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    result = await _start(hass, setup_integration, "edit_task")
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_TASK_ID: "test_task"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"name": "Test Task", "points": 10, "assigned_to": ["all"]}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert setup_integration.data[CONF_TASKS][0]["points"] == 10
+    assert coordinator.get_task("test_task")["points"] == 10
+
+
+async def test_remove_last_member_rejected(hass: HomeAssistant, setup_integration):
+    """Test that the last member cannot be removed."""
+    result = await _start(hass, setup_integration, "remove_member")
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_MEMBERS: ["test_member_1"]}
+    )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "member_required"}
+
+
+async def test_settings(hass: HomeAssistant, setup_integration):
+    """Test that runtime settings are stored in the options."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    result = await _start(hass, setup_integration, "settings")
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_COMPLETION_DEBOUNCE: 5,
+            CONF_NOTIFICATION_WINDOW: 10,
+            CONF_RECONCILE_INTERVAL: 0,
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert setup_integration.options[CONF_NOTIFICATION_WINDOW] == 10
+    assert coordinator.notifier.window == 10
+
+
+async def test_remove_member_leaving_task_unassigned(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that a member cannot be removed while a task only has them."""
+    hass.config_entries.async_update_entry(
+        setup_integration,
+        data={
+            **setup_integration.data,
+            CONF_MEMBERS: [
+                *setup_integration.data[CONF_MEMBERS],
+                {CONF_MEMBER_ID: "second_member", CONF_MEMBER_NAME: "Second"},
+            ],
+            CONF_TASKS: [
+                {**task, CONF_TASK_ASSIGNED_TO: ["test_member_1"]}
+                for task in setup_integration.data[CONF_TASKS]
+            ],
+        },
+    )
+    await hass.async_block_till_done()
+
+    result = await _start(hass, setup_integration, "remove_member")
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_MEMBERS: ["test_member_1"]}
+    )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "task_unassigned"}
+    assert result["description_placeholders"] == {"tasks": "Test Task"}
+    assert len(setup_integration.data[CONF_MEMBERS]) == 2
@@ -0,0 +1,222 @@
+"""Test the CHAMP data coordinator."""
+
+import asyncio
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.champ.const import DOMAIN
+
+
+async def test_award_points_updates_member_entities_only(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that awarding points only writes the member's sensors."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    writes_before = coordinator.state_writes
+
+    await coordinator.award_points("test_member_1", 5)
+    await hass.async_block_till_done()
+
+    # Points, level, points to next level, streak and the three period points
+    # sensors - no task switches
+    assert coordinator.state_writes - writes_before == 7
+    assert hass.states.get("sensor.champ_test_member_1_points").state == "5"
+    assert (
+        hass.states.get("sensor.champ_test_member_1_points_to_next_level").state == "45"
+    )
+
+
+async def test_reset_points(hass: HomeAssistant, setup_integration):
+    """Test resetting points of a member."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await coordinator.award_points("test_member_1", 60)
+    await coordinator.reset_points("test_member_1")
+    await hass.async_block_till_done()
+
+    assert coordinator.get_member_points("test_member_1") == 0
+    assert hass.states.get("sensor.champ_test_member_1_level").state == "0"
+
+
+async def test_points_persist_across_reload(hass: HomeAssistant, setup_integration):
+    """Test that a burst of awards is written once and restored on reload."""
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    for _ in range(10):
+        await coordinator.award_points("test_member_1", 5)
+
+    assert coordinator.storage.flush_count == 0
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert coordinator.storage.flush_count == 1
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.get_member_points("test_member_1") == 50
+    assert coordinator.get_member_level("test_member_1") == 1
+
+
+async def test_concurrent_commands_are_committed_together(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that queued commands are applied in one batch."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    await coordinator.award_points("test_member_1", 1)
+    writes_before = coordinator.state_writes
+    batches_before = coordinator.commands.batches
+
+    results = await asyncio.gather(
+        *(coordinator.award_points("test_member_1", 1) for _ in range(10)),
+        coordinator.redeem_reward("test_member_1", "unknown"),
+        return_exceptions=True,
+    )
+
+    # The failing redemption only fails its own caller
+    assert results[:10] == [None] * 10
+    assert isinstance(results[10], HomeAssistantError)
+
+    # One commit writes the member's sensors once for all awards
+    assert coordinator.commands.batches == batches_before + 1
+    assert coordinator.state_writes - writes_before == 7
+    assert coordinator.get_member_points("test_member_1") == 11
+    assert len(coordinator.commands) == 0
+
+
+async def test_completion_notifications_are_batched(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that a burst of completions results in one notification."""
+    assert await async_setup_component(hass, "persistent_notification", {})
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    for _ in range(20):
+        await coordinator.award_batch(
+            [{"member_id": "test_member_1", "task_id": "test_task"}]
+        )
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+
+    assert coordinator.notifier.sent_count == 1
+
+
+async def test_unload_survives_failing_notification(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that unloading writes changes although notifications fail."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    await coordinator.complete_task("test_member_1", "test_task")
+    assert coordinator.notifier.pending == 1
+
+    # persistent_notification is not set up, so the summary cannot be sent
+    assert await hass.config_entries.async_unload(setup_integration.entry_id)
+    await hass.async_block_till_done()
+
+    assert coordinator.storage.flush_count == 1
+    assert coordinator.notifier.pending == 0
+    assert coordinator.notifier.sent_count == 0
+
+
+async def test_removed_member_drops_pending_notification(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that a removed member's queued summary is not sent."""
+    assert await async_setup_component(hass, "persistent_notification", {})
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    data = {
+        **entry.data,
+        "members": [
+            *entry.data["members"],
+            {"member_id": "test_member_2", "member_name": "Second Member"},
+        ],
+    }
+    hass.config_entries.async_update_entry(entry, data=data)
+    await hass.async_block_till_done()
+
+    await coordinator.complete_task("test_member_2", "test_task")
+    assert coordinator.notifier.pending == 1
+
+    data = {**data, "members": data["members"][:1]}
+    hass.config_entries.async_update_entry(entry, data=data)
+    await hass.async_block_till_done()
+    assert coordinator.notifier.pending == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+
+    assert coordinator.notifier.sent_count == 0
+
+
+async def test_member_attributes(hass: HomeAssistant, setup_integration):
+    """Test that birthdate and age are exposed on all member sensors."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    attributes = coordinator.get_member_attributes("test_member_1")
+
+    assert attributes["birthdate"] == "2015-01-15"
+    assert isinstance(attributes["age"], int)
+
+    for suffix in ("points", "level", "points_to_next_level"):
+        state = hass.states.get(f"sensor.champ_test_member_1_{suffix}")
+        assert state.attributes["age"] == attributes["age"]
+
+
+async def test_task_indexes(hass: HomeAssistant, setup_integration):
+    """Test task lookups by ID and by member."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    assert coordinator.get_task("test_task")["name"] == "Test Task"
+    assert coordinator.get_task("unknown") is None
+    assert [task["id"] for task in coordinator.get_member_tasks("test_member_1")] == [
+        "test_task"
+    ]
+    assert coordinator.is_task_assigned("test_task", "test_member_1")
+    assert not coordinator.is_task_assigned("test_task", "unknown_member")
+
+
+async def test_config_change_is_applied_in_place(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that editing members and tasks keeps points and other entities."""
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.award_points("test_member_1", 20)
+
+    data = dict(entry.data)
+    data["members"] = [
+        *entry.data["members"],
+        {"member_id": "test_member_2", "member_name": "Second Member"},
+    ]
+    data["tasks"] = [
+        {**entry.data["tasks"][0], "points": 8},
+        {"id": "new_task", "name": "New Task", "points": 3, "assigned_to": ["all"]},
+    ]
+    hass.config_entries.async_update_entry(entry, data=data)
+    await hass.async_block_till_done()
+
+    # Same coordinator, points kept
+    assert hass.data[DOMAIN][entry.entry_id] is coordinator
+    assert coordinator.get_member_points("test_member_1") == 20
+
+    # Changed task updated in place, new entities added
+    assert (
+        hass.states.get("switch.champ_test_member_1_test_task").attributes["points"]
+        == 8
+    )
+    assert hass.states.get("switch.champ_test_member_1_new_task")
+    assert hass.states.get("switch.champ_test_member_2_new_task")
+    assert hass.states.get("sensor.champ_test_member_2_points").state == "0"
+
+    # Removing a task removes only its switches
+    data = {**data, "tasks": data["tasks"][:1]}
+    hass.config_entries.async_update_entry(entry, data=data)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("switch.champ_test_member_1_new_task") is None
+    assert hass.states.get("switch.champ_test_member_1_test_task")
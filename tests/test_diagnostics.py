@@ -0,0 +1,36 @@
+"""Test the CHAMP diagnostics."""
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+
+from custom_components.champ.const import CONF_MEMBER_NAME, CONF_MEMBERS, DOMAIN
+from custom_components.champ.diagnostics import async_get_config_entry_diagnostics
+
+
+async def test_diagnostics(hass: HomeAssistant, setup_integration):
+    """Test that diagnostics include counters and sizes without names."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await coordinator.award_points("test_member_1", 5)
+    await coordinator.complete_task("test_member_1", "test_task")
+    await coordinator.reset_points("test_member_1")
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, setup_integration)
+
+    member = diagnostics["entry"]["data"][CONF_MEMBERS][0]
+    assert member[CONF_MEMBER_NAME] == REDACTED
+
+    performance = diagnostics["performance"]
+    assert performance["award"]["count"] == 1
+    assert performance["complete"]["count"] == 1
+    assert performance["reset"]["count"] == 1
+    assert performance["refresh"]["count"] == 1
+    assert performance["state_write"]["count"] == coordinator.state_writes
+    assert performance["award"]["peak_ms"] >= performance["award"]["mean_ms"]
+
+    sizes = diagnostics["sizes"]
+    assert sizes["members"] == 1
+    assert sizes["tasks"] == 1
+    assert sizes["ledger_events"] == 3
+    assert sizes["ledger_buffered"] == 3
@@ -0,0 +1,166 @@
+"""Test the CHAMP history export and import."""
+
+import asyncio
+import gzip
+import json
+import threading
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.champ.const import (
+    ATTR_FILENAME,
+    ATTR_FORMAT,
+    DOMAIN,
+    EXPORT_DIR,
+    EXPORT_FORMAT_COLUMNAR,
+    EXPORT_FORMAT_JSONL,
+    SERVICE_EXPORT_HISTORY,
+    SERVICE_IMPORT_HISTORY,
+)
+from custom_components.champ.ledger import SNAPSHOT_FILE
+
+
+@pytest.mark.parametrize("fmt", [EXPORT_FORMAT_JSONL, EXPORT_FORMAT_COLUMNAR])
+async def test_export_and_import_round_trip(
+    hass: HomeAssistant, setup_integration, tmp_path, fmt
+):
+    """Test that an exported history restores balances and the ledger."""
+    hass.config.config_dir = str(tmp_path)
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await coordinator.complete_task("test_member_1", "test_task")
+    await coordinator.award_points("test_member_1", 3)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        {ATTR_FORMAT: fmt, ATTR_FILENAME: "backup"},
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {
+        "path": str(tmp_path / EXPORT_DIR / "backup"),
+        "events": 2,
+    }
+
+    opener = gzip.open if fmt == EXPORT_FORMAT_COLUMNAR else open
+    with opener(response["path"], "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline())
+        lines = file.readlines()
+    assert header["last_seq"] == 2
+    assert header["balances"] == {"test_member_1": 8}
+    assert len(lines) == (1 if fmt == EXPORT_FORMAT_COLUMNAR else 2)
+
+    await coordinator.reset_points("test_member_1")
+    assert coordinator.get_member_points("test_member_1") == 0
+    batches = coordinator.commands.batches
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_IMPORT_HISTORY,
+        {ATTR_FILENAME: "backup"},
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+
+    assert response == {"events": 2, "members": 1}
+    assert coordinator.commands.batches == batches + 1
+    assert coordinator.get_member_points("test_member_1") == 8
+    assert coordinator.ledger.last_seq == 2
+    assert coordinator.streaks.member("test_member_1").current == 1
+
+    events = await hass.async_add_executor_job(
+        lambda: list(coordinator.ledger.iter_events())
+    )
+    assert [event["seq"] for event in events] == [1, 2]
+
+
+async def test_import_rejects_invalid_history(
+    hass: HomeAssistant, setup_integration, tmp_path
+):
+    """Test that an invalid file changes nothing."""
+    hass.config.config_dir = str(tmp_path)
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await coordinator.award_points("test_member_1", 4)
+    await coordinator.award_points("test_member_1", 6)
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        {ATTR_FILENAME: "backup"},
+        blocking=True,
+    )
+
+    # Swap the two events, so they are out of order
+    path = tmp_path / EXPORT_DIR / "backup"
+    header, first, second = path.read_text(encoding="utf-8").splitlines()
+    path.write_text(f"{header}\n{second}\n{first}\n", encoding="utf-8")
+
+    await coordinator.award_points("test_member_1", 1)
+
+    with pytest.raises(HomeAssistantError, match="out of order"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_IMPORT_HISTORY,
+            {ATTR_FILENAME: "backup"},
+            blocking=True,
+        )
+
+    assert coordinator.get_member_points("test_member_1") == 11
+    assert coordinator.ledger.last_seq == 3
+    assert not coordinator.ledger.staging_path.exists()
+
+
+async def test_import_during_awards(hass: HomeAssistant, setup_integration, tmp_path):
+    """Test that events recorded while an import swaps files follow it."""
+    hass.config.config_dir = str(tmp_path)
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await coordinator.award_points("test_member_1", 4)
+    await coordinator.award_points("test_member_1", 6)
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        {ATTR_FILENAME: "backup"},
+        blocking=True,
+    )
+    await coordinator.award_points("test_member_1", 1)
+    await coordinator.ledger.async_flush()
+
+    # Keep the ledger files busy, so the import has to wait for them
+    release = threading.Event()
+    reading = hass.async_create_task(
+        coordinator.ledger.async_read(lambda events: release.wait(5))
+    )
+    importing = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN,
+            SERVICE_IMPORT_HISTORY,
+            {ATTR_FILENAME: "backup"},
+            blocking=True,
+        )
+    )
+    # Wait until the import is staged and waits for the files
+    staged = coordinator.ledger.staging_path / SNAPSHOT_FILE
+    for _ in range(100):
+        if staged.exists():
+            break
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    assert not importing.done()
+
+    await coordinator.award_points("test_member_1", 5)
+    release.set()
+    await reading
+    await importing
+    await coordinator.ledger.async_flush()
+
+    assert coordinator.get_member_points("test_member_1") == 15
+    events = await hass.async_add_executor_job(
+        lambda: list(coordinator.ledger.iter_events())
+    )
+    assert [event["seq"] for event in events] == [1, 2, 3]
+    assert events[-1]["delta"] == 5
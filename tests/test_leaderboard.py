@@ -0,0 +1,78 @@
+"""Test the CHAMP leaderboard."""
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.champ.const import CONF_MEMBERS, DOMAIN
+from custom_components.champ.leaderboard import Ranking
+
+LEADERBOARD = "sensor.champ_leaderboard"
+
+
+def test_ranking_order_and_ties():
+    """Test that the ranking reports only order changes."""
+    ranking = Ranking()
+    assert ranking.update("a", 0)
+    assert ranking.update("b", 0)
+    assert not ranking.update("a", 0)
+
+    # Ties are ordered by member ID and share a rank
+    assert ranking.members() == ["a", "b"]
+    assert ranking.rank("b") == 1
+
+    assert ranking.update("b", 10)
+    assert ranking.members() == ["b", "a"]
+    assert not ranking.update("b", 20)
+    assert ranking.rank("a") == 2
+
+    assert ranking.remove("b")
+    assert ranking.members() == ["a"]
+    assert not ranking.rebuild({"a": 5})
+    assert ranking.rebuild({"a": 5, "c": 7})
+
+
+async def test_leaderboard_writes_on_reorder(hass: HomeAssistant, setup_integration):
+    """Test that the leaderboard is only written when the order changes."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    hass.config_entries.async_update_entry(
+        setup_integration,
+        data={
+            **setup_integration.data,
+            CONF_MEMBERS: [
+                *setup_integration.data[CONF_MEMBERS],
+                {"member_id": "zz_member_2", "member_name": "Second Member"},
+            ],
+        },
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(LEADERBOARD).state == "Test Member"
+
+    updated = hass.states.get(LEADERBOARD).last_updated
+    await coordinator.award_points("test_member_1", 5)
+    await hass.async_block_till_done()
+    assert hass.states.get(LEADERBOARD).last_updated == updated
+
+    await coordinator.award_points("zz_member_2", 10)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(LEADERBOARD)
+    assert state.state == "Second Member"
+    assert [entry["member_id"] for entry in state.attributes["total"]] == [
+        "zz_member_2",
+        "test_member_1",
+    ]
+    assert state.attributes["today"][0]["points"] == 10
+
+
+async def test_leaderboard_per_entry(hass: HomeAssistant, setup_integration):
+    """Test that a second entry gets its own household sensors."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, title="CHAMP Second", data=setup_integration.data
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(LEADERBOARD) is not None
+    assert hass.states.get(f"{LEADERBOARD}_2") is not None
+    assert hass.states.get("sensor.champ_pending_approvals_2") is not None
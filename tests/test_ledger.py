@@ -0,0 +1,120 @@
+"""Test the CHAMP transaction log."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.champ.const import DOMAIN
+from custom_components.champ.ledger import (
+    EVENT_COMPLETE,
+    EVENT_RESET,
+    SNAPSHOT_FILE,
+    ChampLedger,
+    archive_name,
+)
+
+
+async def test_events_are_recorded(hass: HomeAssistant, setup_integration):
+    """Test that awards, completions and resets are logged."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await coordinator.award_points("test_member_1", 5, "test_task")
+    await coordinator.reset_points("test_member_1")
+    await coordinator.ledger.async_flush()
+
+    events = await hass.async_add_executor_job(
+        lambda: list(coordinator.ledger.iter_events())
+    )
+    assert [event["type"] for event in events] == [EVENT_COMPLETE, EVENT_RESET]
+    assert events[0]["task"] == "test_task"
+    assert events[1]["delta"] == -5
+
+
+async def test_snapshot_compacts_segments(hass: HomeAssistant):
+    """Test that a snapshot archives old segments and limits replay."""
+    ledger = ChampLedger(hass, "test_entry")
+    balances = {"member": 0}
+    ledger.async_set_balances_func(lambda: balances)
+
+    with (
+        patch("custom_components.champ.ledger.LEDGER_SEGMENT_SIZE", 2),
+        patch("custom_components.champ.ledger.LEDGER_SNAPSHOT_INTERVAL", 5),
+    ):
+        for _ in range(5):
+            ledger.async_append("award", "member", 1)
+            balances["member"] += 1
+        await ledger.async_flush()
+
+        ledger.async_append("award", "member", 1)
+        await ledger.async_flush()
+
+    reloaded = ChampLedger(hass, "test_entry")
+    snapshot, tail = await reloaded.async_load()
+
+    assert snapshot == {"seq": 5, "balances": {"member": 5}}
+    assert [event["seq"] for event in tail] == [6]
+    assert reloaded.last_seq == 6
+
+    await reloaded.async_remove()
+
+
+async def test_interrupted_compaction_is_finished_once(hass: HomeAssistant):
+    """Test that segments archived before a crash are not archived twice."""
+    ledger = ChampLedger(hass, "test_entry")
+    balances = {"member": 0}
+    ledger.async_set_balances_func(lambda: balances)
+
+    with (
+        patch("custom_components.champ.ledger.LEDGER_SEGMENT_SIZE", 2),
+        patch("custom_components.champ.ledger.LEDGER_SNAPSHOT_INTERVAL", 5),
+        # Crash after the archive was written, before the segments are removed
+        patch.object(Path, "unlink"),
+    ):
+        for _ in range(5):
+            ledger.async_append("award", "member", 1)
+            balances["member"] += 1
+        await ledger.async_flush()
+
+    reloaded = ChampLedger(hass, "test_entry")
+    snapshot, tail = await reloaded.async_load()
+    assert snapshot == {"seq": 5, "balances": {"member": 5}}
+    assert tail == []
+
+    events = await hass.async_add_executor_job(lambda: list(reloaded.iter_events()))
+    assert [event["seq"] for event in events] == [1, 2, 3, 4, 5]
+
+    await reloaded.async_remove()
+
+
+async def test_compaction_writes_new_archive(hass: HomeAssistant):
+    """Test that each compaction adds an archive and leaves older ones alone."""
+    ledger = ChampLedger(hass, "test_entry")
+    balances = {"member": 0}
+    ledger.async_set_balances_func(lambda: balances)
+
+    with (
+        patch("custom_components.champ.ledger.LEDGER_SEGMENT_SIZE", 2),
+        patch("custom_components.champ.ledger.LEDGER_SNAPSHOT_INTERVAL", 3),
+    ):
+        for _ in range(3):
+            ledger.async_append("award", "member", 1)
+        await ledger.async_flush()
+        first = ledger.path / archive_name(1)
+        content = first.read_bytes()
+
+        for _ in range(3):
+            ledger.async_append("award", "member", 1)
+        await ledger.async_flush()
+
+    assert sorted(path.name for path in ledger.path.iterdir()) == [
+        archive_name(1),
+        archive_name(4),
+        SNAPSHOT_FILE,
+    ]
+    assert first.read_bytes() == content
+
+    events = await hass.async_add_executor_job(lambda: list(ledger.iter_events()))
+    assert [event["seq"] for event in events] == [1, 2, 3, 4, 5, 6]
+
+    await ledger.async_remove()
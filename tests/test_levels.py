@@ -0,0 +1,94 @@
+"""Test CHAMP level progression."""
+
+from custom_components.champ.const import (
+    CONF_LEVEL_CURVE,
+    CONF_LEVEL_GROWTH,
+    CONF_LEVEL_THRESHOLDS,
+    CONF_MAX_LEVEL,
+    CONF_POINTS_PER_LEVEL,
+    LEVEL_CURVE_EXPONENTIAL,
+    LEVEL_CURVE_QUADRATIC,
+    LEVEL_CURVE_THRESHOLDS,
+)
+from custom_components.champ.levels import LevelTable
+
+
+def test_linear_matches_points_per_level():
+    """Test the default curve levels up every points_per_level points."""
+    table = LevelTable({CONF_POINTS_PER_LEVEL: 50})
+
+    for points in (0, 49, 50, 99, 100, 1234):
+        assert table.level(points) == points // 50
+        assert table.points_to_next_level(points) == 50 - points % 50
+
+
+def test_quadratic_with_max_level():
+    """Test a quadratic curve capped at a maximum level."""
+    table = LevelTable(
+        {
+            CONF_LEVEL_CURVE: LEVEL_CURVE_QUADRATIC,
+            CONF_POINTS_PER_LEVEL: 50,
+            CONF_MAX_LEVEL: 3,
+        }
+    )
+
+    assert table.level(199) == 1
+    assert table.points_to_next_level(199) == 1
+    assert table.level(200) == 2
+    assert table.level(10000) == 3
+    assert table.points_to_next_level(10000) == 0
+
+
+def test_explicit_thresholds():
+    """Test a curve with explicit thresholds."""
+    table = LevelTable(
+        {
+            CONF_LEVEL_CURVE: LEVEL_CURVE_THRESHOLDS,
+            CONF_LEVEL_THRESHOLDS: [30, 100, 300],
+        }
+    )
+
+    assert table.level(29) == 0
+    assert table.level(30) == 1
+    assert table.points_to_next_level(100) == 200
+    assert table.level(5000) == 3
+    assert table.max_level == 3
+
+
+def test_explicit_thresholds_with_max_level():
+    """Test that a maximum level drops the thresholds above it."""
+    table = LevelTable(
+        {
+            CONF_LEVEL_CURVE: LEVEL_CURVE_THRESHOLDS,
+            CONF_LEVEL_THRESHOLDS: [30, 100, 300],
+            CONF_MAX_LEVEL: 1,
+        }
+    )
+
+    assert table.level(99) == 1
+    assert table.level(5000) == 1
+    assert table.points_to_next_level(5000) == 0
+    assert table.thresholds == [0, 30]
+
+
+def test_formula_curves_match_thresholds():
+    """Test that formula curves agree with their thresholds at any balance."""
+    for config in (
+        {CONF_POINTS_PER_LEVEL: 50},
+        {CONF_LEVEL_CURVE: LEVEL_CURVE_QUADRATIC, CONF_POINTS_PER_LEVEL: 50},
+        {
+            CONF_LEVEL_CURVE: LEVEL_CURVE_EXPONENTIAL,
+            CONF_POINTS_PER_LEVEL: 10,
+            CONF_LEVEL_GROWTH: 1.05,
+        },
+    ):
+        table = LevelTable(config)
+        for points in (*range(0, 5000, 7), 10**9):
+            level = table.level(points)
+            assert table.threshold(level) <= points < table.threshold(level + 1)
+            assert table.points_to_next_level(points) == (
+                table.threshold(level + 1) - points
+            )
+
+        # Large balances are computed without building a table
+        assert table.thresholds == [0]
@@ -0,0 +1,84 @@
+"""Test the CHAMP profiling service."""
+
+import asyncio
+import pstats
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import async_setup_component
+
+from custom_components.champ.const import (
+    ATTR_DURATION,
+    ATTR_TOP,
+    DOMAIN,
+    SERVICE_PROFILE,
+)
+from custom_components.champ.profiler import PROFILER
+
+
+def _unrelated() -> None:
+    """Stand in for code of another task."""
+
+
+async def test_profile(hass: HomeAssistant, setup_integration, tmp_path):
+    """Test that only CHAMP sections are profiled and the stats are stored."""
+    assert await async_setup_component(hass, "persistent_notification", {})
+    hass.config.config_dir = str(tmp_path)
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    task = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE,
+            {ATTR_DURATION: 1, ATTR_TOP: 5},
+            blocking=True,
+            return_response=True,
+        )
+    )
+    await asyncio.sleep(0)
+    assert PROFILER.active
+
+    with pytest.raises(HomeAssistantError, match="already running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_PROFILE, {ATTR_DURATION: 1}, blocking=True
+        )
+
+    # Runs while the award waits for its command, outside any section
+    hass.loop.call_soon(_unrelated)
+    await coordinator.award_points("test_member_1", 5)
+    await coordinator.complete_task("test_member_1", "test_task")
+
+    response = await task
+    await hass.async_block_till_done()
+    assert not PROFILER.active
+
+    assert response["sections"]["award"] == 1
+    assert response["sections"]["complete"] == 1
+    assert response["sections"]["state_write"] >= 2
+    assert 0 < len(response["top"]) <= 5
+    cumulative = [entry["cumulative_ms"] for entry in response["top"]]
+    assert cumulative == sorted(cumulative, reverse=True)
+
+    assert response["path"].startswith(str(tmp_path))
+    stats = pstats.Stats(response["path"])
+    functions = {func[2] for func in stats.stats}  # type: ignore[attr-defined]
+    assert "award_points" in functions
+    assert "_unrelated" not in functions
+
+
+async def test_profile_idle(hass: HomeAssistant, setup_integration, tmp_path):
+    """Test a session in which no CHAMP code ran."""
+    assert await async_setup_component(hass, "persistent_notification", {})
+    hass.config.config_dir = str(tmp_path)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PROFILE,
+        {ATTR_DURATION: 1},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {"path": None, "sections": {}, "top": []}
+    assert not list(tmp_path.glob("*.prof"))
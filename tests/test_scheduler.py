@@ -0,0 +1,112 @@
+"""Test the CHAMP recurring task scheduler."""
+
+from datetime import datetime, timedelta
+
+from homeassistant.const import SERVICE_TURN_ON, STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.champ.const import (
+    CONF_TASKS,
+    DOMAIN,
+    RECURRENCE_DAILY,
+    RECURRENCE_NONE,
+    RECURRENCE_WEEKLY,
+)
+from custom_components.champ.scheduler import RecurrenceScheduler, next_reset
+
+SWITCH_ENTITY_ID = "switch.champ_test_member_1_test_task"
+
+
+def test_next_reset():
+    """Test the reset times of the recurrences."""
+    # Wednesday afternoon
+    now = dt_util.as_utc(datetime(2025, 1, 8, 15, 0, tzinfo=dt_util.DEFAULT_TIME_ZONE))
+
+    assert next_reset(RECURRENCE_NONE, now) is None
+    assert dt_util.as_local(next_reset(RECURRENCE_DAILY, now)) == datetime(
+        2025, 1, 9, tzinfo=dt_util.DEFAULT_TIME_ZONE
+    )
+    assert dt_util.as_local(next_reset(RECURRENCE_WEEKLY, now)) == datetime(
+        2025, 1, 13, tzinfo=dt_util.DEFAULT_TIME_ZONE
+    )
+
+
+async def test_due_resets_fire_in_one_batch(hass: HomeAssistant):
+    """Test that resets due at the same time cost a single wakeup."""
+    batches: list[list[tuple[str, str]]] = []
+    scheduler = RecurrenceScheduler(hass, batches.append)
+    due = dt_util.utcnow() + timedelta(hours=1)
+
+    for index in range(200):
+        scheduler.async_schedule((f"member_{index % 10}", f"task_{index}"), due)
+    scheduler.async_schedule(("member_0", "later"), due + timedelta(hours=1))
+    scheduler.async_cancel(("member_0", "task_0"))
+
+    async_fire_time_changed(hass, due + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert scheduler.wakeups == 1
+    assert len(batches) == 1
+    assert len(batches[0]) == 199
+    assert scheduler.next_due == due + timedelta(hours=1)
+    scheduler.async_stop()
+
+
+async def test_recurring_switch_stays_on_until_reset(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that a daily task stays done until midnight."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    hass.config_entries.async_update_entry(
+        setup_integration,
+        data={
+            **setup_integration.data,
+            CONF_TASKS: [
+                {**task, "recurrence": RECURRENCE_DAILY}
+                for task in setup_integration.data[CONF_TASKS]
+            ],
+        },
+    )
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        "switch", SERVICE_TURN_ON, {"entity_id": SWITCH_ENTITY_ID}, blocking=True
+    )
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=3))
+    await hass.async_block_till_done()
+
+    assert hass.states.get(SWITCH_ENTITY_ID).state == STATE_ON
+    assert not await coordinator.complete_task("test_member_1", "test_task")
+    assert coordinator.get_member_points("test_member_1") == 5
+
+    async_fire_time_changed(hass, coordinator.scheduler.next_due)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(SWITCH_ENTITY_ID).state == STATE_OFF
+    assert not coordinator.is_task_done("test_member_1", "test_task")
+
+
+async def test_batch_skips_done_recurring_tasks(hass: HomeAssistant, setup_integration):
+    """Test that a batch books a daily task once until its reset."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    hass.config_entries.async_update_entry(
+        setup_integration,
+        data={
+            **setup_integration.data,
+            CONF_TASKS: [
+                {**task, "recurrence": RECURRENCE_DAILY}
+                for task in setup_integration.data[CONF_TASKS]
+            ],
+        },
+    )
+    await hass.async_block_till_done()
+
+    item = {"member_id": "test_member_1", "task_id": "test_task"}
+    await coordinator.award_batch([item, item])
+    assert coordinator.get_member_points("test_member_1") == 5
+
+    await coordinator.award_batch([item, {"member_id": "test_member_1", "points": 2}])
+    assert coordinator.get_member_points("test_member_1") == 7
+    assert coordinator.is_task_done("test_member_1", "test_task")
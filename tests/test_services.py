@@ -0,0 +1,237 @@
+"""Test CHAMP services."""
+
+import asyncio
+
+import pytest
+import voluptuous as vol
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.champ.const import (
+    ATTR_IDEMPOTENCY_KEY,
+    ATTR_ITEMS,
+    ATTR_MEMBER_ID,
+    ATTR_POINTS,
+    ATTR_REWARD_ID,
+    ATTR_TASK_ID,
+    CONF_MEMBER_ID,
+    CONF_MEMBER_NAME,
+    CONF_MEMBERS,
+    CONF_REWARDS,
+    DOMAIN,
+    SERVICE_AWARD_BATCH,
+    SERVICE_AWARD_POINTS,
+    SERVICE_COMPLETE_TASK,
+    SERVICE_REDEEM_REWARD,
+    SERVICE_RESET_POINTS,
+)
+
+ICE_CREAM = {
+    "id": "ice_cream",
+    "name": "Ice Cream",
+    "description": "",
+    "cost": 20,
+    "approval_required": False,
+}
+
+
+async def test_award_and_reset_points(hass: HomeAssistant, setup_integration):
+    """Test the award and reset services."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_AWARD_POINTS,
+        {ATTR_MEMBER_ID: "test_member_1", ATTR_POINTS: 12},
+        blocking=True,
+    )
+    assert coordinator.get_member_points("test_member_1") == 12
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_RESET_POINTS,
+        {ATTR_MEMBER_ID: "test_member_1"},
+        blocking=True,
+    )
+    assert coordinator.get_member_points("test_member_1") == 0
+
+
+async def test_award_points_limit(hass: HomeAssistant, setup_integration):
+    """Test that awards beyond the service limit are rejected."""
+    for service, data in (
+        (SERVICE_AWARD_POINTS, {ATTR_MEMBER_ID: "test_member_1", ATTR_POINTS: 10**9}),
+        (
+            SERVICE_AWARD_BATCH,
+            {ATTR_ITEMS: [{ATTR_MEMBER_ID: "test_member_1", ATTR_POINTS: -1001}]},
+        ),
+    ):
+        with pytest.raises(vol.Invalid):
+            await hass.services.async_call(DOMAIN, service, data, blocking=True)
+
+
+async def test_complete_task(hass: HomeAssistant, setup_integration):
+    """Test completing a task awards its points."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_COMPLETE_TASK,
+        {ATTR_MEMBER_ID: "test_member_1", ATTR_TASK_ID: "test_task"},
+        blocking=True,
+    )
+    assert coordinator.get_member_points("test_member_1") == 5
+
+
+async def test_complete_task_rejects_duplicates(hass: HomeAssistant, setup_integration):
+    """Test that repeated completions are only booked once."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    data = {
+        ATTR_MEMBER_ID: "test_member_1",
+        ATTR_TASK_ID: "test_task",
+        ATTR_IDEMPOTENCY_KEY: "button_1",
+    }
+
+    for _ in range(3):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_COMPLETE_TASK, data, blocking=True
+        )
+
+    assert coordinator.get_member_points("test_member_1") == 5
+
+
+async def test_award_batch(hass: HomeAssistant, setup_integration):
+    """Test a batch is applied with a single member update."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    writes_before = coordinator.state_writes
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_AWARD_BATCH,
+        {
+            ATTR_ITEMS: [
+                {ATTR_MEMBER_ID: "test_member_1", ATTR_TASK_ID: "test_task"}
+                for _ in range(30)
+            ]
+            + [{ATTR_MEMBER_ID: "test_member_1", ATTR_POINTS: 3}]
+        },
+        blocking=True,
+    )
+
+    assert coordinator.get_member_points("test_member_1") == 153
+    assert coordinator.state_writes - writes_before == 7
+
+
+async def test_award_batch_is_atomic(hass: HomeAssistant, setup_integration):
+    """Test that an invalid item rejects the whole batch."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_AWARD_BATCH,
+            {
+                ATTR_ITEMS: [
+                    {ATTR_MEMBER_ID: "test_member_1", ATTR_POINTS: 3},
+                    {ATTR_MEMBER_ID: "test_member_1", ATTR_TASK_ID: "unknown"},
+                ]
+            },
+            blocking=True,
+        )
+
+    assert coordinator.get_member_points("test_member_1") == 0
+
+
+async def test_award_batch_is_atomic_across_entries(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that an invalid item in one entry rejects the items of all entries."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            **setup_integration.data,
+            CONF_MEMBERS: [{CONF_MEMBER_ID: "other_member", CONF_MEMBER_NAME: "Other"}],
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    other = hass.data[DOMAIN][entry.entry_id]
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_AWARD_BATCH,
+            {
+                ATTR_ITEMS: [
+                    {ATTR_MEMBER_ID: "test_member_1", ATTR_POINTS: 3},
+                    {ATTR_MEMBER_ID: "other_member", ATTR_TASK_ID: "unknown"},
+                ]
+            },
+            blocking=True,
+        )
+
+    assert coordinator.get_member_points("test_member_1") == 0
+    assert other.get_member_points("other_member") == 0
+
+
+async def _add_reward(hass: HomeAssistant, entry, reward: dict) -> None:
+    """Add a reward to the catalog of a set up entry."""
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_REWARDS: [reward]}
+    )
+    await hass.async_block_till_done()
+
+
+async def test_redeem_reward(hass: HomeAssistant, setup_integration):
+    """Test that redeeming a reward deducts its cost and records it."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    await _add_reward(hass, setup_integration, ICE_CREAM)
+    await coordinator.award_points("test_member_1", 25)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REDEEM_REWARD,
+        {ATTR_MEMBER_ID: "test_member_1", ATTR_REWARD_ID: "ice_cream"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["status"] == "fulfilled"
+    assert response["cost"] == 20
+    assert coordinator.get_member_points("test_member_1") == 5
+    assert coordinator.get_redemptions("test_member_1") == [response]
+
+    with pytest.raises(HomeAssistantError):
+        await coordinator.redeem_reward("test_member_1", "ice_cream")
+    assert coordinator.get_member_points("test_member_1") == 5
+
+
+async def test_concurrent_redemptions_cannot_overspend(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that concurrent redemptions only spend the balance once."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    await _add_reward(hass, setup_integration, ICE_CREAM)
+    await coordinator.award_points("test_member_1", 30)
+
+    results = await asyncio.gather(
+        *(coordinator.redeem_reward("test_member_1", "ice_cream") for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(result, dict) for result in results) == 1
+    assert coordinator.get_member_points("test_member_1") == 10
+
+
+async def test_redeem_reward_requiring_approval(hass: HomeAssistant, setup_integration):
+    """Test that rewards requiring approval are recorded as pending."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    await _add_reward(hass, setup_integration, {**ICE_CREAM, "approval_required": True})
+    await coordinator.award_points("test_member_1", 20)
+
+    record = await coordinator.redeem_reward("test_member_1", "ice_cream")
+
+    assert record["status"] == "pending"
+    assert coordinator.get_member_points("test_member_1") == 0
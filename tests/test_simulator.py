@@ -0,0 +1,15 @@
+"""Test the household simulator."""
+
+from simulate_champ import parse_args, simulate
+
+
+async def test_simulate_days():
+    """Test that the simulator replays a few days of activity."""
+    report = await simulate(
+        parse_args(["--members", "2", "--tasks", "5", "--days", "3", "--seed", "1"])
+    )
+
+    assert report["days"] == 3
+    assert report["mutations"] > 0
+    assert report["ledger_events"] > 0
+    assert report["notifications_sent"] > 0
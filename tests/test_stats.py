@@ -0,0 +1,60 @@
+"""Test CHAMP rolling statistics."""
+
+from datetime import date
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.champ.const import (
+    DOMAIN,
+    STATS_PERIOD_MONTH,
+    STATS_PERIOD_TODAY,
+    STATS_PERIOD_WEEK,
+)
+from custom_components.champ.stats import StatsTracker
+
+
+def test_buckets_roll_up_and_expire():
+    """Test that awards count towards day, week and month and expire."""
+    tracker = StatsTracker()
+    # Wednesday and Thursday of the same week
+    tracker.record("m1", date(2025, 1, 8), 5, "dishes", "chores")
+    tracker.record("m1", date(2025, 1, 9), 10, "reading", "learning")
+    tracker.record("m1", date(2025, 1, 9), 3)
+
+    today = tracker.get("m1", STATS_PERIOD_TODAY, date(2025, 1, 9))
+    assert today.points == 13
+    assert today.completions == 1
+    assert today.categories == {"learning": 1}
+
+    week = tracker.get("m1", STATS_PERIOD_WEEK, date(2025, 1, 9))
+    assert week.points == 18
+    assert week.tasks == {"dishes": 1, "reading": 1}
+    assert tracker.get("m1", STATS_PERIOD_MONTH, date(2025, 1, 31)).points == 18
+
+    # Friday resets the day, Saturday has nothing to reset
+    assert tracker.roll_over(date(2025, 1, 10)) == {"m1"}
+    assert tracker.roll_over(date(2025, 1, 11)) == set()
+
+    # Monday resets the week, but not the month
+    assert tracker.roll_over(date(2025, 1, 13)) == {"m1"}
+    assert tracker.get("m1", STATS_PERIOD_WEEK, date(2025, 1, 13)).points == 0
+    assert tracker.get("m1", STATS_PERIOD_MONTH, date(2025, 1, 13)).points == 18
+
+    # After a year only empty buckets are left
+    tracker.roll_over(date(2026, 2, 1))
+    assert tracker.as_dict() == {"m1": {"today": {}, "week": {}, "month": {}}}
+
+
+async def test_period_sensors(hass: HomeAssistant, setup_integration):
+    """Test that completions show up in the period sensors."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await coordinator.complete_task("test_member_1", "test_task")
+    await coordinator.award_points("test_member_1", -2)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.champ_test_member_1_points_today")
+    assert state.state == "5"
+    assert state.attributes["completions"] == 1
+    assert state.attributes["tasks"] == {"test_task": 1}
+    assert hass.states.get("sensor.champ_test_member_1_points_month").state == "5"
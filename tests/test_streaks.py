@@ -0,0 +1,80 @@
+"""Test CHAMP streak tracking."""
+
+from datetime import date
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.champ.const import DOMAIN, STATS_PERIOD_TODAY
+from custom_components.champ.coordinator import ChampDataCoordinator
+from custom_components.champ.streaks import StreakTracker
+
+
+def test_streaks_count_consecutive_days():
+    """Test that streaks grow on consecutive days and break on gaps."""
+    tracker = StreakTracker()
+    tracker.record("m1", "dishes", date(2025, 1, 1))
+    tracker.record("m1", "dishes", date(2025, 1, 1))
+    tracker.record("m1", "dishes", date(2025, 1, 2))
+    tracker.record("m1", "homework", date(2025, 1, 3))
+
+    assert tracker.member("m1").current == 3
+    assert tracker.tasks("m1")["dishes"].current == 2
+    assert tracker.tasks("m1")["homework"].current == 1
+
+    # The dishes were skipped on January 3rd
+    assert tracker.roll_over(date(2025, 1, 4)) == {"m1"}
+    assert tracker.tasks("m1")["dishes"].current == 0
+    assert tracker.member("m1").current == 3
+
+    # Nothing was done on January 4th
+    assert tracker.roll_over(date(2025, 1, 5)) == {"m1"}
+    assert tracker.member("m1").current == 0
+    assert tracker.member("m1").longest == 3
+    assert tracker.tasks("m1")["homework"].current == 0
+
+
+def test_streaks_round_trip():
+    """Test that streaks survive storage."""
+    tracker = StreakTracker()
+    tracker.record("m1", "dishes", date(2025, 1, 1))
+
+    restored = StreakTracker()
+    restored.load(tracker.as_rows())
+
+    assert restored.member("m1").as_dict() == tracker.member("m1").as_dict()
+    assert restored.tasks("m1")["dishes"].last == date(2025, 1, 1)
+
+
+async def test_streak_sensor(hass: HomeAssistant, setup_integration):
+    """Test that completing a task starts a streak."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await coordinator.complete_task("test_member_1", "test_task")
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.champ_test_member_1_streak")
+    assert state.state == "1"
+    assert state.attributes["tasks"]["test_task"]["current"] == 1
+
+
+async def test_streaks_replay_events_covered_by_newer_snapshot(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that a snapshot newer than the store does not lose streaks."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    with patch("custom_components.champ.ledger.LEDGER_SNAPSHOT_INTERVAL", 1):
+        await coordinator.complete_task("test_member_1", "test_task")
+        await coordinator.ledger.async_flush()
+    assert coordinator.ledger.snapshot_seq == 1
+
+    # Load from disk as after a crash before the delayed store save
+    reloaded = ChampDataCoordinator(hass, setup_integration)
+    await reloaded.async_load()
+
+    assert reloaded.get_member_points("test_member_1") == 5
+    assert reloaded.streaks.member("test_member_1").current == 1
+    assert reloaded.get_member_stats("test_member_1", STATS_PERIOD_TODAY).points == 5
+
+    await reloaded.async_shutdown()
@@ -0,0 +1,31 @@
+"""Test CHAMP task switches."""
+
+from datetime import timedelta
+
+from homeassistant.const import SERVICE_TURN_ON, STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.champ.const import DOMAIN
+
+SWITCH_ENTITY_ID = "switch.champ_test_member_1_test_task"
+
+
+async def test_turn_on_awards_points_and_turns_off(
+    hass: HomeAssistant, setup_integration
+):
+    """Test that completing a task returns immediately and auto turns off."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+
+    await hass.services.async_call(
+        "switch", SERVICE_TURN_ON, {"entity_id": SWITCH_ENTITY_ID}, blocking=True
+    )
+
+    assert coordinator.get_member_points("test_member_1") == 5
+    assert hass.states.get(SWITCH_ENTITY_ID).state == STATE_ON
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=3))
+    await hass.async_block_till_done()
+
+    assert hass.states.get(SWITCH_ENTITY_ID).state == STATE_OFF